@@ -0,0 +1,54 @@
+"""
+Cart reset benchmark: CheckoutPage.reset_cart() (one backend call) against
+the old click-every-'×' UI path, for carts of 1, 10 and 100 items.
+
+Not part of the default run (pytest.ini testpaths = tests). Against the
+stand-in, serve enough products for the 100-item cart:
+
+    GROCERYMATE_APP_BASE_URL=http://127.0.0.1:8765 \\
+    GROCERYMATE_APP_LOCAL_CATALOG_SIZE=120 \\
+    pytest benchmarks/test_cart_reset.py -s
+"""
+
+import time
+
+import pytest
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+
+CART_SIZES = [1, 10, 100]
+
+
+def _fill_cart(api, size: int) -> None:
+    """Put `size` different products in the cart through the backend."""
+    products = api.list_products()
+    if len(products) < size:
+        pytest.skip(f"Catalog has only {len(products)} products; "
+                    f"run the stand-in with local_catalog_size >= {size}")
+    for product in products[:size]:
+        api.add_to_cart(product["id"])
+
+
+@pytest.mark.parametrize("size", CART_SIZES)
+@pytest.mark.parametrize("strategy", ["reset_cart", "ui"])
+def test_cart_reset_speed(driver, config, api, strategy, size, record_property):
+    LoginPage(driver).login(config["email"], config["password"])
+    api.clear_cart()
+    _fill_cart(api, size)
+    checkout_page = CheckoutPage(driver)
+
+    start = time.perf_counter()
+    if strategy == "reset_cart":
+        removed = checkout_page.reset_cart(api)
+    else:
+        removed = checkout_page._clear_cart_via_ui()
+        checkout_page.wait.until(EC.visibility_of_element_located(CheckoutPage._CART_EMPTY_INDICATOR))
+    elapsed = time.perf_counter() - start
+
+    record_property("cart_reset_seconds", round(elapsed, 3))
+    print(f"\n{strategy:<10} {size:>3} item(s): {elapsed:6.2f}s")
+
+    assert removed == size, f"Expected {size} removed items, got {removed}"
+    assert api.get_cart() == [], "Cart not empty after reset"
@@ -0,0 +1,69 @@
+"""
+Browser startup benchmark: cold launch, first navigation and teardown time
+of every Chrome launch profile (utils/launch_profiles.py), each measured
+over a few rounds with fresh browsers outside the pool.
+
+    pytest benchmarks/test_launch_profiles.py -s
+
+Headed profiles need a display (e.g. xvfb-run on Linux CI). The Playwright
+counterpart is playwright_py/benchmarks/test_launch_profiles.py.
+"""
+
+import statistics
+import time
+
+import pytest
+from selenium import webdriver
+
+from utils.launch_profiles import PROFILES, chrome_options
+from utils.settings import BASE_URL
+
+ROUNDS = 3
+
+
+@pytest.fixture(autouse=True)
+def clear_browser_state():
+    """Overrides the pooled-driver reset: these benchmarks launch their own browsers."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def age_gate():
+    """Overrides age-gate seeding: there is no pooled driver to seed."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def dialogs():
+    """Overrides the dialog policy: there is no pooled driver to install it in."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def blocked_resources():
+    """Overrides resource blocking: first navigation is measured with every resource loaded."""
+    yield
+
+
+@pytest.mark.parametrize("profile", list(PROFILES))
+def test_launch_profile_speed(profile, record_property):
+    timings = {"launch": [], "first_navigation": [], "teardown": []}
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        driver = webdriver.Chrome(options=chrome_options(profile))
+        launched = time.perf_counter()
+        try:
+            driver.get(BASE_URL)  # Returns once the load event has fired
+            navigated = time.perf_counter()
+        finally:
+            driver.quit()
+        stopped = time.perf_counter()
+        timings["launch"].append(launched - start)
+        timings["first_navigation"].append(navigated - launched)
+        timings["teardown"].append(stopped - navigated)
+
+    medians = {phase: round(statistics.median(values), 3) for phase, values in timings.items()}
+    for phase, seconds in medians.items():
+        record_property(f"{phase}_seconds", seconds)
+    print(f"\n{profile:<13} launch {medians['launch']:6.2f}s  "
+          f"first navigation {medians['first_navigation']:6.2f}s  teardown {medians['teardown']:6.2f}s")
@@ -1,61 +1,446 @@
 # conftest.py
 
-import configparser
+from functools import partial
+from urllib.parse import urlsplit
+
 import pytest
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException
+
+from pages.checkout_page import CheckoutPage
+from pages.product_page import ProductPage
+from pages.shop_page import ShopPage
+from shared.impact_map import ImpactMap, ImpactPlugin, repo_root
+from standin import StandInServer
+from utils.account_pool import AccountLeaseManager
+from utils.age_gate import AgeGateState
+from utils.api_client import ApiError, GroceryMateApi, make_http_adapter
+from utils.browser_pool import BrowserPool
+from utils.catalog_index import CatalogIndex, CatalogIndexCache, build_catalog_index
+from utils.command_profiler import command_profiler
+from utils.dialog_policy import DialogHandler, apply_prompt_behavior, dialog_handler
+from utils.dom_cache import dom_cache_stats
+from utils.launch_profiles import PROFILES as LAUNCH_PROFILES, chrome_options
+from utils.network_log import enable_performance_logging, network_log
+from utils.page_perf import perf_recorder
+from utils.resource_blocking import apply_blocking, blocking_stats
+from utils.settings import BASE_URL, get_bool, get_float, get_int, get_setting, is_local_base_url
+from utils.wait_metrics import wait_metrics
+
+# Duration history and longest-first scheduling for pytest-xdist runs
+pytest_plugins = ("utils.lpt_scheduler",)
+
+
+def pytest_addoption(parser):
+    """
+    --launch-profile: Chrome switches for every browser of the run (see utils/launch_profiles.py).
+    --impact-base: run only the tests affected by changes since a git ref (see shared/impact_map.py).
+    """
+    parser.addoption(
+        "--launch-profile",
+        choices=list(LAUNCH_PROFILES),
+        default=get_setting("browser", "launch_profile", "headed"),
+        help="Chrome launch profile (default: [browser] launch_profile)",
+    )
+    parser.addoption(
+        "--impact-base",
+        metavar="REF",
+        default=None,
+        help="select tests affected by the changes since git REF (e.g. origin/main)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Record the page-object impact map ([impact] in config.ini) and select
+    tests with --impact-base.
+
+    Start the bundled GroceryMate stand-in (standin/) when [app] base_url
+    points at this machine, so the suite runs offline. Under pytest-xdist only
+    the controller starts it and all workers share the one server.
+    """
+    impact_map = ImpactMap(
+        get_setting("impact", "map_file", ".impact-map.json"),
+        repo_root(config.rootpath),
+        page_dirs=("pages",),
+        test_dirs=("tests",),
+        ignored=tuple(get_setting("impact", "ignore", "").split()),
+    )
+    config.pluginmanager.register(
+        ImpactPlugin(impact_map, config.getoption("--impact-base"), get_bool("impact", "record", True)),
+        "impact-map",
+    )
+
+    config.stand_in = None
+    if hasattr(config, "workerinput"):
+        return
+    if not (is_local_base_url() and get_bool("app", "start_local_server", True)):
+        return
+
+    parts = urlsplit(BASE_URL)
+    config.stand_in = StandInServer(
+        host=parts.hostname,
+        port=parts.port or 80,
+        latency_ms=get_float("app", "local_latency_ms", 0),
+        catalog_size=get_int("app", "local_catalog_size", 12),
+    ).start()
+
+
+def pytest_unconfigure(config):
+    if getattr(config, "stand_in", None):
+        config.stand_in.stop()
+
+
+@pytest.fixture(scope="session")
+def local_app(pytestconfig):
+    """The in-process stand-in server, or None (remote site or xdist worker)."""
+    return pytestconfig.stand_in
+
+
+@pytest.fixture(scope="session")
+def account_pool() -> AccountLeaseManager:
+    """
+    Accounts from [auth] and [accounts] in config.ini, leased exclusively so
+    parallel workers never share a cart or review history.
+    """
+    return AccountLeaseManager.from_settings()
+
+
+@pytest.fixture(scope="function")
+def config(account_pool) -> dict[str, str]:
+    """
+    Credentials for this test: 'username', 'email' and 'password' of an
+    account leased for the duration of the test. Each xdist worker prefers
+    its own account, so with enough accounts no test ever waits.
+    """
+    with account_pool.lease() as account:
+        yield account.as_config()
+
+
+def _launch_chrome(profile: str = "headed") -> webdriver.Chrome:
+    """Start a new Chrome instance with the launch profile's switches (commands profiled)."""
+    options = chrome_options(profile)
+    enable_performance_logging(options)  # Network events for blocked-resource accounting
+    apply_prompt_behavior(options)  # Native dialogs the in-page policy misses never fail a command
+    driver = webdriver.Chrome(options=options)
+    command_profiler.attach(driver)
+    return driver
 
 
 @pytest.fixture(scope="session")
-def config() -> configparser.SectionProxy:
+def browser_pool(pytestconfig) -> BrowserPool:
     """
-    Read configuration (e.g. auth credentials) from config.ini.
-    Expects a [auth] section with 'email' and 'password'.
+    Session-wide pool of warm Chrome instances, configured by the
+    [browser] section of config.ini (pool_size, max_reuse, health_check)
+    and launched with the --launch-profile switches.
     """
-    parser = configparser.ConfigParser()
-    parser.read("config.ini")
-    return parser["auth"]
+    pool = BrowserPool(
+        factory=partial(_launch_chrome, pytestconfig.getoption("--launch-profile")),
+        size=get_int("browser", "pool_size", 1),
+        max_reuse=get_int("browser", "max_reuse", 20),
+        health_check=get_bool("browser", "health_check", True),
+        origins=(BASE_URL, *get_setting("browser", "reset_origins", "").split()),
+    )
+    pool.start()
+    yield pool
+    pool.shutdown()
 
 
 @pytest.fixture(scope="function")
-def driver() -> webdriver.Chrome:
+def driver(browser_pool) -> webdriver.Chrome:
     """
-    Function-scoped WebDriver: a fresh Chrome instance for each test function.
+    Function-scoped WebDriver: a clean, pooled Chrome instance for each test function.
     """
-    options = Options()
-    options.add_argument("--start-maximized")
-    driver_instance = webdriver.Chrome(options=options)
+    driver_instance = browser_pool.acquire()
     yield driver_instance
-    driver_instance.quit()
+    browser_pool.release(driver_instance)
 
 
 @pytest.fixture(autouse=True)
-def clear_browser_state(driver):
+def clear_browser_state(driver, browser_pool):
     """
-    Before each test using `driver`:
-      - Delete all cookies
-      - Attempt to clear localStorage if on a real page
+    After each test using `driver`, reset it for the next test:
+      - Close extra tabs and continue in a fresh one
+      - Delete cookies, cache, localStorage, sessionStorage and IndexedDB
+    A driver that cannot be reset is recycled by the pool on release.
     """
-    driver.delete_all_cookies()
+    yield
+    browser_pool.reset(driver)
 
-    try:
-        driver.execute_script("window.localStorage.clear();")
-    except WebDriverException:
-        # e.g. on about:blank or data: URLs
-        pass
 
-    yield
+@pytest.fixture(scope="session")
+def age_gate_state(browser_pool) -> dict | None:
+    """
+    Cookies / localStorage the age-verification modal writes for a valid
+    DOB ([age_gate] dob), captured once in a pooled browser and cached on
+    disk (see utils/age_gate.py). None when [age_gate] preseed is off.
+    """
+    cache = AgeGateState.from_settings()
+    if cache is None:
+        return None
+
+    def capture() -> dict:
+        driver_instance = browser_pool.acquire()
+        try:
+            return AgeGateState.capture_selenium(driver_instance, get_setting("age_gate", "dob", "08-08-2000"))
+        finally:
+            browser_pool.release(driver_instance)
+
+    return cache.get(capture)
+
+
+@pytest.fixture(autouse=True)
+def age_gate(age_gate_state, driver, clear_browser_state, request) -> None:
+    """
+    Seed the age-gate state into the test's browser before its first
+    navigation, so /store shows product cards without the DOB modal.
+    Tests marked @pytest.mark.age_gate get the real modal.
+    """
+    if age_gate_state and not request.node.get_closest_marker("age_gate"):
+        AgeGateState.apply_selenium(driver, age_gate_state)
+
+
+@pytest.fixture(autouse=True)
+def dialogs(driver, clear_browser_state) -> DialogHandler:
+    """
+    Answer JavaScript dialogs per [dialogs] inside the test's pages the
+    moment they open, and record them: dialogs.since(mark) lists what
+    opened after dialogs.mark() (see utils/dialog_policy.py).
+    """
+    handler = dialog_handler(driver)
+    handler.install()
+    return handler
+
+
+def _blocking_profile(node) -> str:
+    """Profile from the closest @pytest.mark.block_resources("<profile>"), else [blocking] profile."""
+    marker = node.get_closest_marker("block_resources")
+    return marker.args[0] if marker else get_setting("blocking", "profile", "full")
+
+
+@pytest.fixture(autouse=True)
+def blocked_resources(driver, clear_browser_state, request) -> str:
+    """
+    Block images, fonts, analytics and other resources the test doesn't need,
+    per the selected profile (see utils/resource_blocking.py). After the test,
+    the blocked requests and their estimated bytes are recorded for the
+    terminal summary. Requests clear_browser_state so it runs before the reset.
+    """
+    profile = _blocking_profile(request.node)
+    apply_blocking(driver, profile)
+    log = network_log(driver)
+    log.clear()
+    yield profile
+    result = blocking_stats.collect(request.node.nodeid, profile, log)
+    request.node.user_properties.append(("blocked_resources", result))
 
 
 @pytest.fixture(scope="class")
-def class_driver() -> webdriver.Chrome:
+def class_driver(browser_pool, age_gate_state, request) -> webdriver.Chrome:
     """
-    Class-scoped WebDriver: one Chrome instance shared by all methods
-    in any TestClass that requests this fixture.
+    Class-scoped WebDriver: one pooled Chrome instance shared by all methods
+    in any TestClass that requests this fixture. Resources are blocked per
+    the class's block_resources marker (or [blocking] profile); the age gate
+    is pre-seeded unless the class is marked age_gate, and dialogs are
+    answered per [dialogs].
     """
-    options = Options()
-    options.add_argument("--start-maximized")
-    driver_instance = webdriver.Chrome(options=options)
+    driver_instance = browser_pool.acquire()
+    apply_blocking(driver_instance, _blocking_profile(request.node))
+    if age_gate_state and not request.node.get_closest_marker("age_gate"):
+        AgeGateState.apply_selenium(driver_instance, age_gate_state)
+    dialog_handler(driver_instance).install()
     yield driver_instance
-    driver_instance.quit()
+    browser_pool.release(driver_instance)
+
+
+@pytest.fixture(scope="session")
+def http_adapter():
+    """
+    Session-wide keep-alive connection pool for backend API calls.
+    """
+    adapter = make_http_adapter()
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture(scope="function")
+def api(driver, http_adapter) -> GroceryMateApi:
+    """
+    HTTP client bound to the test's browser session, for fast data setup
+    (add to cart, place order, delete review, clear cart) without UI clicks.
+    Log in through the browser first; cookies and token are shared both ways.
+    """
+    client = GroceryMateApi(driver, adapter=http_adapter)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def catalog_index(http_adapter, browser_pool) -> CatalogIndex:
+    """
+    Every product (id -> name, price, discount_price, url), built once per
+    [catalog_index] ttl_minutes from the backend's product list (or one
+    /store load) and shared by all xdist workers through a locked cache
+    file. Tests open products with ProductPage.load(catalog_index.first()["id"]).
+    """
+    api = GroceryMateApi(adapter=http_adapter)
+    try:
+        return CatalogIndexCache.from_settings().get(lambda: build_catalog_index(api, browser_pool))
+    finally:
+        api.close()
+
+
+def _purchase_via_ui(driver, product_id: str, quantity: int) -> None:
+    """Buy `product_id` by clicking through /store and checkout."""
+    shop_page = ShopPage(driver)
+    shop_page.open_store()
+    if shop_page.age_gate_shown():
+        shop_page.handle_age_verification(get_setting("age_gate", "dob", "08-08-2000"))
+    shop_page.add_product_to_cart(product_id, quantity)
+    CheckoutPage(driver).buy()
+
+
+def _delete_review_via_ui(driver, product_id: str) -> None:
+    """Delete the user's review of `product_id` on its page; fails the test if it is still there."""
+    product_page = ProductPage(driver)
+    product_page.load(product_id)
+    product_page.remove_existing_review()
+    if product_page.has_own_review():
+        pytest.fail(f"Could not remove the existing review of product {product_id}: "
+                    "the review form is unavailable", pytrace=False)
+
+
+@pytest.fixture(scope="function")
+def purchased_product(api, driver, config):
+    """
+    Factory fixture: purchased_product(product_id) makes the logged-in user an
+    owner of the product via the backend and removes any review they left, so
+    review tests can start writing immediately. Each backend call that fails
+    (the [api] endpoints are assumptions about the live app) is replaced by
+    its UI counterpart on its own: the purchase by the store and checkout
+    flow, the review deletion by the product page's delete menu. The test
+    fails when the review is still there afterwards. The cart is emptied at
+    teardown, through the UI if the backend call fails.
+    Returns the order, or None when it was placed through the UI.
+    """
+    def _purchase(product_id: str, quantity: int = 1) -> dict | None:
+        try:
+            order = api.purchase(product_id, quantity)
+        except ApiError as e:
+            print(f" Purchase API failed ({e}); buying through the UI.")
+            _purchase_via_ui(driver, product_id, quantity)
+            order = None
+        try:
+            api.delete_my_review(product_id)
+        except ApiError as e:
+            print(f" Review API failed ({e}); deleting the review through the UI.")
+            _delete_review_via_ui(driver, product_id)
+        return order
+
+    yield _purchase
+    try:
+        api.clear_cart()
+    except ApiError as e:
+        print(f" Cart API failed ({e}); clearing through the UI.")
+        CheckoutPage(driver).clear_cart()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute recorded waits, WebDriver commands, page-load captures and DOM cache hits to the running test."""
+    collectors = (wait_metrics, command_profiler, perf_recorder, dom_cache_stats)
+    for collector in collectors:
+        collector.current_test = item.nodeid
+    yield
+    for collector in collectors:
+        collector.current_test = ""
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    After the test body:
+      - attach page-load metrics captured by the page objects to the test
+        result (user_properties, e.g. in JUnit XML) and fail on [perf_budgets]
+        violations
+      - enforce @pytest.mark.max_commands(n): fail the test when setup and
+        test body together sent more than n WebDriver commands
+      - attach the page objects' DOM cache hits and misses
+    """
+    result = yield
+    if item.nodeid in dom_cache_stats.tests:
+        item.user_properties.append(("dom_cache", dict(dom_cache_stats.tests[item.nodeid])))
+    captures = perf_recorder.captures_for(item.nodeid)
+    for capture in captures:
+        item.user_properties.append((f"perf:{capture['page']}", capture["metrics"]))
+    violations = [v for capture in captures for v in capture["violations"]]
+    if violations:
+        pytest.fail("Page-load budget exceeded:\n  " + "\n  ".join(violations), pytrace=False)
+
+    marker = item.get_closest_marker("max_commands")
+    if marker:
+        budget = marker.args[0]
+        used = command_profiler.total(item.nodeid)
+        if used > budget:
+            top = ", ".join(f"{name}={count}" for name, count in command_profiler.counts[item.nodeid].most_common(5))
+            pytest.fail(f"WebDriver command budget exceeded: {used} > {budget} ({top})", pytrace=False)
+    return result
+
+
+def pytest_sessionfinish(session):
+    """Write the wait report and the WebDriver command profile as JSON into test-results/."""
+    if wait_metrics.records:
+        wait_metrics.write("test-results")
+    if command_profiler.counts:
+        command_profiler.write("test-results")
+    if blocking_stats.tests:
+        blocking_stats.sizes.save()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show the longest waits, the chattiest tests, DOM cache use and what resource blocking saved."""
+    if wait_metrics.records:
+        _summarize_waits(terminalreporter)
+    _summarize_commands(terminalreporter)
+    if dom_cache_stats.tests:
+        totals = dom_cache_stats.totals()
+        lookups = totals["hits"] + totals["misses"]
+        terminalreporter.section("dom cache")
+        terminalreporter.write_line(
+            f"{totals['hits']} hit(s), {totals['misses']} miss(es) "
+            f"({totals['hits'] / lookups:.0%} of {lookups} page-object reads served without re-querying)"
+        )
+    if blocking_stats.tests:
+        totals = blocking_stats.totals()
+        terminalreporter.section("resource blocking")
+        terminalreporter.write_line(
+            f"{totals['blocked_requests']} request(s) blocked in {len(blocking_stats.tests)} test(s), "
+            f"~{totals['blocked_bytes'] / 1024:.0f} KiB not downloaded"
+        )
+
+
+def _summarize_waits(terminalreporter):
+    summary = wait_metrics.summarize(wait_metrics.records, top=5)
+    terminalreporter.section("hottest waits")
+    for wait in summary["hottest"]:
+        timeouts = f", {wait['timeouts']} timed out" if wait["timeouts"] else ""
+        terminalreporter.write_line(
+            f"{wait['total_s']:8.2f}s  {wait['calls']:>4} call(s)  {wait['page']}.{wait['method']}  "
+            f"{wait['condition']} {wait['locator']}{timeouts}"
+        )
+    terminalreporter.write_line(f"full report: test-results/wait-metrics.json ({summary['waits']} waits)")
+
+
+def _summarize_commands(terminalreporter):
+    report = command_profiler.report()
+    if not report["tests"]:
+        return
+    terminalreporter.section("webdriver commands")
+    busiest = sorted(report["tests"].items(), key=lambda kv: kv[1]["commands"], reverse=True)[:5]
+    for test, summary in busiest:
+        top = ", ".join(f"{name}={c['count']}" for name, c in list(summary["by_command"].items())[:3])
+        terminalreporter.write_line(f"{summary['commands']:>6} cmds  {summary['total_ms'] / 1000:7.2f}s  {test}  ({top})")
+    session = report["session"]
+    terminalreporter.write_line(
+        f"session: {session['commands']} commands, {session['total_ms'] / 1000:.2f}s; "
+        f"full report: test-results/command-profile.json"
+    )
@@ -1,19 +1,24 @@
-import time  # For adding delays during UI interactions
+from selenium.common.exceptions import StaleElementReferenceException  # Cart row re-rendered mid-click
 from selenium.webdriver.common.by import By  # Used to locate elements
-from selenium.webdriver.support.ui import WebDriverWait  # Waits for conditions
 from selenium.webdriver.support import expected_conditions as EC  # Common wait conditions
+from utils.api_client import ApiError, GroceryMateApi, endpoint_pattern  # Backend shortcut for bulk cart reset
+from utils.browser_wait import BrowserWait  # Recorded waits, evaluated inside the browser
+from utils.network_log import expect_response  # Waits for the backend response an action triggers
+from utils.page_perf import perf_recorder  # Optional page-load metrics and budgets
+from utils.quiescence import wait_until_settled  # Waits for in-page network/DOM activity to stop
+from utils.settings import BASE_URL  # Site under test (config.ini [app] base_url)
 
 
 class CheckoutPage:
     """Handles checkout flow: shipping-cost reads, quantity adjustments, and full purchases."""
 
     # — existing shipping-cost locators & actions —
-    _CHECKOUT_URL = "https://grocerymate.masterschool.com/checkout"  # URL for the checkout page
+    _CHECKOUT_URL = f"{BASE_URL}/checkout"  # URL for the checkout page
     _SHIPPING_COST = (
         By.XPATH,
         ".//h5[normalize-space(.)='Shipment:']/following-sibling::h5"
     )  # Finds the element with shipping cost
-    _PLUS_BUTTON = (By.XPATH, "//button[contains(@class, 'plus')]"), "button.plus"  # Locator for increasing quantity
+    _PLUS_BUTTON = (By.XPATH, "//button[contains(@class, 'plus')]")  # Locator for increasing quantity
     _MINUS_BUTTON = (By.XPATH, "//button[contains(@class, 'minus')]") # Locator for decreasing quantity
 
     # — updated locators for the “buy” flow —
@@ -28,18 +33,23 @@ class CheckoutPage:
 
     # — locators for cart cleanup —
     _REMOVE_LINKS = (By.CSS_SELECTOR, "a.remove-icon")  # Fix: <a> tag, not button
+    _REMOVE_X_LINKS = (By.XPATH, "//a[contains(@class, 'remove-icon') and normalize-space(.)='×']")  # Only '×' icons
     _CART_EMPTY_INDICATOR = (By.CLASS_NAME, "cart-empty-text")  # Optional final check
 
     def __init__(self, driver, timeout: int = 15):
         self.driver = driver  # Store reference to Selenium driver
-        self.wait = WebDriverWait(driver, timeout)  # Create WebDriverWait with timeout
+        self.wait = BrowserWait(driver, timeout)  # Create (instrumented, in-browser) WebDriverWait with timeout
 
     # — shipping-cost & quantity methods —
-    def open_checkout(self):
-        """Navigate directly to the checkout page and wait for React to render."""
+    def open_checkout(self, measure: bool | None = None):
+        """
+        Navigate directly to the checkout page and wait for React to render.
+        Captures "checkout" page-load metrics when [perf] collect is on (or `measure` is True).
+        """
         self.driver.get(self._CHECKOUT_URL)  # Go to checkout URL
         self.wait.until(EC.url_contains("/checkout"))  # Wait until URL confirms we’re there
-        time.sleep(1)  # Allow hydration/render time for React
+        wait_until_settled(self.driver)  # Cart fetched and rendered
+        perf_recorder.capture(self.driver, "checkout", measure)  # No-op unless perf collection is on
 
     def read_shipping_cost(self) -> str:
         """Wait for and return the visible shipping-cost text."""
@@ -47,18 +57,16 @@ class CheckoutPage:
         return el.text.strip()  # Return cleaned text
 
     def increase_quantity(self, times: int = 1):
-        """Click the '+' button `times` times, with a pause after each."""
-        btn = self.wait.until(EC.element_to_be_clickable(self._PLUS_BUTTON))  # Wait until plus button is clickable
+        """Click the '+' button `times` times, letting the cart update settle after each."""
         for _ in range(times):  # Repeat clicking
-            btn.click()
-            time.sleep(0.5)  # Small delay to let UI update
+            self.wait.until(EC.element_to_be_clickable(self._PLUS_BUTTON)).click()  # Re-locate: the row re-renders
+            wait_until_settled(self.driver)  # Quantity saved and totals re-rendered
 
     def decrease_quantity(self, times: int = 1):
-        """Click the '–' button `times` times, with a pause after each."""
-        btn = self.wait.until(EC.element_to_be_clickable(self._MINUS_BUTTON))  # Wait until minus button is clickable
+        """Click the '–' button `times` times, letting the cart update settle after each."""
         for _ in range(times):  # Repeat clicking
-            btn.click()
-            time.sleep(0.5)  # Delay between actions
+            self.wait.until(EC.element_to_be_clickable(self._MINUS_BUTTON)).click()  # Re-locate: the row re-renders
+            wait_until_settled(self.driver)  # Quantity saved and totals re-rendered
 
     # — purchase (“buy”) methods —
     def fill_checkout_form(
@@ -81,7 +89,7 @@ class CheckoutPage:
 
     def wait_for_order_confirmation(self):
         """Wait until the app redirects to homepage (used as order confirmation)."""
-        self.wait.until(EC.url_to_be("https://grocerymate.masterschool.com/"))  # Wait for homepage load
+        self.wait.until(EC.url_to_be(f"{BASE_URL}/"))  # Wait for homepage load
 
     def buy(
         self,
@@ -105,35 +113,71 @@ class CheckoutPage:
         )
         self.wait_for_order_confirmation()  # Wait for homepage
 
-    def place_order(self):
+    def place_order(self) -> dict | None:
         """
         Clicks the 'Buy now' or final submission button to place the order.
+        Returns the order POST response ({"status", "body", ...}) once it
+        arrived, None when it was not observed.
+        """
+        button = self.wait.until(EC.element_to_be_clickable(self._CONTINUE))
+        with expect_response(self.driver, "POST", endpoint_pattern("orders")) as response:
+            button.click()
+        return response or None
+
+    def clear_cart(self) -> int:
+        """
+        Empty the cart and return how many items were removed (see reset_cart).
         """
-        self.wait.until(EC.element_to_be_clickable(self._CONTINUE)).click()
+        return self.reset_cart()
 
-    def clear_cart(self):
+    def reset_cart(self, api: GroceryMateApi | None = None) -> int:
+        """
+        Empty the cart in one backend call, then confirm it on /checkout.
+
+        Falls back to clicking every '×' icon when the backend call fails.
+        Either way the page ends on /checkout with the empty-cart text visible.
+
+        Args:
+            api: Client bound to this driver's session; one is created (and
+                closed again) when omitted.
+        Returns:
+            Number of cart items removed.
+        """
+        client = api or GroceryMateApi(self.driver)
+        try:
+            removed = client.clear_cart()  # Bulk DELETE on the cart
+        except ApiError as e:
+            print(f" Cart API failed ({e}); clearing through the UI.")
+            removed = None
+        finally:
+            if api is None:
+                client.close()
+
+        if removed is None:
+            removed = self._clear_cart_via_ui()
+        else:
+            self.open_checkout()  # Show the (now empty) cart
+        self.wait.until(EC.visibility_of_element_located(self._CART_EMPTY_INDICATOR))  # Verify emptiness
+        return removed
+
+    def _clear_cart_via_ui(self) -> int:
         """
         Clicks all '×' icons in the checkout to remove items from the cart.
+        Returns the number of items removed.
         """
-        self.driver.get(self._CHECKOUT_URL)
-        self.wait.until(EC.presence_of_element_located(self._REMOVE_LINKS))
-        time.sleep(2)  # Let cart render fully
+        self.open_checkout()
 
+        removed = 0
         while True:
-            remove_buttons = self.driver.find_elements(*self._REMOVE_LINKS)
-            x_buttons = [btn for btn in remove_buttons if btn.text.strip() == "×"]
-
+            x_buttons = self.driver.find_elements(*self._REMOVE_X_LINKS)  # One lookup per pass
             if not x_buttons:
                 print(" Cart is empty.")
-                break
-
-            for button in x_buttons:
-                try:
-                    self.wait.until(EC.element_to_be_clickable(button))
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                    button.click()
-                    time.sleep(2)
-                    break
-                except Exception as e:
-                    print(f" Failed to click '×': {e}")
-                    continue
+                return removed
+
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", x_buttons[0])
+                x_buttons[0].click()
+            except StaleElementReferenceException:
+                continue  # Cart re-rendered between lookup and click; look again
+            wait_until_settled(self.driver)  # Item removed and cart re-rendered
+            removed += 1
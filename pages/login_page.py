@@ -1,31 +1,72 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.checkout_page import CheckoutPage
+from utils.api_client import endpoint_pattern
+from utils.browser_wait import BrowserWait
+from utils.network_log import expect_response
+from utils.session_cache import SessionStateCache
+from utils.settings import BASE_URL, get_float
 
 
 class LoginPage:
     """Page object for login via the /auth page."""
 
-    _PAGE_URL = "https://grocerymate.masterschool.com/auth"
+    _PAGE_URL = f"{BASE_URL}/auth"
+    _HOME_URL = f"{BASE_URL}/"
     _EMAIL_INPUT = (By.XPATH, '//input[@placeholder="Email address"]')
     _PASSWORD_INPUT = (By.XPATH, '//input[@placeholder="Password"]')
     _SUBMIT_BUTTON = (By.CLASS_NAME, "submit-btn")
 
-    def __init__(self, driver):
+    # Only rendered for signed-in users; anonymous visitors are redirected to /auth
+    _SESSION_PROBE_URL = f"{BASE_URL}/checkout"
+    _SIGNED_IN_MARKERS = (
+        CheckoutPage._SHIPPING_COST,
+        CheckoutPage._CART_EMPTY_INDICATOR,
+        CheckoutPage._REMOVE_LINKS,
+        CheckoutPage._STREET,
+    )
+
+    def __init__(self, driver, session_cache: SessionStateCache | None = None):
         """
         Initialize with a WebDriver and default wait.
 
         Args:
             driver: Selenium WebDriver instance.
+            session_cache: Login-state cache; defaults to the one configured
+                in the [session_cache] section of config.ini.
         """
         self._driver = driver
-        self._wait = WebDriverWait(driver, 10)
+        self._wait = BrowserWait(driver, 10)
+        self._session_cache = session_cache or SessionStateCache.from_settings()
 
     def load(self):
         """Navigate to the login page URL."""
         self._driver.get(self._PAGE_URL)
 
-    def login(self, email: str, password: str) -> None:
+    def login(self, email: str, password: str, use_cache: bool = True) -> dict | None:
+        """
+        Log in and land on the home page.
+
+        With a session cache, a previously captured session for `email` is
+        injected instead of typing credentials. If that session turns out to be
+        stale or revoked, it is discarded and a real UI login is performed.
+        Returns the login POST response ({"status", "body", ...}) of a form
+        login, None when a cached session was reused or the response was not
+        observed.
+        """
+        if use_cache and self._session_cache and self._restore_session(email):
+            return None
+
+        response = self._login_via_form(email, password)
+
+        if self._session_cache:
+            self._session_cache.save(email, SessionStateCache.capture_selenium(self._driver))
+        return response
+
+    def _login_via_form(self, email: str, password: str) -> dict | None:
+        """Type credentials on /auth, submit and return the login response (None if missed)."""
         self._driver.get(self._PAGE_URL)
 
         email_el = self._wait.until(EC.element_to_be_clickable(self._EMAIL_INPUT))
@@ -36,11 +77,41 @@ class LoginPage:
         pwd_el.clear()
         pwd_el.send_keys(password)
 
-        self._wait.until(EC.element_to_be_clickable(self._SUBMIT_BUTTON)).click()
+        submit = self._wait.until(EC.element_to_be_clickable(self._SUBMIT_BUTTON))
+        with expect_response(self._driver, "POST", endpoint_pattern("login")) as response:
+            submit.click()
 
         # Wait until the URL changes to the home page (login success confirmation)
-        self._wait.until(EC.url_to_be("https://grocerymate.masterschool.com/"))
+        self._wait.until(EC.url_to_be(self._HOME_URL))
+        return response or None
 
+    def _restore_session(self, email: str) -> bool:
+        """Inject the cached session for `email` and confirm the server still accepts it."""
+        state = self._session_cache.load(email)
+        if state is None:
+            return False
 
+        SessionStateCache.apply_selenium(self._driver, state)
+        if not self._session_is_live():
+            self._session_cache.invalidate(email)
+            self._driver.delete_all_cookies()
+            return False
 
+        self._driver.get(self._HOME_URL)
+        self._wait.until(EC.url_to_be(self._HOME_URL))
+        return True
 
+    def _session_is_live(self) -> bool:
+        """Open a members-only page: signed-in content means live, a bounce to /auth means stale."""
+        self._driver.get(self._SESSION_PROBE_URL)
+        probe_wait = BrowserWait(self._driver, get_float("session_cache", "probe_timeout", 5))
+        try:
+            probe_wait.until(
+                EC.any_of(
+                    EC.url_contains("/auth"),
+                    *(EC.presence_of_element_located(marker) for marker in self._SIGNED_IN_MARKERS),
+                )
+            )
+        except TimeoutException:
+            return False
+        return "/auth" not in self._driver.current_url
@@ -1,9 +1,15 @@
 import re
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoAlertPresentException
+from selenium.common.exceptions import TimeoutException
 from utils.alert_handler import accept_alert
+from utils.api_client import endpoint_pattern
+from utils.browser_wait import BrowserWait
+from utils.dom_cache import cached_read, dom_cache
+from utils.network_log import expect_response
+from utils.page_perf import perf_recorder
+from utils.quiescence import wait_until_settled
+from utils.settings import BASE_URL
 
 
 class ProductPage:
@@ -24,6 +30,35 @@ class ProductPage:
     _STARS = (By.CSS_SELECTOR, ".star")
     _REVIEW_BLOCKS = (By.CLASS_NAME, "review-block")
     _COMMENT_DIVS = (By.CSS_SELECTOR, "div.comment")
+    _AVERAGE_RATING_BLOCK = (By.CLASS_NAME, "custom-rating")
+
+    # Collects the review section in one round trip (see _snapshot_reviews)
+    _SNAPSHOT_JS = """
+        function all(selector, root) { return Array.from((root || document).querySelectorAll(selector)); }
+        function text(root, selector) {
+            var el = root.querySelector(selector);
+            return el ? el.innerText : null;
+        }
+        return {
+            stars: all(".star").map(function (star) {
+                var filled = star.querySelector(".filled");
+                return {cls: star.getAttribute("class") || "",
+                        fillStyle: filled ? filled.getAttribute("style") || "" : null};
+            }),
+            comments: all(".comment").map(function (block) {
+                return {author: text(block, ".author"), text: text(block, ".text"),
+                        rating: text(block, "span.small"), isDiv: block.tagName === "DIV"};
+            }),
+            containers: all(".review-container").map(function (block) {
+                return {username: text(block, ".review-username"), comment: text(block, ".review-comment")};
+            }),
+            headerAuthors: all(".comment-header strong").map(function (el) { return el.innerText; }),
+            blockStarCounts: all(".review-block").map(function (block) {
+                return all(".custom-rating span.star-filled", block).length;
+            }),
+            reviewsText: text(document, "p.reviews")
+        };
+    """
 
     def __init__(self, driver):
         """
@@ -32,27 +67,32 @@ class ProductPage:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)
+        self.wait = BrowserWait(driver, 15)
+        # Elements and review readings, reused until the DOM changes
+        self._cache = dom_cache(driver)
 
-    def load(self, product_id: str) -> None:
-        """Navigate to a product page dynamically by ID."""
-        self.driver.get(f"https://grocerymate.masterschool.com/product/{product_id}")
+    def load(self, product_id: str, measure: bool | None = None) -> None:
+        """
+        Navigate to a product page dynamically by ID.
+        Captures "product" page-load metrics when [perf] collect is on (or `measure` is True).
+        """
+        self.driver.get(f"{BASE_URL}/product/{product_id}")
+        perf_recorder.capture(self.driver, "product", measure)
 
     def open_review_form(self) -> None:
         """Ensure the review form is present (currently visible by default)."""
-        self.wait.until(EC.presence_of_element_located(self._INTERACTIVE_RATING))
+        self._cache.find(self.wait, self._INTERACTIVE_RATING)
 
     def enter_review_text(self, text: str) -> None:
         """Enter review text into the textarea."""
-        textarea = self.wait.until(EC.presence_of_element_located(self._REVIEW_TEXTAREA))
+        textarea = self._cache.find(self.wait, self._REVIEW_TEXTAREA)
         textarea.clear()
         textarea.send_keys(text)
 
     def select_star_rating(self, stars: int = 5) -> None:
         """Select a star rating (1 to 5). Fails if user is not allowed to review."""
         try:
-            self.wait.until(EC.presence_of_all_elements_located(self._STAR_LIST))
-            stars_list = self.driver.find_elements(*self._STAR_LIST)
+            stars_list = self._cache.find_all(self.wait, self._STAR_LIST)
         except TimeoutException:
             raise Exception("Cannot rate: user has already reviewed or stars not rendered.")
 
@@ -64,21 +104,44 @@ class ProductPage:
         # Wait for possible UI reaction, replace fixed sleep if possible
         self.wait.until(EC.element_to_be_clickable(self._SEND_BUTTON))
 
-    def submit_review(self) -> None:
-        """Click the 'Send' button to submit the review."""
+    def submit_review(self, await_response: bool = True, refresh: bool = False) -> dict | None:
+        """
+        Click the 'Send' button to submit the review.
+
+        By default waits for the review POST it triggers and for the page to
+        re-render, then returns the response ({"status", "url", "body", ...},
+        body = parsed JSON, None when the response was not observed); no
+        sleep or reload needed before reading the ratings. `refresh` reloads the page afterwards (for checks that must
+        come from the server). With await_response=False (submission expected
+        to be blocked client-side) it only clicks and returns None.
+        """
         send_btn = self.wait.until(EC.element_to_be_clickable(self._SEND_BUTTON))
         self.driver.execute_script("arguments[0].scrollIntoView(true);", send_btn)
-        send_btn.click()
+        if not await_response:
+            send_btn.click()
+            return None
+
+        with expect_response(self.driver, "POST", endpoint_pattern("reviews")) as response:
+            send_btn.click()
+        if refresh:
+            self.driver.refresh()
+            self.wait.until(EC.presence_of_element_located(self._AVERAGE_RATING_BLOCK))
+        else:
+            wait_until_settled(self.driver)  # Ratings and comments re-rendered from the response
+        return response or None
 
     def verify_review_present(self, text: str) -> None:
         """Verify that the submitted review is displayed."""
         locator = (By.XPATH, f"//div[contains(@class,'review-body') and contains(text(), '{text}')]")
         self.wait.until(EC.presence_of_element_located(locator))
 
-    def remove_existing_review(self) -> None:
+    def remove_existing_review(self) -> dict | None:
         """
         Removes the current user's review if restriction text is present.
-        Clicks the '...' menu and then clicks the 'Delete' option. Handles alert if present.
+        Clicks the '...' menu and then clicks the 'Delete' option; the confirm
+        dialog is answered by the dialog policy as it opens (or accepted here
+        on drivers without it).
+        Returns the DELETE response (see submit_review), or None when there was no review.
         """
         try:
             self.wait.until(EC.presence_of_element_located(self._REVIEW_RESTRICTION))
@@ -90,47 +153,58 @@ class ProductPage:
             self.wait.until(EC.element_to_be_clickable(self._DELETE_BUTTON))
 
             delete_button = self.driver.find_element(*self._DELETE_BUTTON)
-            delete_button.click()
+            with expect_response(self.driver, "DELETE", endpoint_pattern("my_review")) as response:
+                delete_button.click()
+                accept_alert(self.driver)  # Only finds a dialog when the policy is not installed
 
-            # Handle alert popup if present
-            try:
-                accept_alert(self.driver)
-            except NoAlertPresentException:
-                pass
-
-            # Wait briefly to ensure deletion is processed
+            # The form comes back once the app has re-rendered
             self.wait.until_not(EC.presence_of_element_located(self._REVIEW_RESTRICTION))
+            return response or None
 
         except TimeoutException:
             # No existing review to delete
-            pass
+            return None
+
+    def has_own_review(self) -> bool:
+        """Whether the page says the current user already reviewed this product (once it has settled)."""
+        wait_until_settled(self.driver)
+        return bool(self.driver.find_elements(*self._REVIEW_RESTRICTION))
 
+    def _snapshot_reviews(self) -> dict:
+        """
+        Read the whole review section in one execute_script call.
+
+        Returns plain data for every selector the readers below use:
+        stars (class + partial-fill style), comments (author, text, "(r)"
+        rating), review containers (username, comment), comment-header
+        authors, the filled-star count of each review block and the "(X)"
+        review count text.
+        """
+        return self.driver.execute_script(self._SNAPSHOT_JS)
+
+    @cached_read
     def get_review_comments(self) -> list[tuple[str, str]]:
         """
         Returns a list of tuples: (author_name, comment_text) for each review found.
         """
         self.wait.until(EC.presence_of_all_elements_located(self._COMMENT_BLOCKS))
-        comment_blocks = self.driver.find_elements(*self._COMMENT_BLOCKS)
 
         result = []
-        for block in comment_blocks:
-            try:
-                author = block.find_element(By.CSS_SELECTOR, ".author").text.strip()
-                comment = block.find_element(By.CSS_SELECTOR, ".text").text.strip()
-                if comment:
-                    result.append((author, comment))
-            except Exception:
-                # Ignore broken comment structure
-                continue
+        for block in self._snapshot_reviews()["comments"]:
+            if block["author"] is None or block["text"] is None:
+                continue  # Ignore broken comment structure
+            author, comment = block["author"].strip(), block["text"].strip()
+            if comment:
+                result.append((author, comment))
         return result
 
-    def _parse_average_rating_from_stars(self, stars) -> float:
-        """Parse average rating from star WebElements list (handles partial fills correctly)."""
+    def _parse_average_rating_from_stars(self, stars: list[dict]) -> float:
+        """Parse average rating from snapshot stars (handles partial fills correctly)."""
         full_stars = 0
         partial_fraction = 0.0
 
         for star in stars:
-            class_attr = star.get_attribute("class") or ""
+            class_attr = star["cls"]
 
             # Count fully filled stars
             if "full" in class_attr:
@@ -139,49 +213,47 @@ class ProductPage:
 
             # Handle partially filled star (width: 95%)
             if "partial" in class_attr or "half" in class_attr:
-                try:
-                    filled_span = star.find_element(By.CSS_SELECTOR, ".filled")
-                    style_attr = filled_span.get_attribute("style") or ""
-                    match = re.search(r"width:\s*(\d+(?:\.\d+)?)%", style_attr)
-                    if match:
-                        percent = float(match.group(1))
-                        # Convert percent fill to fractional star (e.g., 95% → 0.95)
-                        partial_fraction = percent / 100
-                except Exception:
-                    partial_fraction = 0.0
+                match = re.search(r"width:\s*(\d+(?:\.\d+)?)%", star["fillStyle"] or "")
+                if match:
+                    # Convert percent fill to fractional star (e.g., 95% → 0.95)
+                    partial_fraction = float(match.group(1)) / 100
                 break  # Only one partial star expected
 
         # Total = full stars + fraction of the next one
         return round(full_stars + partial_fraction, 2)
 
+    @cached_read
     def get_average_rating(self) -> float:
         """Get average rating displayed on the product page as a float."""
-        stars = self.wait.until(EC.presence_of_all_elements_located(self._STARS))
-        return self._parse_average_rating_from_stars(stars)
+        self.wait.until(EC.presence_of_all_elements_located(self._STARS))
+        return self._parse_average_rating_from_stars(self._snapshot_reviews()["stars"])
 
+    @cached_read
     def get_review_count(self) -> int:
         """Return the review count extracted from (X) format in <p class='reviews'>."""
         elem = self.wait.until(EC.presence_of_element_located(self._REVIEWS_TEXT))
-        raw = elem.text.strip()
+        return self._parse_review_count(elem.text)
+
+    @staticmethod
+    def _parse_review_count(text: str) -> int:
+        raw = text.strip()
         if raw.startswith("(") and raw.endswith(")"):
             return int(raw[1:-1])
         raise ValueError(f"Unexpected format for review count: {raw}")
 
-    def get_user_comment_text(self) -> str:
-        """Return the review text left by the logged-in user, if available."""
+    @cached_read
+    def get_user_comment_text(self, username: str = "AutoTestG") -> str:
+        """Return the review text left by `username` (the logged-in user), if available."""
         self.wait.until(EC.presence_of_all_elements_located(self._REVIEW_CONTAINERS))
-        author_blocks = self.driver.find_elements(*self._REVIEW_CONTAINERS)
-
-        for block in author_blocks:
-            try:
-                author = block.find_element(By.CSS_SELECTOR, ".review-username").text
-                if "AutoTestG" in author:
-                    comment = block.find_element(By.CSS_SELECTOR, ".review-comment").text.strip()
-                    return comment
-            except Exception:
+
+        for block in self._snapshot_reviews()["containers"]:
+            if block["username"] is None or block["comment"] is None:
                 continue
+            if username in block["username"]:
+                return block["comment"].strip()
         return ""
 
+    @cached_read
     def user_has_comment(self, username: str) -> bool:
         """
         Checks if a comment from the given username exists on the product page.
@@ -193,41 +265,62 @@ class ProductPage:
             True if a comment by that user is present, False otherwise.
         """
         self.wait.until(EC.presence_of_all_elements_located(self._COMMENT_HEADER_STRONG))
-        author_elements = self.driver.find_elements(*self._COMMENT_HEADER_STRONG)
-        return any(el.text.strip() == username for el in author_elements)
+        authors = self._snapshot_reviews()["headerAuthors"]
+        return any(author.strip() == username for author in authors)
 
+    @cached_read
     def get_visible_review_star_ratings(self) -> list[int]:
         """
         Extract the number of filled stars for each visible review on the product page.
         """
-        review_blocks = self.driver.find_elements(*self._REVIEW_BLOCKS)
-        ratings = []
-        for block in review_blocks:
-            filled_stars = block.find_elements(By.CSS_SELECTOR, ".custom-rating span.star-filled")
-            ratings.append(len(filled_stars))
-        return ratings
+        return self._snapshot_reviews()["blockStarCounts"]
 
+    @cached_read
     def get_average_from_visible_reviews(self) -> float:
         """
         Calculate the average rating by reading the (X) rating value beside each review block.
         """
         self.wait.until(EC.presence_of_all_elements_located(self._COMMENT_DIVS))
-        reviews = self.driver.find_elements(*self._COMMENT_DIVS)
-
-        total = 0
-        count = 0
-
-        for review in reviews:
-            try:
-                rating_text = review.find_element(By.CSS_SELECTOR, "span.small").text.strip()
-                if rating_text.startswith("(") and rating_text.endswith(")"):
-                    value = int(rating_text[1:-1])
-                    total += value
-                    count += 1
-            except Exception:
-                continue  # Skip malformed reviews
-
-        if count == 0:
+
+        ratings = self._visible_ratings(self._snapshot_reviews()["comments"])
+        if not ratings:
             raise ValueError("No valid review ratings found.")
 
-        return round(total / count, 1)
+        return round(sum(ratings) / len(ratings), 1)
+
+    @staticmethod
+    def _visible_ratings(comments: list[dict]) -> list[int]:
+        """The "(r)" rating beside each div.comment review block."""
+        ratings = []
+        for review in comments:
+            rating_text = (review["rating"] or "").strip()
+            if not review["isDiv"]:
+                continue  # Only div.comment blocks carry a rating
+            if rating_text.startswith("(") and rating_text.endswith(")"):
+                try:
+                    ratings.append(int(rating_text[1:-1]))
+                except ValueError:
+                    continue  # Skip malformed reviews
+        return ratings
+
+    @cached_read
+    def get_rating_summary(self) -> dict:
+        """
+        Displayed average, review count and the visible reviews' ratings from
+        a single snapshot, without waiting for reviews a product may not have:
+        {"average_rating", "review_count", "visible_reviews", "visible_average"}.
+        review_count and visible_average are None when the page shows none.
+        """
+        self.wait.until(EC.presence_of_all_elements_located(self._STARS))
+        snapshot = self._snapshot_reviews()
+        ratings = self._visible_ratings(snapshot["comments"])
+        try:
+            review_count = self._parse_review_count(snapshot["reviewsText"] or "")
+        except ValueError:
+            review_count = None
+        return {
+            "average_rating": self._parse_average_rating_from_stars(snapshot["stars"]),
+            "review_count": review_count,
+            "visible_reviews": len(ratings),
+            "visible_average": round(sum(ratings) / len(ratings), 1) if ratings else None,
+        }
@@ -1,11 +1,16 @@
-import time
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.api_client import endpoint_pattern
+from utils.browser_wait import BrowserWait
+from utils.network_log import expect_response
+from utils.page_perf import perf_recorder
+from utils.quiescence import wait_until_settled
+from utils.settings import BASE_URL
+from utils.toast_recorder import toast_recorder
 
 
 class ShopPage:
-    _STORE_URL = "https://grocerymate.masterschool.com/store"
+    _STORE_URL = f"{BASE_URL}/store"
 
     # Age verification modal locators exactly as before
     _SHOP_BUTTON = (By.XPATH, '//a[@href="/store"]')
@@ -14,23 +19,52 @@ class ShopPage:
     _TOAST = (By.XPATH, "//div[contains(text(), 'You are of age')"
                         " or contains(text(), 'You are underage')"
                         " or contains(text(), 'Please enter your birth date')]")
+    _PRODUCT_CARDS = (By.CLASS_NAME, "product-card")
+    _CARD_OF_INPUT = "./ancestor::*[contains(concat(' ', normalize-space(@class), ' '), ' product-card ')][1]"
+
+    # Id, name and price text of every product card in one round trip; the
+    # price lookup follows get_first_product_price (discount, price, any '€')
+    _CATALOG_JS = """
+        return Array.from(document.querySelectorAll(".product-card")).map(function (card) {
+            var qty = card.querySelector("input[class*='quantity']");
+            var name = card.querySelector(".product-name, h5");
+            var price = card.querySelector(".discount-price") || card.querySelector(".price");
+            if (!price) {
+                price = Array.from(card.querySelectorAll("*")).find(function (el) {
+                    return Array.from(el.childNodes).some(function (node) {
+                        return node.nodeType === Node.TEXT_NODE && node.textContent.indexOf("\u20ac") !== -1;
+                    });
+                });
+            }
+            return {qtyName: qty ? qty.getAttribute("name") : null,
+                    name: name ? name.innerText.trim() : "",
+                    priceText: price ? price.innerText : null};
+        });
+    """
 
     def __init__(self, driver):
         """
         Initialize with WebDriver and setup waits.
         """
         self._driver = driver
-        self._wait = WebDriverWait(driver, 10)
-        self._toast_wait = WebDriverWait(driver, 15, poll_frequency=0.5)
+        self._wait = BrowserWait(driver, 10)
+        self._toast_wait = BrowserWait(driver, 15, poll_frequency=0.5)
+        # Toasts are read from an in-page log, relative to the last action's mark
+        self._toasts = toast_recorder(driver)
+        self._toasts.record_xpath(self._TOAST[1])  # The app's toasts, whatever their markup
+        self._action_mark: float | None = None
 
     def load(self):
         """Navigate to the store page URL."""
         self._driver.get(self._STORE_URL)
 
-    def open_store(self):
+    def open_store(self, measure: bool | None = None):
         """
         Navigate directly to the store page URL and wait for
         either product cards or the DOB modal to appear.
+
+        Page-load metrics are captured as "store" when [perf] collect is on
+        (or `measure` is True) and checked against [perf_budgets].
         """
         self._driver.get(self._STORE_URL)
         self._wait.until(
@@ -39,6 +73,15 @@ class ShopPage:
                 EC.presence_of_element_located(self._DOB_INPUT),
             )
         )
+        perf_recorder.capture(self._driver, "store", measure)
+
+    def age_gate_shown(self) -> bool:
+        """Whether the DOB modal is on the page right now (no waiting)."""
+        return bool(self._driver.find_elements(*self._DOB_INPUT))
+
+    def wait_for_products(self):
+        """Wait until the store has rendered its product cards."""
+        self._wait.until(EC.presence_of_element_located(self._PRODUCT_CARDS))
 
     def open_shop_modal(self):
         """
@@ -64,22 +107,41 @@ class ShopPage:
         confirm_button = self._wait.until(
             EC.element_to_be_clickable(self._CONFIRM_BUTTON)
         )
+        self._action_mark = self._toasts.mark()
         confirm_button.click()
 
-        time.sleep(1)  # Allow UI to react after confirmation
+        wait_until_settled(self._driver)  # Modal closes, toast renders
+
+    def toasts_since_last_action(self) -> list[dict]:
+        """
+        Toasts ({"text", "type", "time"}) that appeared since the last action
+        of this page object (e.g. the age-verification Confirm), once the UI
+        has settled. Empty when no action was taken yet.
+        """
+        if self._action_mark is None:
+            return []
+        return self._toasts.since(self._action_mark)
 
     def get_toast_message(self) -> str:
         """
-        Wait for any of the expected toasts and return its text.
+        Return the text of the first toast since the last action, or wait
+        for any of the expected toasts when none was recorded.
         """
+        toasts = self.toasts_since_last_action()
+        if toasts:
+            return toasts[0]["text"]
         return self._toast_wait.until(
             EC.presence_of_element_located(self._TOAST)
         ).text
 
     def toast_message_displayed(self, expected_text: str) -> bool:
         """
-        Check if a toast with expected text is visible.
+        Check if a toast with expected text appeared. After an action the
+        answer comes from the toast log once the UI has settled (no polling
+        to a timeout); without one, a visible toast is waited for.
         """
+        if self._action_mark is not None:
+            return self._toasts.shown_since(self._action_mark, expected_text)
         try:
             toast = self._toast_wait.until(
                 EC.visibility_of_element_located(self._TOAST)
@@ -97,7 +159,7 @@ class ShopPage:
         )
         card = self._driver.find_elements(By.CLASS_NAME, "product-card")[0]
         self._driver.execute_script("arguments[0].scrollIntoView(true);", card)
-        time.sleep(0.3)
+        wait_until_settled(self._driver)
         return card
 
     def get_first_product_price(self) -> float:
@@ -122,19 +184,67 @@ class ShopPage:
             except Exception:
                 raise Exception("Could not locate price element in product card")
 
+        return self._parse_price(price_text)
+
+    @staticmethod
+    def _parse_price(price_text: str) -> float:
+        """'€1,99' / '1.99 €' -> 1.99"""
         return float(price_text.replace("€", "").strip().replace(",", "."))
 
-    def add_first_product_to_cart(self, quantity: int = 1):
-        """Add the first product on the page to the cart with specified quantity."""
-        card = self.get_first_product_card()
+    def get_product_catalog(self) -> list[dict]:
+        """
+        Return every product card on the store page as
+        {"id", "name", "price"}: the id comes from the quantity input's
+        name ("quantity_<id>"), the price follows get_first_product_price
+        (None when a card shows no parsable price).
+        """
+        self._wait.until(EC.presence_of_all_elements_located(self._PRODUCT_CARDS))
+        wait_until_settled(self._driver)  # Cards render after /products returns
+
+        catalog = []
+        for card in self._driver.execute_script(self._CATALOG_JS):
+            if not card["qtyName"]:
+                continue  # Card without cart controls: no id to visit
+            try:
+                price = self._parse_price(card["priceText"]) if card["priceText"] else None
+            except ValueError:
+                price = None
+            catalog.append({"id": card["qtyName"].split("_", 1)[1], "name": card["name"], "price": price})
+        return catalog
+
+    def add_first_product_to_cart(self, quantity: int = 1, await_response: bool = True) -> dict | None:
+        """
+        Add the first product on the page to the cart with specified quantity.
+        Waits for the cart POST and returns its response ({"status", "body", ...}; None if not observed);
+        await_response=False only clicks (e.g. signed out: the app redirects to /auth).
+        """
+        return self._add_card_to_cart(self.get_first_product_card(), quantity, await_response)
+
+    def add_product_to_cart(self, product_id: str, quantity: int = 1, await_response: bool = True) -> dict | None:
+        """
+        Add the product `product_id` (the card whose quantity input is named
+        "quantity_<id>") to the cart; see add_first_product_to_cart.
+        """
+        qty_input = self._wait.until(EC.presence_of_element_located((By.NAME, f"quantity_{product_id}")))
+        card = qty_input.find_element(By.XPATH, self._CARD_OF_INPUT)
+        self._driver.execute_script("arguments[0].scrollIntoView(true);", card)
+        wait_until_settled(self._driver)
+        return self._add_card_to_cart(card, quantity, await_response)
 
+    def _add_card_to_cart(self, card, quantity: int, await_response: bool) -> dict | None:
+        """Type `quantity` into the card's input and click its cart button."""
         qty_input = card.find_element(By.XPATH, ".//input[contains(@class, 'quantity')]")
         add_btn = card.find_element(By.CSS_SELECTOR, "button.btn-cart")
 
         self._driver.execute_script("arguments[0].scrollIntoView(true);", qty_input)
         qty_input.clear()
         qty_input.send_keys(str(quantity))
-        time.sleep(0.5)
+        wait_until_settled(self._driver)
 
         self._driver.execute_script("arguments[0].scrollIntoView(true);", add_btn)
-        add_btn.click()
+        if not await_response:
+            add_btn.click()
+            return None
+        with expect_response(self._driver, "POST", endpoint_pattern("cart")) as response:
+            add_btn.click()
+        return response or None
@@ -0,0 +1,44 @@
+"""
+Browser startup benchmark: cold launch, first navigation and teardown time
+of every Playwright launch profile (utils/launch_profiles.py), each measured
+over a few rounds with a fresh browser.
+
+    cd playwright_py && pytest benchmarks/test_launch_profiles.py -s
+
+Headed profiles need a display (e.g. xvfb-run on Linux CI); the "headless"
+profile needs the full Chromium build (playwright install chromium).
+The Selenium counterpart is benchmarks/test_launch_profiles.py.
+"""
+
+import statistics
+import time
+import pytest
+from utils.launch_profiles import PROFILES, launch_args
+from utils.settings import BASE_URL
+
+ROUNDS = 3
+
+
+@pytest.mark.parametrize("profile", list(PROFILES))
+def test_launch_profile_speed(playwright, profile, record_property):
+    timings = {"launch": [], "first_navigation": [], "teardown": []}
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        browser = playwright.chromium.launch(**launch_args(profile))
+        launched = time.perf_counter()
+        try:
+            page = browser.new_page(viewport={"width": 1366, "height": 820})
+            page.goto(BASE_URL, wait_until="load")
+            navigated = time.perf_counter()
+        finally:
+            browser.close()
+        stopped = time.perf_counter()
+        timings["launch"].append(launched - start)
+        timings["first_navigation"].append(navigated - launched)
+        timings["teardown"].append(stopped - navigated)
+
+    medians = {phase: round(statistics.median(values), 3) for phase, values in timings.items()}
+    for phase, seconds in medians.items():
+        record_property(f"{phase}_seconds", seconds)
+    print(f"\n{profile:<13} launch {medians['launch']:6.2f}s  "
+          f"first navigation {medians['first_navigation']:6.2f}s  teardown {medians['teardown']:6.2f}s")
@@ -1,20 +1,99 @@
 # conftest.py — Playwright (Python) base fixtures for MarketMate
 # This file defines shared pytest fixtures for Playwright tests:
+# - launches the browser with the --launch-profile switches, if given
 # - creates a fresh browser context and page for each test
+# - async_browser / async_context / async_page: the same for asyncio tests
+# - LoginPage restores cached logins of the account it logs in as (utils/auth_state.py)
+# - pre-seeds the age-gate state so /store opens without the DOB modal
+# - answers JavaScript dialogs by policy as they open and records them (dialog_log)
+# - instruments pages so tests can wait for the UI to settle
+# - records or replays network traffic as HAR archives (--har-mode)
+# - blocks media / third-party requests per profile and reports the savings
+# - starts the bundled GroceryMate stand-in when the base URL is local
 # - captures screenshots automatically on test failure
+# - records which page-object methods each test uses (--impact-base selects by git diff)
+# - attaches page-load metrics to results and enforces [perf_budgets]
 # - stores screenshots inside the test-results/ folder
 
 from __future__ import annotations
 import os
 import pathlib
+import socket
+import subprocess
+import sys
+import time
 import pytest
+import pytest_asyncio
 from datetime import datetime
 from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+from utils.age_gate import AgeGateState
+from utils.dialog_policy import DialogLog
+from utils.har_archive import HarArchive
+from utils.impact_map import ImpactMap, ImpactPlugin, repo_root
+from utils.launch_profiles import PROFILES as LAUNCH_PROFILES, launch_args
+from utils.page_perf import perf_recorder
+from utils.quiescence import install_quiescence_probe, install_quiescence_probe_async
+from utils.resource_blocking import ResourceBlocker, ResourceSizes, default_profile
+from utils.settings import BASE_URL, is_local_base_url
+from urllib.parse import urlsplit
 
 # Load .env variables if present (optional, not required for tests)
 load_dotenv()
 
 
+def pytest_addoption(parser):
+    """
+    HAR record / replay:
+      --har-mode record   capture each test's traffic into the archive
+      --har-mode replay   serve every request from the archive (no network)
+      --har-policy        strict: unmatched requests fail the test; lenient: they go to the network
+    Tests sharing @pytest.mark.har_flow("name") record into and replay from one flow;
+    @pytest.mark.har_flow(volatile=("text",)) ignores generated JSON body fields when matching.
+    """
+    group = parser.getgroup("har", "HAR record / replay")
+    group.addoption("--har-mode", choices=("off", "record", "replay"), default=os.getenv("HAR_MODE", "off"))
+    group.addoption("--har-policy", choices=("strict", "lenient"), default=os.getenv("HAR_POLICY", "strict"))
+    group.addoption("--har-dir", default=os.getenv("HAR_DIR", "har-archive"),
+                    help="archive folder (default: har-archive)")
+    parser.addoption("--impact-base", metavar="REF", default=None,
+                     help="select tests affected by the changes since git REF (e.g. origin/main)")
+    parser.addoption("--launch-profile", choices=list(LAUNCH_PROFILES),
+                     default=os.getenv("GROCERYMATE_BROWSER_LAUNCH_PROFILE"),
+                     help="browser launch profile (see utils/launch_profiles.py); default: pytest-playwright's own")
+
+
+# Changes outside this suite that never select tests with --impact-base
+# (standin/, config.ini and anything else shared still run everything)
+IMPACT_IGNORE = ("*.md", "docs/*", ".gitignore", "pages/*", "tests/*", "utils/*", "benchmarks/*",
+                 "conftest.py", "pytest.ini", "requirements.txt", "playwright_py/benchmarks/*")
+
+
+def pytest_configure(config):
+    """
+    Record the page-object impact map (GROCERYMATE_IMPACT_MAP_FILE, default
+    .impact-map.json; GROCERYMATE_IMPACT_RECORD=0 turns it off) and select
+    tests with --impact-base.
+    """
+    impact_map = ImpactMap(
+        os.getenv("GROCERYMATE_IMPACT_MAP_FILE", ".impact-map.json"),
+        repo_root(config.rootpath),
+        page_dirs=("playwright_py/pages", "playwright_py/pages_async"),
+        test_dirs=("playwright_py/tests",),
+        ignored=IMPACT_IGNORE,
+    )
+    record = os.getenv("GROCERYMATE_IMPACT_RECORD", "1").lower() not in ("0", "false", "no", "off")
+    config.pluginmanager.register(ImpactPlugin(impact_map, config.getoption("--impact-base"), record), "impact-map")
+
+
+# Flows already recorded in this session: later tests of the same flow append to them
+_recorded_flows: set[str] = set()
+
+# Resource sizes used to price blocked requests, and what each test blocked
+_resource_sizes = ResourceSizes()
+_blocking_results: dict[str, dict] = {}
+
+
 @pytest.fixture(scope="session")
 def artifacts_dir() -> pathlib.Path:
     """
@@ -26,19 +105,160 @@ def artifacts_dir() -> pathlib.Path:
     return d
 
 
+@pytest.fixture(scope="session", autouse=True)
+def local_app():
+    """
+    When GROCERYMATE_APP_BASE_URL points at this machine, launch the stand-in
+    server from the repository root (python -m standin) for the whole session.
+    Set GROCERYMATE_APP_START_LOCAL_SERVER=0 to use one you started yourself.
+    """
+    start = os.getenv("GROCERYMATE_APP_START_LOCAL_SERVER", "1").lower() not in ("0", "false", "no", "off")
+    if not (is_local_base_url() and start):
+        yield None
+        return
+
+    parts = urlsplit(BASE_URL)
+    repo_root = pathlib.Path(__file__).resolve().parent.parent
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "standin",
+         "--host", parts.hostname, "--port", str(parts.port or 80),
+         "--latency-ms", os.getenv("GROCERYMATE_APP_LOCAL_LATENCY_MS", "0"),
+         "--catalog-size", os.getenv("GROCERYMATE_APP_LOCAL_CATALOG_SIZE", "12")],
+        cwd=repo_root,
+        stdout=subprocess.DEVNULL,
+    )
+
+    # Wait until the server accepts connections
+    deadline = time.monotonic() + 15
+    while True:
+        try:
+            socket.create_connection((parts.hostname, parts.port or 80), timeout=0.5).close()
+            break
+        except OSError:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                proc.kill()
+                raise RuntimeError(f"GroceryMate stand-in did not start on {BASE_URL}")
+            time.sleep(0.1)
+
+    yield BASE_URL
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args, pytestconfig) -> dict:
+    """
+    pytest-playwright's launch arguments, overridden by --launch-profile
+    (or GROCERYMATE_BROWSER_LAUNCH_PROFILE) when one is selected.
+    """
+    profile = pytestconfig.getoption("--launch-profile")
+    if not profile:
+        return browser_type_launch_args
+    return {**browser_type_launch_args, **launch_args(profile)}
+
+
+@pytest.fixture(scope="session")
+def age_gate_state(browser, pytestconfig) -> dict | None:
+    """
+    Cookies / localStorage the DOB modal writes for a valid date
+    (GROCERYMATE_AGE_GATE_DOB, default 01-01-1990), captured once and cached
+    on disk (see utils/age_gate.py). None when disabled with
+    GROCERYMATE_AGE_GATE_PRESEED=0, or when replaying HAR without a cached
+    state (capturing would need the network).
+    """
+    cache = AgeGateState.from_env()
+    if cache is None:
+        return None
+    if pytestconfig.getoption("--har-mode") == "replay":
+        return cache.load()
+    return cache.get(browser, os.getenv("GROCERYMATE_AGE_GATE_DOB", "01-01-1990"))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_age_gate_state(async_browser) -> dict | None:
+    """Async counterpart of `age_gate_state` (same cache file)."""
+    cache = AgeGateState.from_env()
+    if cache is None:
+        return None
+    return await cache.get_async(async_browser, os.getenv("GROCERYMATE_AGE_GATE_DOB", "01-01-1990"))
+
+
+def _context_state(age_gate_state: dict | None, node) -> dict | None:
+    """The storage_state a test's context starts with: the age-gate state, except for tests marked age_gate."""
+    if node.get_closest_marker("age_gate"):
+        return None
+    return age_gate_state
+
+
+@pytest.fixture()
+def dialog_log() -> DialogLog:
+    """
+    Dialogs answered in the test's context(s) per the GROCERYMATE_DIALOGS_*
+    policy (accept by default), for assertions: dialog_log.since(mark).
+    """
+    return DialogLog()
+
+
 @pytest.fixture()
-def context(browser):
+def context(browser, age_gate_state, dialog_log, request, tmp_path):
     """
     Create a new isolated Playwright browser context for each test.
-    This acts like a clean incognito window — no shared cookies or cache.
+    This acts like a clean incognito window — no shared cache — signed out:
+    LoginPage.login() restores the cached login of the account it is given.
+    It starts with the age-gate state (not for tests marked
+    @pytest.mark.age_gate).
+    Every page gets the quiescence probe used by wait_until_settled(), and
+    its dialogs are answered by policy as they open (see dialog_log).
+    With --har-mode record/replay the context's traffic is recorded into,
+    or served from, the HAR archive (flow = test id or @pytest.mark.har_flow).
+    Requests matching the blocking profile (@pytest.mark.block_resources,
+    else GROCERYMATE_BLOCKING_PROFILE, default "full") are aborted.
     """
+    state = _context_state(age_gate_state, request.node)
+
+    har_mode = request.config.getoption("--har-mode")
+    strict = request.config.getoption("--har-policy") == "strict"
+    archive = HarArchive(request.config.getoption("--har-dir"))
+    flow_marker = request.node.get_closest_marker("har_flow")
+    flow = flow_marker.args[0] if flow_marker and flow_marker.args else request.node.nodeid
+    volatile = tuple(flow_marker.kwargs.get("volatile", ())) if flow_marker else ()
+    raw_har = tmp_path / "raw.har" if har_mode == "record" else None
+
     ctx = browser.new_context(
         viewport={"width": 1366, "height": 820},  # screen size for consistency
         accept_downloads=True,                    # allow file downloads
+        storage_state=state,                      # age gate, or None for a blank context
+        record_har_path=raw_har,                  # raw HAR, converted into the archive on close
+        record_har_content="embed" if raw_har else None,
     )
+    install_quiescence_probe(ctx)
+    dialog_log.attach(ctx)
+
+    misses = []
+    if har_mode == "replay":
+        if archive.has_flow(flow):
+            misses = archive.replay(ctx, flow, strict=strict, volatile=volatile)
+        elif strict:
+            ctx.close()
+            pytest.fail(f"No HAR recording for flow '{flow}' in {archive.root} (run with --har-mode record)")
+
+    # Registered after the replay route so it runs first; allowed requests fall back to replay
+    blocking_marker = request.node.get_closest_marker("block_resources")
+    profile = blocking_marker.args[0] if blocking_marker else default_profile()
+    blocker = ResourceBlocker(ctx, profile, _resource_sizes)
+
     yield ctx
+    blocked = blocker.report()
+    _blocking_results[request.node.nodeid] = blocked
+    request.node.user_properties.append(("blocked_resources", blocked))
     ctx.close()  # always close context at the end of the test
 
+    if raw_har:
+        archive.ingest(raw_har, flow, append=flow in _recorded_flows)
+        _recorded_flows.add(flow)
+    if misses:
+        pytest.fail(f"{len(misses)} request(s) not in HAR flow '{flow}':\n  " + "\n  ".join(misses[:20]))
+
 
 @pytest.fixture()
 def page(context, request, artifacts_dir):
@@ -67,6 +287,56 @@ def page(context, request, artifacts_dir):
     p.close()  # close the page regardless of pass/fail
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser(browser_name, browser_type_launch_args):
+    """
+    Session-wide browser driven through playwright.async_api, launched with
+    the same arguments (and --launch-profile) as the sync `browser`.
+    Async tests share the session event loop (see pytest.ini).
+    """
+    async with async_playwright() as pw:
+        browser = await getattr(pw, browser_name).launch(**browser_type_launch_args)
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_context(async_browser, async_age_gate_state, dialog_log, request):
+    """
+    Async counterpart of `context`: a fresh, signed-out context seeded with
+    the age-gate state, answering dialogs into dialog_log, and
+    instrumented for wait_until_settled_async(). Open as many pages in it
+    as the test drives concurrently. HAR record/replay and resource
+    blocking apply to the sync `context` only.
+    """
+    state = _context_state(async_age_gate_state, request.node)
+    ctx = await async_browser.new_context(
+        viewport={"width": 1366, "height": 820},
+        accept_downloads=True,
+        storage_state=state,
+    )
+    await install_quiescence_probe_async(ctx)
+    dialog_log.attach_async(ctx)
+    yield ctx
+    await ctx.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page(async_context, request, artifacts_dir):
+    """Async counterpart of `page`, with the same screenshot on failure."""
+    p = await async_context.new_page()
+    yield p
+
+    if getattr(request.node, "_outcome", None) == "failed":
+        ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+        safe_name = request.node.nodeid.replace(os.sep, "_").replace("::", "__")
+        try:
+            await p.screenshot(path=str(artifacts_dir / f"{safe_name}__{ts}.png"), full_page=True)
+        except Exception:
+            pass
+    await p.close()
+
+
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -78,3 +348,45 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     if rep.when == "call":
         setattr(item, "_outcome", "failed" if rep.failed else "passed")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute page-load captures to the running test."""
+    perf_recorder.current_test = item.nodeid
+    yield
+    perf_recorder.current_test = ""
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Attach page-load metrics captured during the test to its result
+    (user_properties, shown in the HTML report) and fail the test when
+    a capture exceeds its [perf_budgets] limit in config.ini.
+    """
+    result = yield
+    captures = perf_recorder.captures_for(item.nodeid)
+    for capture in captures:
+        item.user_properties.append((f"perf:{capture['page']}", capture["metrics"]))
+    violations = [v for capture in captures for v in capture["violations"]]
+    if violations:
+        pytest.fail("Page-load budget exceeded:\n  " + "\n  ".join(violations), pytrace=False)
+    return result
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Keep learned resource sizes for the next run."""
+    _resource_sizes.save()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Requests blocked by the resource blocking profiles and the bytes they would have cost."""
+    if not _blocking_results:
+        return
+    requests = sum(r["blocked_requests"] for r in _blocking_results.values())
+    kb = sum(r["blocked_bytes"] for r in _blocking_results.values()) / 1024
+    terminalreporter.section("resource blocking")
+    terminalreporter.write_line(
+        f"{requests} request(s) blocked in {len(_blocking_results)} test(s), ~{kb:.0f} KiB not downloaded"
+    )
@@ -5,8 +5,8 @@
 # ------------------------------------------------------------
 
 from playwright.sync_api import Page
+from utils.settings import BASE_URL
 
-BASE_URL = "https://grocerymate.masterschool.com"
 
 class CheckoutPage:
     def __init__(self, page: Page):
@@ -4,26 +4,69 @@
 # Handles login form interactions and login state verification
 # ------------------------------------------------------------
 
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PWTimeout
+from utils.api_responses import expect_api_response
+from utils.settings import BASE_URL
+from utils.auth_state import AuthStateCache
 
-BASE_URL = "https://grocerymate.masterschool.com"
+# Members-only page: anonymous visitors are bounced to /auth
+SESSION_PROBE_URL = f"{BASE_URL}/checkout"
+SIGNED_IN_MARKERS = "a.remove-icon, .cart-empty-text, input[name='street']"
 
 class LoginPage:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, auth_cache: AuthStateCache | None = None):
         self.page = page
+        self.auth_cache = auth_cache or AuthStateCache.from_env()
+        self.last_response: dict | None = None  # Login response of the last form login
 
     # --- Assertions / State ---
     def is_displayed(self) -> bool:
         """Check that the current URL is the login page."""
         return self.page.url.startswith(f"{BASE_URL}/auth")
 
+    def has_live_session(self, timeout: float = 5000) -> bool:
+        """Return True if the server still accepts the context's session."""
+        self.page.goto(SESSION_PROBE_URL, wait_until="domcontentloaded")
+        try:
+            self.page.wait_for_function(
+                "sel => location.pathname.startsWith('/auth') || !!document.querySelector(sel)",
+                arg=SIGNED_IN_MARKERS,
+                timeout=timeout,
+            )
+        except PWTimeout:
+            return False
+        return not self.page.url.startswith(f"{BASE_URL}/auth")
+
     # --- Actions ---
-    def login(self, email: str, password: str):
-        """Fill in credentials and submit."""
+    def login(self, email: str, password: str, use_cache: bool = True):
+        """
+        Fill in credentials and submit.
+        If the auth cache holds a login of `email`, it is added to the context
+        and, when the server still accepts it, the form is skipped; otherwise
+        the stale entry is dropped and the login is done for real.
+        A form login waits for the backend's answer and keeps it in last_response
+        (None when the wait missed it).
+        """
+        state = self.auth_cache.load(email) if use_cache and self.auth_cache else None
+        if state is not None:
+            self.auth_cache.apply(self.page, state)
+            if self.has_live_session():
+                self.page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+                return self
+            self.auth_cache.invalidate(email)
+            self.page.context.clear_cookies()
+            self.page.evaluate("() => window.localStorage.clear()")
+            self.page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
+
         self.page.get_by_label("Email").fill(email)
         self.page.get_by_label("Password").fill(password)
-        self.page.get_by_role("button", name="Login").click()
+        with expect_api_response(self.page, "POST", "login") as self.last_response:
+            self.page.get_by_role("button", name="Login").click()
+        self.last_response = self.last_response or None
         self.page.wait_for_url(f"{BASE_URL}/store")
+
+        if self.auth_cache:
+            self.auth_cache.save(email, self.page.context.storage_state())
         return self
 
     def get_error_message(self) -> str:
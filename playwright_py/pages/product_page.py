@@ -5,14 +5,28 @@
 # ------------------------------------------------------------
 
 from playwright.sync_api import Page
+from utils.api_responses import expect_api_response
+from utils.page_perf import perf_recorder
+from utils.quiescence import wait_until_settled
+from utils.settings import BASE_URL
 from .login_page import LoginPage
 from .checkout_page import CheckoutPage
 
-BASE_URL = "https://grocerymate.masterschool.com"
 
 class ProductPage:
     def __init__(self, page: Page):
         self.page = page
+        self.last_response: dict | None = None  # Backend response of the last awaited action
+
+    # --- Navigation ---
+    def open(self, product_id: str, measure: bool | None = None):
+        """
+        Open /product/<product_id> directly.
+        Captures "product" page-load metrics when GROCERYMATE_PERF_COLLECT=1 (or `measure` is True).
+        """
+        self.page.goto(f"{BASE_URL}/product/{product_id}", wait_until="domcontentloaded")
+        perf_recorder.capture(self.page, "product", measure)
+        return self
 
     # --- Assertions / State ---
     def is_displayed(self) -> bool:
@@ -27,13 +41,22 @@ class ProductPage:
             qty.fill(str(value))
         return self
 
-    def add_to_cart(self):
-        """Click 'Add to Cart' and handle redirect."""
+    def add_to_cart(self, await_response: bool = True):
+        """
+        Click 'Add to Cart' and handle redirect.
+        Waits for the cart POST (kept in last_response, None on a miss) unless await_response=False,
+        e.g. when signed out and the app redirects to /auth without a request.
+        """
         add_btn = self.page.locator("button.btn-cart").first
         if not add_btn.count():
             raise AssertionError("No 'Add to Cart' button found on product page")
         add_btn.scroll_into_view_if_needed()
-        add_btn.click()
+        if await_response:
+            with expect_api_response(self.page, "POST", "cart") as self.last_response:
+                add_btn.click()
+            self.last_response = self.last_response or None
+        else:
+            add_btn.click()
 
         if self.page.url.startswith(f"{BASE_URL}/auth"):
             return LoginPage(self.page)
@@ -48,6 +71,21 @@ class ProductPage:
             tab.click()
         return self
 
+    def submit_review(self, refresh: bool = False):
+        """
+        Click 'Send' and wait for the review POST (kept in last_response, None on a miss) and
+        the re-render it triggers; `refresh` reloads the page afterwards.
+        """
+        with expect_api_response(self.page, "POST", "reviews") as self.last_response:
+            self.page.locator(".new-review-btn-send").first.click()
+        self.last_response = self.last_response or None
+        if refresh:
+            self.page.reload(wait_until="domcontentloaded")
+            self.page.wait_for_selector(".custom-rating")
+        else:
+            wait_until_settled(self.page)
+        return self
+
     def has_price(self) -> bool:
         """Return True if a price element is visible."""
         sel = self.page.locator("text=/€|price|total/i").first
@@ -7,32 +7,40 @@
 
 import re
 from playwright.sync_api import Page, TimeoutError as PWTimeout
+from utils.api_responses import expect_api_response
+from utils.page_perf import perf_recorder
+from utils.quiescence import wait_until_settled
+from utils.settings import BASE_URL
 from .login_page import LoginPage
 from .checkout_page import CheckoutPage
 from .product_page import ProductPage
 
-BASE_URL = "https://grocerymate.masterschool.com"
 
 class ShopPage:
     def __init__(self, page: Page):
         self.page = page
+        self.last_response: dict | None = None  # Backend response of the last awaited action
 
     # --- Navigation ---
-    def open(self):
-        """Open the /store page and handle age verification."""
+    def open(self, measure: bool | None = None):
+        """
+        Open the /store page and handle age verification.
+        Captures "store" page-load metrics when GROCERYMATE_PERF_COLLECT=1 (or `measure` is True).
+        """
         self.page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+        perf_recorder.capture(self.page, "store", measure)
         self._pass_age_modal()
         return self
 
     # --- Internal helpers ---
     def _pass_age_modal(self):
-        """Fill DOB if modal appears."""
+        """Fill DOB if the modal still appears (contexts are normally pre-seeded past it)."""
         try:
             dob = self.page.get_by_placeholder("DD-MM-YYYY")
             if dob.count() and dob.first.is_visible():
                 dob.first.fill("01-01-1990", timeout=2000)
                 self.page.get_by_role("button", name=re.compile("confirm", re.I)).click(timeout=2000)
-                self.page.wait_for_timeout(300)
+                wait_until_settled(self.page)
         except Exception:
             pass
 
@@ -44,18 +52,26 @@ class ShopPage:
                 return
             except PWTimeout:
                 self.page.evaluate("window.scrollBy(0, window.innerHeight * 0.5)")
-                self.page.wait_for_timeout(200)
+                wait_until_settled(self.page)
 
     # --- Actions ---
-    def add_first_product(self):
-        """Click first Add-to-Cart button and handle redirects."""
+    def add_first_product(self, await_response: bool = True):
+        """
+        Click first Add-to-Cart button and handle redirects.
+        Waits for the cart POST (kept in last_response, None on a miss) unless await_response=False.
+        """
         self._wait_for_products()
         add_btn = self.page.locator("button.btn-cart").first
         if not add_btn.count():
             raise AssertionError("No 'Add to Cart' button found")
 
         add_btn.scroll_into_view_if_needed()
-        add_btn.click()
+        if await_response:
+            with expect_api_response(self.page, "POST", "cart") as self.last_response:
+                add_btn.click()
+            self.last_response = self.last_response or None
+        else:
+            add_btn.click()
 
         # Redirection handling
         if self.page.url.startswith(f"{BASE_URL}/auth"):
@@ -64,6 +80,13 @@ class ShopPage:
             return CheckoutPage(self.page)
         return self
 
+    def product_ids(self) -> list[str]:
+        """Ids of the products linked from the store grid, in page order."""
+        self._wait_for_products()
+        hrefs = self.page.locator("a[href^='/product/']").evaluate_all(
+            "links => links.map(a => a.getAttribute('href'))")
+        return list(dict.fromkeys(href.split("/product/", 1)[1].split("?")[0] for href in hrefs))
+
     def open_first_product(self):
         """Open first product card link to reach ProductPage."""
         link = self.page.locator("a[href^='/product/']").first
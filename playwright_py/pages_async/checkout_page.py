@@ -0,0 +1,38 @@
+# playwright_py/pages_async/checkout_page.py
+# ------------------------------------------------------------
+# CheckoutPage (asyncio) – same surface as pages/checkout_page.py
+# Used to validate cart content and totals
+# ------------------------------------------------------------
+
+from playwright.async_api import Page
+from utils.settings import BASE_URL
+
+
+class CheckoutPage:
+    def __init__(self, page: Page):
+        self.page = page
+
+    # --- Assertions / State ---
+    def is_displayed(self) -> bool:
+        """Return True if current URL is /checkout."""
+        return self.page.url.startswith(f"{BASE_URL}/checkout")
+
+    async def has_items(self) -> bool:
+        """Return True if the cart table/list has visible items."""
+        selectors = [
+            "[data-testid*='cart'] [data-testid*='item']",
+            "[class*='cart'] [class*='item']",
+            ".cart-item",
+            "ul li[class*='item']",
+            "table tr",
+        ]
+        for sel in selectors:
+            loc = self.page.locator(sel)
+            if await loc.count() > 0 and await loc.first.is_visible():
+                return True
+        return False
+
+    async def get_total_amount(self) -> str:
+        """Return subtotal or total text from checkout."""
+        loc = self.page.locator("text=/total|subtotal/i").first
+        return (await loc.text_content() or "").strip() if await loc.count() else ""
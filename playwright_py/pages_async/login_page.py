@@ -0,0 +1,69 @@
+# playwright_py/pages_async/login_page.py
+# ------------------------------------------------------------
+# LoginPage (asyncio) – same surface as pages/login_page.py
+# Handles login form interactions and login state verification
+# ------------------------------------------------------------
+
+from playwright.async_api import Page, TimeoutError as PWTimeout
+from utils.settings import BASE_URL
+from utils.auth_state import AuthStateCache
+
+# Members-only page: anonymous visitors are bounced to /auth
+SESSION_PROBE_URL = f"{BASE_URL}/checkout"
+SIGNED_IN_MARKERS = "a.remove-icon, .cart-empty-text, input[name='street']"
+
+class LoginPage:
+    def __init__(self, page: Page, auth_cache: AuthStateCache | None = None):
+        self.page = page
+        self.auth_cache = auth_cache or AuthStateCache.from_env()
+
+    # --- Assertions / State ---
+    def is_displayed(self) -> bool:
+        """Check that the current URL is the login page."""
+        return self.page.url.startswith(f"{BASE_URL}/auth")
+
+    async def has_live_session(self, timeout: float = 5000) -> bool:
+        """Return True if the server still accepts the context's session."""
+        await self.page.goto(SESSION_PROBE_URL, wait_until="domcontentloaded")
+        try:
+            await self.page.wait_for_function(
+                "sel => location.pathname.startsWith('/auth') || !!document.querySelector(sel)",
+                arg=SIGNED_IN_MARKERS,
+                timeout=timeout,
+            )
+        except PWTimeout:
+            return False
+        return not self.page.url.startswith(f"{BASE_URL}/auth")
+
+    # --- Actions ---
+    async def login(self, email: str, password: str, use_cache: bool = True):
+        """
+        Fill in credentials and submit.
+        If the auth cache holds a login of `email`, it is added to the context
+        and, when the server still accepts it, the form is skipped; otherwise
+        the stale entry is dropped and the login is done for real.
+        """
+        state = self.auth_cache.load(email) if use_cache and self.auth_cache else None
+        if state is not None:
+            await self.auth_cache.apply_async(self.page, state)
+            if await self.has_live_session():
+                await self.page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+                return self
+            self.auth_cache.invalidate(email)
+            await self.page.context.clear_cookies()
+            await self.page.evaluate("() => window.localStorage.clear()")
+            await self.page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
+
+        await self.page.get_by_label("Email").fill(email)
+        await self.page.get_by_label("Password").fill(password)
+        await self.page.get_by_role("button", name="Login").click()
+        await self.page.wait_for_url(f"{BASE_URL}/store")
+
+        if self.auth_cache:
+            self.auth_cache.save(email, await self.page.context.storage_state())
+        return self
+
+    async def get_error_message(self) -> str:
+        """Return visible error text if login fails."""
+        el = self.page.locator("text=/invalid|wrong|failed/i").first
+        return (await el.text_content() or "").strip() if await el.count() else ""
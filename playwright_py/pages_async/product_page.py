@@ -0,0 +1,65 @@
+# playwright_py/pages_async/product_page.py
+# ------------------------------------------------------------
+# ProductPage (asyncio) – same surface as pages/product_page.py
+# Handles product detail view: quantity, Add to Cart, reviews
+# ------------------------------------------------------------
+
+from playwright.async_api import Page
+from utils.page_perf import perf_recorder
+from utils.settings import BASE_URL
+from .login_page import LoginPage
+from .checkout_page import CheckoutPage
+
+
+class ProductPage:
+    def __init__(self, page: Page):
+        self.page = page
+
+    # --- Navigation ---
+    async def open(self, product_id: str, measure: bool | None = None):
+        """
+        Open /product/<product_id> directly.
+        Captures "product" page-load metrics when GROCERYMATE_PERF_COLLECT=1 (or `measure` is True).
+        """
+        await self.page.goto(f"{BASE_URL}/product/{product_id}", wait_until="domcontentloaded")
+        await perf_recorder.capture_async(self.page, "product", measure)
+        return self
+
+    # --- Assertions / State ---
+    def is_displayed(self) -> bool:
+        """Check if current page is a product detail page."""
+        return "/product/" in self.page.url
+
+    # --- Actions ---
+    async def set_quantity(self, value: int = 1):
+        """Set product quantity if input exists."""
+        qty = self.page.locator("input[type='number'], input[class*='quantity']").first
+        if await qty.count() and await qty.is_visible():
+            await qty.fill(str(value))
+        return self
+
+    async def add_to_cart(self):
+        """Click 'Add to Cart' and handle redirect."""
+        add_btn = self.page.locator("button.btn-cart").first
+        if not await add_btn.count():
+            raise AssertionError("No 'Add to Cart' button found on product page")
+        await add_btn.scroll_into_view_if_needed()
+        await add_btn.click()
+
+        if self.page.url.startswith(f"{BASE_URL}/auth"):
+            return LoginPage(self.page)
+        if self.page.url.startswith(f"{BASE_URL}/checkout"):
+            return CheckoutPage(self.page)
+        return self
+
+    async def open_reviews_tab(self):
+        """If product has reviews tab, click it."""
+        tab = self.page.locator("text=/review/i").first
+        if await tab.count() and await tab.is_visible():
+            await tab.click()
+        return self
+
+    async def has_price(self) -> bool:
+        """Return True if a price element is visible."""
+        sel = self.page.locator("text=/€|price|total/i").first
+        return await sel.count() > 0 and await sel.is_visible()
@@ -0,0 +1,91 @@
+# playwright_py/pages_async/shop_page.py
+# ------------------------------------------------------------
+# ShopPage (asyncio) – same surface as pages/shop_page.py
+# Opens /store, passes age modal, adds product to cart,
+# redirects to LoginPage if unauthenticated.
+# ------------------------------------------------------------
+
+import re
+from playwright.async_api import Page, TimeoutError as PWTimeout
+from utils.page_perf import perf_recorder
+from utils.quiescence import wait_until_settled_async
+from utils.settings import BASE_URL
+from .login_page import LoginPage
+from .checkout_page import CheckoutPage
+from .product_page import ProductPage
+
+
+class ShopPage:
+    def __init__(self, page: Page):
+        self.page = page
+
+    # --- Navigation ---
+    async def open(self, measure: bool | None = None):
+        """
+        Open the /store page and handle age verification.
+        Captures "store" page-load metrics when GROCERYMATE_PERF_COLLECT=1 (or `measure` is True).
+        """
+        await self.page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+        await perf_recorder.capture_async(self.page, "store", measure)
+        await self._pass_age_modal()
+        return self
+
+    # --- Internal helpers ---
+    async def _pass_age_modal(self):
+        """Fill DOB if the modal still appears (contexts are normally pre-seeded past it)."""
+        try:
+            dob = self.page.get_by_placeholder("DD-MM-YYYY")
+            if await dob.count() and await dob.first.is_visible():
+                await dob.first.fill("01-01-1990", timeout=2000)
+                await self.page.get_by_role("button", name=re.compile("confirm", re.I)).click(timeout=2000)
+                await wait_until_settled_async(self.page)
+        except Exception:
+            pass
+
+    async def _wait_for_products(self):
+        """Scroll down until product cards or buttons appear."""
+        for _ in range(4):
+            try:
+                await self.page.wait_for_selector("button.btn-cart", state="visible", timeout=1000)
+                return
+            except PWTimeout:
+                await self.page.evaluate("window.scrollBy(0, window.innerHeight * 0.5)")
+                await wait_until_settled_async(self.page)
+
+    # --- Actions ---
+    async def add_first_product(self):
+        """Click first Add-to-Cart button and handle redirects."""
+        await self._wait_for_products()
+        add_btn = self.page.locator("button.btn-cart").first
+        if not await add_btn.count():
+            raise AssertionError("No 'Add to Cart' button found")
+
+        await add_btn.scroll_into_view_if_needed()
+        await add_btn.click()
+
+        # Redirection handling
+        if self.page.url.startswith(f"{BASE_URL}/auth"):
+            return LoginPage(self.page)
+        if self.page.url.startswith(f"{BASE_URL}/checkout"):
+            return CheckoutPage(self.page)
+        return self
+
+    async def product_ids(self) -> list[str]:
+        """Ids of the products linked from the store grid, in page order."""
+        await self._wait_for_products()
+        hrefs = await self.page.locator("a[href^='/product/']").evaluate_all(
+            "links => links.map(a => a.getAttribute('href'))")
+        return list(dict.fromkeys(href.split("/product/", 1)[1].split("?")[0] for href in hrefs))
+
+    async def open_first_product(self):
+        """Open first product card link to reach ProductPage."""
+        link = self.page.locator("a[href^='/product/']").first
+        if not await link.count():
+            raise AssertionError("No product link found")
+        await link.click()
+        return ProductPage(self.page)
+
+    async def go_to_checkout(self):
+        """Navigate directly to checkout."""
+        await self.page.goto(f"{BASE_URL}/checkout", wait_until="domcontentloaded")
+        return CheckoutPage(self.page)
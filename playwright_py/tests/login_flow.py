@@ -1,6 +1,7 @@
 import os
 import pytest
 from pages.login_page import LoginPage
+from utils.settings import BASE_URL
 
 pytestmark = pytest.mark.e2e
 
@@ -15,7 +16,7 @@ def test_login_flow(page):
     THEN the user lands on the Store (/store)
     """
     login = LoginPage(page)
-    page.goto("https://grocerymate.masterschool.com/auth", wait_until="domcontentloaded")
+    page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
 
-    login.login(EMAIL, PASSWORD)
-    assert page.url.startswith("https://grocerymate.masterschool.com/store"), "Login did not reach /store"
+    login.login(EMAIL, PASSWORD, use_cache=False)
+    assert page.url.startswith(f"{BASE_URL}/store"), "Login did not reach /store"
@@ -4,10 +4,10 @@ import pytest
 from pages.login_page import LoginPage
 from pages.shop_page import ShopPage
 from pages.checkout_page import CheckoutPage
+from utils.settings import BASE_URL
 
 pytestmark = pytest.mark.e2e
 
-BASE = "https://grocerymate.masterschool.com"
 EMAIL = os.getenv("USER_EMAIL")
 PASSWORD = os.getenv("USER_PASSWORD")
 
@@ -20,7 +20,7 @@ def test_add_to_cart_then_open_cart(page):
     """
 
     # 1) Login (same as Selenium’s LoginPage usage)
-    page.goto(f"{BASE}/auth", wait_until="domcontentloaded")
+    page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
     LoginPage(page).login(EMAIL, PASSWORD)
 
     # 2) Go to /store and pass age modal (ShopPage handles this)
@@ -28,6 +28,8 @@ def test_add_to_cart_then_open_cart(page):
 
     # 3) Add first product from the grid
     result = shop.add_first_product()
+    if shop.last_response is not None:  # None: the cart call was not observed
+        assert shop.last_response["status"] < 400, f"Cart request failed: {shop.last_response}"
 
     # 4) Click the cart icon in the header (don’t hard-jump to /checkout)
     # Try direct link first, then fall back to a11y name that contains "cart"
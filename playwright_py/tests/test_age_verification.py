@@ -1,7 +1,7 @@
 import pytest
 from pages.shop_page import ShopPage
 
-pytestmark = pytest.mark.smoke
+pytestmark = [pytest.mark.smoke, pytest.mark.age_gate]  # The real DOB modal, no pre-seeded state
 
 def test_age_verification(page):
     """
@@ -0,0 +1,34 @@
+import asyncio
+import pytest
+from pages_async.product_page import ProductPage
+from pages_async.shop_page import ShopPage
+from utils.quiescence import wait_until_settled_async
+
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio]
+
+PRODUCT_COUNT = 20
+
+
+async def test_product_pages_open_concurrently(async_context, async_page):
+    """
+    GIVEN the product grid on /store
+    WHEN up to 20 product pages are opened at once, each in its own tab
+    THEN every tab shows a product detail page with a price
+    """
+    shop = await ShopPage(async_page).open()
+    product_ids = (await shop.product_ids())[:PRODUCT_COUNT]
+    assert product_ids, "No product links found on /store"
+
+    async def check(product_id: str) -> tuple[str, bool]:
+        tab = await async_context.new_page()
+        try:
+            product = await ProductPage(tab).open(product_id)
+            await wait_until_settled_async(tab)
+            return product_id, product.is_displayed() and await product.has_price()
+        finally:
+            await tab.close()
+
+    # All tabs load and settle in parallel on the one event loop
+    results = await asyncio.gather(*(check(product_id) for product_id in product_ids))
+    broken = [product_id for product_id, ok in results if not ok]
+    assert not broken, f"Product pages without a price: {broken}"
@@ -1,10 +1,11 @@
 import pytest
+from utils.settings import BASE_URL
 
 # Mark this file as a smoke test
 pytestmark = pytest.mark.smoke
 
 # Public home page of the MarketMate app
-HOME_URL = "https://grocerymate.masterschool.com/"
+HOME_URL = f"{BASE_URL}/"
 
 def test_homepage_loads(page):
     """
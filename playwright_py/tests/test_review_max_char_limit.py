@@ -2,6 +2,7 @@ import os
 import pytest
 from pages.login_page import LoginPage
 from pages.shop_page import ShopPage
+from utils.settings import BASE_URL
 
 pytestmark = pytest.mark.e2e
 
@@ -15,7 +16,7 @@ def test_review_max_char_limit(page):
     WHEN they enter a very long review
     THEN the UI prevents input beyond max length or shows a validation message
     """
-    page.goto("https://grocerymate.masterschool.com/auth", wait_until="domcontentloaded")
+    page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
     LoginPage(page).login(EMAIL, PASSWORD)
 
     ShopPage(page).open().open_first_product().open_reviews_tab()
@@ -2,12 +2,14 @@ import os
 import pytest
 from pages.login_page import LoginPage
 from pages.shop_page import ShopPage
+from utils.settings import BASE_URL
 
 pytestmark = pytest.mark.e2e
 
 EMAIL = os.getenv("USER_EMAIL")
 PASSWORD = os.getenv("USER_PASSWORD")
 
+@pytest.mark.har_flow(volatile=("text",))  # review text may change between runs
 @pytest.mark.skipif(not EMAIL or not PASSWORD, reason="USER_EMAIL/USER_PASSWORD not set")
 def test_review_text_persistence(page):
     """
@@ -15,7 +17,7 @@ def test_review_text_persistence(page):
     WHEN they navigate away and back (without submitting)
     THEN the typed text remains (if app supports draft persistence)
     """
-    page.goto("https://grocerymate.masterschool.com/auth", wait_until="domcontentloaded")
+    page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
     LoginPage(page).login(EMAIL, PASSWORD)
 
     ShopPage(page).open().open_first_product().open_reviews_tab()
@@ -25,7 +27,7 @@ def test_review_text_persistence(page):
     textarea.fill("Draft review text…")
 
     # Navigate away to Store and back (first product again)
-    page.goto("https://grocerymate.masterschool.com/store", wait_until="domcontentloaded")
+    page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
     ShopPage(page).open().open_first_product().open_reviews_tab()
 
     # Check if draft persisted
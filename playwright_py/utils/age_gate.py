@@ -0,0 +1,141 @@
+# playwright_py/utils/age_gate.py
+# ------------------------------------------------------------
+# AgeGateState – mirrors Selenium utils/age_gate.py
+# Captures the cookies / localStorage the store's DOB modal writes
+# for a valid date once, caches them on disk and merges them into
+# every new context's storage_state so /store opens without the modal.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import json
+import os
+import pathlib
+import re
+import time
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.sync_api import Browser, TimeoutError as PWTimeout
+from utils.quiescence import (install_quiescence_probe, install_quiescence_probe_async,
+                              wait_until_settled, wait_until_settled_async)
+from utils.settings import BASE_URL
+
+_EMPTY_STATE = {"cookies": [], "origins": []}
+
+
+def _cookie_key(cookie: dict) -> tuple:
+    return cookie["name"], cookie.get("domain"), cookie.get("path")
+
+
+def diff_state(before: dict, after: dict) -> dict:
+    """Cookies and localStorage items that are new or changed in `after` (storage_state layout)."""
+    known = {_cookie_key(c): c["value"] for c in before.get("cookies", [])}
+    cookies = [c for c in after.get("cookies", []) if known.get(_cookie_key(c)) != c["value"]]
+    stored = {(o["origin"], i["name"]): i["value"] for o in before.get("origins", []) for i in o.get("localStorage", [])}
+    origins = []
+    for origin in after.get("origins", []):
+        items = [i for i in origin.get("localStorage", []) if stored.get((origin["origin"], i["name"])) != i["value"]]
+        if items:
+            origins.append({"origin": origin["origin"], "localStorage": items})
+    return {"cookies": cookies, "origins": origins}
+
+
+class AgeGateState:
+    """The captured age-gate state in a JSON file, valid for one base URL until it expires."""
+
+    def __init__(self, path: str | pathlib.Path, ttl_seconds: float):
+        self.path = pathlib.Path(path)
+        self.ttl = ttl_seconds
+
+    @classmethod
+    def from_env(cls) -> "AgeGateState | None":
+        """
+        Build from environment variables (same names as the Selenium [age_gate] overrides):
+          GROCERYMATE_AGE_GATE_PRESEED    – set to 0/false to keep the modal everywhere (default on)
+          GROCERYMATE_AGE_GATE_STATE_FILE – cache file (default .auth-state/age-gate.json)
+          GROCERYMATE_AGE_GATE_TTL_HOURS  – lifetime of the captured state (default 24)
+        """
+        if os.getenv("GROCERYMATE_AGE_GATE_PRESEED", "1").lower() in ("0", "false", "no", "off"):
+            return None
+        return cls(
+            path=os.getenv("GROCERYMATE_AGE_GATE_STATE_FILE", ".auth-state/age-gate.json"),
+            ttl_seconds=float(os.getenv("GROCERYMATE_AGE_GATE_TTL_HOURS", "24")) * 3600,
+        )
+
+    def load(self) -> dict | None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("base_url") != BASE_URL or data.get("expires_at", 0) <= time.time():
+            return None
+        return data["state"]
+
+    def save(self, state: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"base_url": BASE_URL, "expires_at": time.time() + self.ttl, "state": state}),
+                       encoding="utf-8")
+        tmp.replace(self.path)
+
+    def get(self, browser: Browser, dob: str) -> dict:
+        """The cached state, or capture it in a throwaway context of `browser`."""
+        state = self.load()
+        if state is None:
+            state = capture(browser, dob)
+            self.save(state)
+        return state
+
+    async def get_async(self, browser: AsyncBrowser, dob: str) -> dict:
+        """Async counterpart of get()."""
+        state = self.load()
+        if state is None:
+            state = await capture_async(browser, dob)
+            self.save(state)
+        return state
+
+
+def capture(browser: Browser, dob: str) -> dict:
+    """Open /store in a blank context, pass the modal with `dob` and return what it wrote (empty without a modal)."""
+    ctx = browser.new_context()
+    try:
+        install_quiescence_probe(ctx)
+        page = ctx.new_page()
+        page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+        wait_until_settled(page)
+        dob_input = page.get_by_placeholder("DD-MM-YYYY")
+        if not (dob_input.count() and dob_input.first.is_visible()):
+            return dict(_EMPTY_STATE)
+        before = ctx.storage_state()
+        dob_input.first.fill(dob)
+        page.get_by_role("button", name=re.compile("confirm", re.I)).click()
+        try:
+            page.wait_for_selector(".product-card", timeout=10_000)
+        except PWTimeout:
+            raise RuntimeError(f"The age gate did not let DOB {dob!r} into the store") from None
+        wait_until_settled(page)
+        return diff_state(before, ctx.storage_state())
+    finally:
+        ctx.close()
+
+
+async def capture_async(browser: AsyncBrowser, dob: str) -> dict:
+    """Async counterpart of capture()."""
+    ctx = await browser.new_context()
+    try:
+        await install_quiescence_probe_async(ctx)
+        page = await ctx.new_page()
+        await page.goto(f"{BASE_URL}/store", wait_until="domcontentloaded")
+        await wait_until_settled_async(page)
+        dob_input = page.get_by_placeholder("DD-MM-YYYY")
+        if not (await dob_input.count() and await dob_input.first.is_visible()):
+            return dict(_EMPTY_STATE)
+        before = await ctx.storage_state()
+        await dob_input.first.fill(dob)
+        await page.get_by_role("button", name=re.compile("confirm", re.I)).click()
+        try:
+            await page.wait_for_selector(".product-card", timeout=10_000)
+        except PWTimeout:
+            raise RuntimeError(f"The age gate did not let DOB {dob!r} into the store") from None
+        await wait_until_settled_async(page)
+        return diff_state(before, await ctx.storage_state())
+    finally:
+        await ctx.close()
@@ -0,0 +1,72 @@
+# playwright_py/utils/api_responses.py
+# ------------------------------------------------------------
+# expect_api_response – mirrors Selenium utils/network_log.expect_response
+# Waits for the backend response a UI action triggers (page.expect_response)
+# and hands back its status and parsed body, so page objects return as soon
+# as the server has answered instead of sleeping or reloading. Best-effort:
+# a miss is logged and leaves the result empty, the action goes on.
+# Endpoint paths follow the Selenium [api] section; override them with
+# GROCERYMATE_API_PATH / GROCERYMATE_API_<ENDPOINT>.
+# ------------------------------------------------------------
+
+import os
+import re
+from contextlib import contextmanager
+from playwright.sync_api import Page, TimeoutError as PWTimeout
+
+_ENDPOINTS = {
+    "cart": "/cart",
+    "orders": "/orders",
+    "reviews": "/products/{product_id}/reviews",
+    "my_review": "/products/{product_id}/reviews/me",
+    "login": "/auth/login",
+}
+
+
+def endpoint_pattern(name: str) -> re.Pattern:
+    """Regex matching request URLs of endpoint `name`, e.g. reviews -> /api/products/[^/?]+/reviews."""
+    path = os.getenv("GROCERYMATE_API_PATH", "/api").rstrip("/")
+    path += os.getenv(f"GROCERYMATE_API_{name.upper()}", _ENDPOINTS[name])
+    return re.compile(re.sub(r"\\\{\w+\\\}", "[^/?]+", re.escape(path)) + r"/?(?:\?|$)")
+
+
+@contextmanager
+def expect_api_response(page: Page, method: str, name: str, timeout: float = 15_000,
+                        send_timeout: float = 3_000):
+    """
+    Wait for the `method` response of endpoint `name` triggered inside the block:
+
+        with expect_api_response(page, "POST", "reviews") as response:
+            send.click()
+        response["body"]  # parsed JSON payload
+
+    The yielded dict ({"status", "url", "body"}; body is text when not JSON,
+    None when empty) is filled in when the block exits. It stays empty when
+    no such request is sent within `send_timeout` ms (e.g. the app calls
+    another path) or no response arrives within `timeout` ms; the miss is
+    logged and the caller carries on with its own URL/settle wait.
+    """
+    pattern = endpoint_pattern(name)
+    response: dict = {}
+    body_done = False
+    try:
+        with page.expect_response(lambda r: r.request.method == method and bool(pattern.search(r.url)),
+                                  timeout=timeout) as info:
+            with page.expect_request(lambda r: r.method == method and bool(pattern.search(r.url)),
+                                     timeout=send_timeout):
+                yield response
+                body_done = True
+        result = info.value
+    except PWTimeout as e:
+        if not body_done:
+            raise  # Raised by the action itself
+        print(f" Response wait skipped: no {method} {name} response ({e.message.splitlines()[0]})")
+        return
+    try:
+        body = result.json()
+    except Exception:
+        try:
+            body = result.text() or None
+        except Exception:
+            body = None  # Body not retrievable (e.g. redirect)
+    response.update(status=result.status, url=result.url, body=body)
@@ -0,0 +1,68 @@
+# playwright_py/utils/auth_state.py
+# ------------------------------------------------------------
+# AuthStateCache – disk cache of Playwright storage_state per account
+# The TTL / file logic is shared with the Selenium SessionStateCache
+# (shared/state_cache.py); this adds the env configuration and how a
+# cached login is applied to an existing context. LoginPage restores
+# the login of the account it is asked to log in as, and falls back
+# to a real form login when that session is stale.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import os
+from urllib.parse import urlsplit
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+from utils.settings import BASE_URL
+from utils.shared import load_shared
+
+StateCache = load_shared("state_cache").StateCache
+
+# Writes the name/value pairs arguments[0] into the page's localStorage
+_SET_LOCAL_STORAGE_JS = "items => items.forEach(item => window.localStorage.setItem(item.name, item.value))"
+
+
+class AuthStateCache(StateCache):
+    """One storage_state JSON file per account, with an expiry timestamp."""
+
+    @classmethod
+    def from_env(cls) -> "AuthStateCache | None":
+        """
+        Build the cache from environment variables:
+          AUTH_STATE_CACHE   – set to 0/false to disable (default on)
+          AUTH_STATE_DIR     – folder for cached states (default .auth-state)
+          AUTH_STATE_TTL_MIN – lifetime of a cached login in minutes (default 60)
+        """
+        if os.getenv("AUTH_STATE_CACHE", "1").lower() in ("0", "false", "no", "off"):
+            return None
+        return cls(
+            directory=os.getenv("AUTH_STATE_DIR", ".auth-state"),
+            ttl_seconds=float(os.getenv("AUTH_STATE_TTL_MIN", "60")) * 60,
+        )
+
+    @staticmethod
+    def _app_local_storage(state: dict) -> list[dict]:
+        parts = urlsplit(BASE_URL)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        return [item for o in state.get("origins", []) if o.get("origin") == origin
+                for item in o.get("localStorage", [])]
+
+    @classmethod
+    def apply(cls, page: Page, state: dict) -> None:
+        """Add the cached cookies to the page's context and its localStorage to the app's origin."""
+        page.context.add_cookies(state.get("cookies", []))
+        items = cls._app_local_storage(state)
+        if items:
+            if not page.url.startswith(BASE_URL):
+                page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
+            page.evaluate(_SET_LOCAL_STORAGE_JS, items)
+
+    @classmethod
+    async def apply_async(cls, page: AsyncPage, state: dict) -> None:
+        """Async counterpart of apply()."""
+        await page.context.add_cookies(state.get("cookies", []))
+        items = cls._app_local_storage(state)
+        if items:
+            if not page.url.startswith(BASE_URL):
+                await page.goto(f"{BASE_URL}/auth", wait_until="domcontentloaded")
+            await page.evaluate(_SET_LOCAL_STORAGE_JS, items)
@@ -0,0 +1,103 @@
+# playwright_py/utils/dialog_policy.py
+# ------------------------------------------------------------
+# DialogLog – mirrors Selenium utils/dialog_policy.py
+# Answers alert / confirm / prompt dialogs of every page in a context
+# by policy the moment they open (context.on("dialog")) and records them
+# for assertions. Playwright would otherwise dismiss them silently.
+# ------------------------------------------------------------
+
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Dialog as AsyncDialog
+from playwright.sync_api import BrowserContext, Dialog
+
+
+@dataclass(frozen=True)
+class DialogPolicy:
+    """Messages matching dismiss_pattern are dismissed, then accept_pattern accepted, the rest get `default`."""
+
+    default: str = "accept"
+    accept_pattern: str = ""
+    dismiss_pattern: str = ""
+    prompt_text: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "DialogPolicy":
+        """
+        Build from environment variables (same names as the Selenium [dialogs] overrides):
+          GROCERYMATE_DIALOGS_DEFAULT         – accept (default) or dismiss
+          GROCERYMATE_DIALOGS_ACCEPT_PATTERN  – case-insensitive regex of messages to accept
+          GROCERYMATE_DIALOGS_DISMISS_PATTERN – case-insensitive regex of messages to dismiss
+          GROCERYMATE_DIALOGS_PROMPT_TEXT     – answer of accepted prompts (default: their default value)
+        """
+        default = os.getenv("GROCERYMATE_DIALOGS_DEFAULT", "accept").lower()
+        if default not in ("accept", "dismiss"):
+            raise ValueError(f"GROCERYMATE_DIALOGS_DEFAULT must be accept or dismiss, not {default!r}")
+        return cls(
+            default=default,
+            accept_pattern=os.getenv("GROCERYMATE_DIALOGS_ACCEPT_PATTERN", ""),
+            dismiss_pattern=os.getenv("GROCERYMATE_DIALOGS_DISMISS_PATTERN", ""),
+            prompt_text=os.getenv("GROCERYMATE_DIALOGS_PROMPT_TEXT"),
+        )
+
+    def accepts(self, message: str) -> bool:
+        """Whether a dialog showing `message` is accepted."""
+        if self.dismiss_pattern and re.search(self.dismiss_pattern, message, re.IGNORECASE):
+            return False
+        if self.accept_pattern and re.search(self.accept_pattern, message, re.IGNORECASE):
+            return True
+        return self.default == "accept"
+
+
+@dataclass
+class DialogLog:
+    """
+    Dialogs answered in the contexts it is attached to, oldest first, as
+    {"type", "message", "accepted", "time"} (time: epoch ms, compare with mark()).
+    beforeunload prompts are always accepted so navigation goes ahead.
+    """
+
+    policy: DialogPolicy = field(default_factory=DialogPolicy.from_env)
+    dialogs: list[dict] = field(default_factory=list)
+
+    def attach(self, context: BrowserContext) -> None:
+        """Answer every dialog of `context`'s pages by policy."""
+        context.on("dialog", self._handle)
+
+    def attach_async(self, context: AsyncBrowserContext) -> None:
+        """Async counterpart of attach()."""
+        context.on("dialog", self._handle_async)
+
+    @staticmethod
+    def mark() -> float:
+        """The current time as a mark."""
+        return time.time() * 1000
+
+    def since(self, mark: float = 0) -> list[dict]:
+        """Dialogs opened at or after `mark`."""
+        return [d for d in self.dialogs if d["time"] >= mark]
+
+    def _record(self, dialog: Dialog | AsyncDialog) -> bool:
+        accepted = dialog.type == "beforeunload" or self.policy.accepts(dialog.message)
+        self.dialogs.append({"type": dialog.type, "message": dialog.message, "accepted": accepted,
+                             "time": self.mark()})
+        return accepted
+
+    def _prompt_text(self, dialog: Dialog | AsyncDialog) -> str | None:
+        if dialog.type != "prompt":
+            return None
+        return self.policy.prompt_text if self.policy.prompt_text is not None else dialog.default_value
+
+    def _handle(self, dialog: Dialog) -> None:
+        if self._record(dialog):
+            dialog.accept(self._prompt_text(dialog))
+        else:
+            dialog.dismiss()
+
+    async def _handle_async(self, dialog: AsyncDialog) -> None:
+        if self._record(dialog):
+            await dialog.accept(self._prompt_text(dialog))
+        else:
+            await dialog.dismiss()
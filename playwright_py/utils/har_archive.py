@@ -0,0 +1,190 @@
+# playwright_py/utils/har_archive.py
+# ------------------------------------------------------------
+# HarArchive – record and replay network traffic per test / flow
+# Recording: Playwright writes a raw HAR per context; ingest() turns it
+#   into a compact HAR whose bodies live in a content-addressed blob
+#   store (blobs/<sha256>), so identical responses across tests are
+#   stored once.
+# Replay: replay() routes every request of a context to the recorded
+#   responses (in recorded order per request), strict or lenient.
+#   Fields named volatile (generated per run, e.g. review text) are
+#   left out of the JSON request body before it is matched.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import base64
+import hashlib
+import json
+import pathlib
+import re
+from collections import defaultdict
+from urllib.parse import urldefrag
+from playwright.sync_api import BrowserContext, Route
+
+# Headers that describe the original transfer, not the (decoded) body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+def flow_file_name(flow: str) -> str:
+    """Safe file name for a test node id or flow name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", flow).strip("_") + ".har"
+
+
+def _without_fields(value, fields: frozenset[str]):
+    if isinstance(value, dict):
+        return {k: _without_fields(v, fields) for k, v in value.items() if k not in fields}
+    if isinstance(value, list):
+        return [_without_fields(v, fields) for v in value]
+    return value
+
+
+def request_key(method: str, url: str, post_data: bytes | None, volatile: tuple[str, ...] = ()) -> str:
+    """
+    Replay lookup key: method, URL without fragment and a hash of the request
+    body. Keys listed in `volatile` are dropped (at any depth) from a JSON
+    body first, so requests that differ only in generated values match.
+    """
+    if post_data and volatile:
+        try:
+            body = json.loads(post_data)
+        except ValueError:
+            pass  # Not JSON: hash the raw body
+        else:
+            post_data = json.dumps(_without_fields(body, frozenset(volatile)), sort_keys=True).encode("utf-8")
+    digest = hashlib.sha256(post_data).hexdigest()[:16] if post_data else "-"
+    return f"{method.upper()} {urldefrag(url)[0]} {digest}"
+
+
+def _merge_headers(headers: list[dict]) -> dict[str, str]:
+    """HAR header list -> dict; repeated headers (Set-Cookie) are joined by newlines as fulfill() expects."""
+    merged: dict[str, str] = {}
+    for header in headers:
+        name = header["name"].lower()
+        merged[name] = f"{merged[name]}\n{header['value']}" if name in merged else header["value"]
+    return merged
+
+
+class HarArchive:
+    """
+    Directory of compact per-flow HAR files plus a shared blob store:
+
+        <root>/<flow>.har          HAR 1.2, bodies referenced by content._file
+        <root>/blobs/ab/<sha256>   response bodies, deduplicated across flows
+    """
+
+    def __init__(self, root: str | pathlib.Path):
+        self.root = pathlib.Path(root)
+        self._blob_cache: dict[str, bytes] = {}
+
+    # --- Recording ---
+    def ingest(self, raw_har: str | pathlib.Path, flow: str, append: bool = False) -> pathlib.Path:
+        """
+        Convert a raw HAR recorded by Playwright (content embedded) into the
+        archive. With `append`, entries are added to an existing flow (several
+        tests recording one page-object flow) instead of replacing it.
+        """
+        raw = json.loads(pathlib.Path(raw_har).read_text(encoding="utf-8"))
+        entries = []
+        for entry in raw["log"]["entries"]:
+            request, response = entry["request"], entry["response"]
+            if response.get("status", 0) <= 0:
+                continue  # Aborted or failed request: nothing to replay
+            post_text = (request.get("postData") or {}).get("text")
+            content = response.get("content") or {}
+            body = self._decode(content)
+            entries.append({
+                "startedDateTime": entry.get("startedDateTime"),
+                "time": entry.get("time", 0),
+                "request": {
+                    "method": request["method"],
+                    "url": request["url"],
+                    "headers": [],
+                    "postData": {"mimeType": (request.get("postData") or {}).get("mimeType", ""),
+                                 "text": post_text} if post_text is not None else None,
+                },
+                "response": {
+                    "status": response["status"],
+                    "statusText": response.get("statusText", ""),
+                    "headers": [h for h in response.get("headers", [])
+                                if h["name"].lower() not in _DROPPED_HEADERS],
+                    "content": {"size": len(body), "mimeType": content.get("mimeType", ""),
+                                "_file": self._store_blob(body)},
+                },
+            })
+
+        path = self.root / flow_file_name(flow)
+        if append and path.exists():
+            entries = json.loads(path.read_text(encoding="utf-8"))["log"]["entries"] + entries
+        path.parent.mkdir(parents=True, exist_ok=True)
+        har = {"log": {"version": "1.2", "creator": {"name": "har_archive", "version": "1"}, "entries": entries}}
+        path.write_text(json.dumps(har, separators=(",", ":")), encoding="utf-8")
+        return path
+
+    @staticmethod
+    def _decode(content: dict) -> bytes:
+        text = content.get("text") or ""
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+
+    def _store_blob(self, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        relative = f"blobs/{digest[:2]}/{digest}"
+        blob = self.root / relative
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            blob.write_bytes(body)
+        return relative
+
+    # --- Replay ---
+    def has_flow(self, flow: str) -> bool:
+        return (self.root / flow_file_name(flow)).exists()
+
+    def _load_blob(self, relative: str) -> bytes:
+        if relative not in self._blob_cache:
+            self._blob_cache[relative] = (self.root / relative).read_bytes()
+        return self._blob_cache[relative]
+
+    def replay(self, context: BrowserContext, flow: str, strict: bool = True,
+               volatile: tuple[str, ...] = ()) -> list[str]:
+        """
+        Serve every request of `context` from the recorded flow.
+
+        Responses recorded for the same request are replayed in order (the
+        last one repeats), so stateful flows like "cart empty, then one item"
+        play back faithfully. Unmatched requests are aborted when `strict`
+        (and listed in the returned list, filled while the context runs) or
+        passed through to the network when lenient. JSON body fields named in
+        `volatile` are ignored when matching (see request_key).
+        """
+        har = json.loads((self.root / flow_file_name(flow)).read_text(encoding="utf-8"))
+        queues: dict[str, list[dict]] = defaultdict(list)
+        for entry in har["log"]["entries"]:
+            post_text = (entry["request"].get("postData") or {}).get("text")
+            key = request_key(entry["request"]["method"], entry["request"]["url"],
+                              post_text.encode("utf-8") if post_text is not None else None, volatile)
+            queues[key].append(entry["response"])
+        served: dict[str, int] = defaultdict(int)
+        misses: list[str] = []
+
+        def handle(route: Route):
+            request = route.request
+            key = request_key(request.method, request.url, request.post_data_buffer, volatile)
+            responses = queues.get(key)
+            if not responses:
+                if strict:
+                    misses.append(key)
+                    route.abort()
+                else:
+                    route.fallback()
+                return
+            response = responses[min(served[key], len(responses) - 1)]
+            served[key] += 1
+            route.fulfill(
+                status=response["status"],
+                headers=_merge_headers(response["headers"]),
+                body=self._load_blob(response["content"]["_file"]),
+            )
+
+        context.route("**/*", handle)
+        return misses
@@ -0,0 +1,13 @@
+# playwright_py/utils/impact_map.py
+# ------------------------------------------------------------
+# Test impact map – the implementation shared with the Selenium suite
+# (shared/impact_map.py); see there for how tests are selected.
+# ------------------------------------------------------------
+
+from utils.shared import load_shared
+
+_impact_map = load_shared("impact_map")
+
+ImpactMap = _impact_map.ImpactMap
+ImpactPlugin = _impact_map.ImpactPlugin
+repo_root = _impact_map.repo_root
@@ -0,0 +1,41 @@
+# playwright_py/utils/launch_profiles.py
+# ------------------------------------------------------------
+# Browser launch profiles – mirrors Selenium utils/launch_profiles.py
+# Each profile is a set of browser_type.launch() keyword arguments:
+#   headed        visible window, maximized
+#   headless      new headless mode (full Chromium, channel="chromium")
+#   ci            headless shell, no sandbox, no extensions or background services
+#   fixed-window  visible window with a fixed size instead of maximizing
+# ------------------------------------------------------------
+
+from __future__ import annotations
+
+WINDOW_SIZE = "1366,820"  # Same as the context viewport in conftest.py
+
+_CI_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--no-first-run",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+]
+
+PROFILES: dict[str, dict] = {
+    "headed": {"headless": False, "args": ["--start-maximized"]},
+    "headless": {"headless": True, "channel": "chromium", "args": [f"--window-size={WINDOW_SIZE}"]},
+    "ci": {"headless": True, "chromium_sandbox": False, "args": _CI_ARGS},
+    "fixed-window": {"headless": False, "args": [f"--window-size={WINDOW_SIZE}"]},
+}
+
+
+def launch_args(profile: str) -> dict:
+    """Launch keyword arguments of `profile` (a copy); raises ValueError for unknown names."""
+    try:
+        args = PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown launch profile '{profile}' (known: {', '.join(PROFILES)})") from None
+    return {**args, "args": list(args["args"])}
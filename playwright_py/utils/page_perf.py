@@ -0,0 +1,152 @@
+# playwright_py/utils/page_perf.py
+# ------------------------------------------------------------
+# Page-load metrics and budgets – mirrors Selenium utils/page_perf.py
+# Navigation/Resource Timing, transfer bytes, LCP and CLS per page,
+# checked against [perf_budgets] in the repository's config.ini and
+# appended to a JSON-lines run history.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import configparser
+import json
+import os
+import pathlib
+import time
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+from utils.quiescence import wait_until_settled, wait_until_settled_async
+
+CONFIG_FILE = pathlib.Path(__file__).resolve().parents[2] / "config.ini"
+
+_METRICS_JS = """async () => {
+  const nav = performance.getEntriesByType("navigation")[0];
+  const resources = performance.getEntriesByType("resource");
+  let lcp = null, cls = 0;
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+        .observe({type, buffered: true});
+    } catch (e) { /* entry type not supported by this browser */ }
+  };
+  observe("largest-contentful-paint", (e) => { lcp = e.renderTime || e.startTime; });
+  observe("layout-shift", (e) => { if (!e.hadRecentInput) cls += e.value; });
+  await new Promise((resolve) => setTimeout(resolve, 50));  // buffered entries arrive async
+
+  const bytes = resources.reduce((sum, r) => sum + (r.transferSize || 0), nav ? nav.transferSize || 0 : 0);
+  return {
+    url: location.href,
+    ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    lcp_ms: lcp,
+    cls,
+    transfer_kb: bytes / 1024,
+    requests: resources.length,
+    slowest_resources: [...resources].sort((a, b) => b.duration - a.duration).slice(0, 5)
+      .map((r) => ({name: r.name, type: r.initiatorType, duration_ms: r.duration, transfer_bytes: r.transferSize})),
+  };
+}"""
+
+METRIC_NAMES = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "lcp_ms", "cls", "transfer_kb", "requests")
+
+
+def _rounded(metrics: dict) -> dict:
+    for name in METRIC_NAMES:
+        if isinstance(metrics.get(name), float):
+            metrics[name] = round(metrics[name], 4 if name == "cls" else 1)
+    return metrics
+
+
+def collect_page_metrics(page: Page) -> dict:
+    """Page-load metrics of the document currently shown in `page`."""
+    return _rounded(page.evaluate(_METRICS_JS))
+
+
+async def collect_page_metrics_async(page: AsyncPage) -> dict:
+    """collect_page_metrics() for an async_api page."""
+    return _rounded(await page.evaluate(_METRICS_JS))
+
+
+def load_budgets() -> dict[str, dict[str, float]]:
+    """[perf_budgets] from the shared config.ini as {page: {metric: limit}}."""
+    parser = configparser.ConfigParser()
+    parser.read(CONFIG_FILE)
+    budgets: dict[str, dict[str, float]] = {}
+    if parser.has_section("perf_budgets"):
+        for key, value in parser.items("perf_budgets"):
+            page, _, metric = key.partition(".")
+            budgets.setdefault(page, {})[metric] = float(value)
+    return budgets
+
+
+def check_budgets(page: str, metrics: dict, budgets: dict[str, dict[str, float]]) -> list[str]:
+    """Human-readable violations of `page`'s budgets (empty when within budget)."""
+    violations = []
+    for metric, limit in budgets.get(page, {}).items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page}.{metric} = {value:g} exceeds budget {limit:g}")
+    return violations
+
+
+class PerfRecorder:
+    """
+    Collects captures from page-object navigation, checks budgets and
+    appends each capture to GROCERYMATE_PERF_HISTORY_FILE
+    (default test-results/perf-history.jsonl).
+    """
+
+    def __init__(self):
+        self.current_test = ""
+        self.captures: list[dict] = []
+        self._budgets: dict[str, dict[str, float]] | None = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """Collection switch: GROCERYMATE_PERF_COLLECT=1 (same variable as the Selenium suite)."""
+        return os.getenv("GROCERYMATE_PERF_COLLECT", "0").lower() in ("1", "true", "yes", "on")
+
+    @property
+    def budgets(self) -> dict[str, dict[str, float]]:
+        if self._budgets is None:
+            self._budgets = load_budgets()
+        return self._budgets
+
+    def capture(self, page: Page, name: str, measure: bool | None = None) -> dict | None:
+        """Measure the current page as `name` if collection is on (or `measure` forces it)."""
+        if not (self.enabled() if measure is None else measure):
+            return None
+
+        wait_until_settled(page)
+        return self._record(name, collect_page_metrics(page))
+
+    async def capture_async(self, page: AsyncPage, name: str, measure: bool | None = None) -> dict | None:
+        """capture() for an async_api page."""
+        if not (self.enabled() if measure is None else measure):
+            return None
+
+        await wait_until_settled_async(page)
+        return self._record(name, await collect_page_metrics_async(page))
+
+    def _record(self, name: str, metrics: dict) -> dict:
+        entry = {
+            "test": self.current_test,
+            "page": name,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "build": os.getenv("BUILD_ID") or os.getenv("GITHUB_SHA") or "",
+            "metrics": metrics,
+            "violations": check_budgets(name, metrics, self.budgets),
+        }
+        self.captures.append(entry)
+
+        path = pathlib.Path(os.getenv("GROCERYMATE_PERF_HISTORY_FILE", "test-results/perf-history.jsonl"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+        return entry
+
+    def captures_for(self, test: str) -> list[dict]:
+        return [c for c in self.captures if c["test"] == test]
+
+
+perf_recorder = PerfRecorder()
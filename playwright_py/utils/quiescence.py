@@ -0,0 +1,135 @@
+# playwright_py/utils/quiescence.py
+# ------------------------------------------------------------
+# wait_until_settled – mirrors Selenium utils/quiescence.py
+# Waits on in-page signals (no fetch/XHR in flight, no DOM mutation
+# for a quiet window, frames rendering) instead of fixed timeouts.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import os
+import time
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
+from playwright.sync_api import BrowserContext, Page, TimeoutError as PWTimeout
+
+# Same probe as the Selenium suite: counts in-flight requests, records mutations
+PROBE_JS = """
+(function (fromInitScript) {
+  if (window.__uiQuiet) return;
+  var state = {pending: 0, requests: {}, nextId: 0, mutations: 0, quietFrames: 0,
+               lastMutation: performance.now(), fromInitScript: fromInitScript};
+  window.__uiQuiet = state;
+
+  function track(label) {
+    var id = ++state.nextId;
+    state.pending++;
+    state.requests[id] = label;
+    return function () {
+      if (id in state.requests) { delete state.requests[id]; state.pending--; }
+    };
+  }
+
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+      var url = typeof input === "string" ? input : (input && input.url) || String(input);
+      var method = (init && init.method) || (input && input.method) || "GET";
+      var done = track(String(method).toUpperCase() + " " + url);
+      return originalFetch.apply(this, arguments).then(
+        function (response) { done(); return response; },
+        function (error) { done(); throw error; });
+    };
+  }
+
+  var originalOpen = XMLHttpRequest.prototype.open;
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__uiQuietLabel = String(method).toUpperCase() + " " + url;
+    return originalOpen.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function () {
+    this.addEventListener("loadend", track(this.__uiQuietLabel || "XHR"));
+    return originalSend.apply(this, arguments);
+  };
+
+  new MutationObserver(function (records) {
+    state.mutations += records.length;
+    state.lastMutation = performance.now();
+  }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+})(%s);
+"""
+
+# Polled every animation frame; true after two consecutive quiet frames
+_SETTLED_JS = "(quietMs) => {" + PROBE_JS % "false" + """
+  var s = window.__uiQuiet;
+  var quiet = document.readyState === "complete" && s.pending === 0 &&
+              performance.now() - s.lastMutation >= quietMs;
+  s.quietFrames = quiet ? s.quietFrames + 1 : 0;
+  return s.quietFrames >= 2;
+}"""
+
+_DIAGNOSE_JS = """() => {
+  var s = window.__uiQuiet || {requests: {}, lastMutation: performance.now(), mutations: 0};
+  return {pending: Object.values(s.requests), mutations: s.mutations,
+          msSinceMutation: performance.now() - s.lastMutation, readyState: document.readyState};
+}"""
+
+
+class UiNotSettledError(PWTimeout):
+    """The page kept changing (or kept loading) past the timeout; the message says why."""
+
+
+def install_quiescence_probe(context: BrowserContext) -> None:
+    """Install the probe in every page the context opens, before any app script runs."""
+    context.add_init_script(PROBE_JS % "true")
+
+
+def _settle_limits(quiet_ms: int | None, timeout: float | None) -> tuple[int, float]:
+    quiet_ms = int(os.getenv("GROCERYMATE_QUIESCENCE_QUIET_MS", "300")) if quiet_ms is None else quiet_ms
+    timeout = float(os.getenv("GROCERYMATE_QUIESCENCE_TIMEOUT", "10")) if timeout is None else timeout
+    return quiet_ms, timeout
+
+
+def _not_settled(timeout: float, state: dict) -> UiNotSettledError:
+    pending = ", ".join(state["pending"]) or "none"
+    return UiNotSettledError(
+        f"UI did not settle within {timeout:.1f}s: "
+        f"{len(state['pending'])} request(s) in flight [{pending}], "
+        f"last DOM mutation {state['msSinceMutation']:.0f}ms ago "
+        f"({state['mutations']} mutations total), readyState={state['readyState']}"
+    )
+
+
+def wait_until_settled(page: Page, quiet_ms: int | None = None, timeout: float | None = None) -> float:
+    """
+    Block until the UI has settled and return the seconds spent waiting.
+
+    Defaults come from GROCERYMATE_QUIESCENCE_QUIET_MS (300) and
+    GROCERYMATE_QUIESCENCE_TIMEOUT in seconds (10), like config.ini
+    [quiescence] for the Selenium suite. Raises UiNotSettledError listing
+    the requests still in flight and recent DOM activity.
+    """
+    quiet_ms, timeout = _settle_limits(quiet_ms, timeout)
+    start = time.monotonic()
+    try:
+        page.wait_for_function(_SETTLED_JS, arg=quiet_ms, timeout=timeout * 1000)
+    except PWTimeout:
+        raise _not_settled(timeout, page.evaluate(_DIAGNOSE_JS)) from None
+    return time.monotonic() - start
+
+
+# --- asyncio API (pages_async/) ---
+async def install_quiescence_probe_async(context: AsyncBrowserContext) -> None:
+    """install_quiescence_probe() for an async_api context."""
+    await context.add_init_script(PROBE_JS % "true")
+
+
+async def wait_until_settled_async(page: AsyncPage, quiet_ms: int | None = None,
+                                   timeout: float | None = None) -> float:
+    """wait_until_settled() for an async_api page; other pages keep running while it waits."""
+    quiet_ms, timeout = _settle_limits(quiet_ms, timeout)
+    start = time.monotonic()
+    try:
+        await page.wait_for_function(_SETTLED_JS, arg=quiet_ms, timeout=timeout * 1000)
+    except PWTimeout:
+        raise _not_settled(timeout, await page.evaluate(_DIAGNOSE_JS)) from None
+    return time.monotonic() - start
@@ -0,0 +1,107 @@
+# playwright_py/utils/resource_blocking.py
+# ------------------------------------------------------------
+# Resource blocking profiles – mirrors Selenium utils/resource_blocking.py
+# full: block nothing; no-media: images, video/audio, web fonts;
+# minimal: no-media + analytics / third-party scripts and hosted fonts.
+# Blocked requests are aborted in context.route and priced with sizes
+# learned from earlier responses (unknown ones are reported unsized).
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import json
+import os
+import pathlib
+from fnmatch import fnmatch
+from playwright.sync_api import BrowserContext, Response, Route
+
+_MEDIA_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "bmp",
+                     "mp4", "webm", "ogg", "mp3", "wav",
+                     "woff", "woff2", "ttf", "otf", "eot")
+MEDIA_PATTERNS = tuple(p for ext in _MEDIA_EXTENSIONS for p in (f"*.{ext}", f"*.{ext}?*"))
+MEDIA_RESOURCE_TYPES = ("image", "media", "font")
+
+THIRD_PARTY_PATTERNS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*doubleclick.net/*",
+    "*facebook.net/*",
+    "*facebook.com/tr*",
+    "*hotjar.com/*",
+    "*clarity.ms/*",
+    "*segment.com/*",
+    "*segment.io/*",
+    "*fonts.googleapis.com/*",
+    "*fonts.gstatic.com/*",
+)
+
+# profile -> (URL patterns, Playwright resource types)
+PROFILES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "full": ((), ()),
+    "no-media": (MEDIA_PATTERNS, MEDIA_RESOURCE_TYPES),
+    "minimal": (MEDIA_PATTERNS + THIRD_PARTY_PATTERNS, MEDIA_RESOURCE_TYPES),
+}
+
+
+def default_profile() -> str:
+    """GROCERYMATE_BLOCKING_PROFILE (same variable as the Selenium suite), default 'full'."""
+    return os.getenv("GROCERYMATE_BLOCKING_PROFILE", "full")
+
+
+class ResourceSizes:
+    """Known transfer size per URL, persisted between runs."""
+
+    def __init__(self, path: str | pathlib.Path = "test-results/resource-sizes.json"):
+        self.path = pathlib.Path(path)
+        try:
+            self.sizes: dict[str, int] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.sizes = {}
+
+    def learn(self, response: Response) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and int(length) > 0:
+            self.sizes[response.url] = int(length)
+
+    def estimate(self, url: str) -> int | None:
+        """Learned size in bytes, or None when the URL never loaded (blocked hosts are not probed)."""
+        return self.sizes.get(url)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.sizes, indent=0, sort_keys=True), encoding="utf-8")
+
+
+class ResourceBlocker:
+    """Aborts a context's requests that match `profile` and keeps the list of blocked URLs."""
+
+    def __init__(self, context: BrowserContext, profile: str, sizes: ResourceSizes):
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown resource blocking profile '{profile}' (known: {', '.join(PROFILES)})")
+        self.context = context
+        self.profile = profile
+        self.sizes = sizes
+        self.patterns, self.resource_types = PROFILES[profile]
+        self.blocked: list[str] = []
+        if self.patterns or self.resource_types:
+            context.route("**/*", self._handle)
+        context.on("response", sizes.learn)
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.is_navigation_request():
+            route.fallback()  # Never block a document, even an image URL opened directly
+        elif request.resource_type in self.resource_types or any(fnmatch(request.url, p) for p in self.patterns):
+            self.blocked.append(request.url)
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def report(self) -> dict:
+        """Blocked request count and estimated bytes saved (unknown sizes count as unsized)."""
+        estimates = [self.sizes.estimate(url) for url in self.blocked]
+        return {
+            "profile": self.profile,
+            "blocked_requests": len(self.blocked),
+            "blocked_bytes": sum(size for size in estimates if size),
+            "unsized_requests": sum(size is None for size in estimates),
+        }
@@ -0,0 +1,20 @@
+# playwright_py/utils/settings.py
+# ------------------------------------------------------------
+# Shared settings for the Playwright suite (env / .env driven)
+# Variable names match the Selenium suite's GROCERYMATE_<SECTION>_<KEY>
+# overrides of config.ini, so one environment configures both.
+# ------------------------------------------------------------
+
+import os
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Site under test, e.g. http://127.0.0.1:8765 for the bundled stand-in
+BASE_URL = os.getenv("GROCERYMATE_APP_BASE_URL", "https://grocerymate.masterschool.com").rstrip("/")
+
+
+def is_local_base_url() -> bool:
+    """True when BASE_URL points at this machine (e.g. the bundled stand-in)."""
+    return urlsplit(BASE_URL).hostname in ("127.0.0.1", "localhost", "::1")
@@ -0,0 +1,31 @@
+# playwright_py/utils/shared.py
+# ------------------------------------------------------------
+# load_shared – modules of the repository's shared/ package
+# Code used by both suites lives once in shared/. It is loaded by path:
+# putting the repository root on sys.path would let the Selenium pages/
+# package shadow this suite's pages/.
+# ------------------------------------------------------------
+
+from __future__ import annotations
+import importlib.util
+import pathlib
+import sys
+from types import ModuleType
+
+SHARED_DIR = pathlib.Path(__file__).resolve().parents[2] / "shared"
+
+
+def load_shared(name: str) -> ModuleType:
+    """The module shared/<name>.py, loaded once as shared.<name>."""
+    qualified = f"shared.{name}"
+    module = sys.modules.get(qualified)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(qualified, SHARED_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified] = module  # Registered first: dataclasses look their module up while executing
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[qualified]
+            raise
+    return module
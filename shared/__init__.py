@@ -0,0 +1,5 @@
+"""
+Code used by both suites, kept free of suite imports (utils, pages). The
+Selenium suite imports it from the repository root; playwright_py loads it
+by path through playwright_py/utils/shared.py.
+"""
@@ -0,0 +1,275 @@
+"""
+Change-based test selection over the page-object layer.
+
+Recording (every run): while a test runs, a profile hook notes which
+page-object methods were called; an AST index of the page files adds the
+class constants (locators such as ProductPage._STAR_LIST) those methods
+read. The result is merged into a JSON impact map: test -> symbols.
+
+Selection (--impact-base REF): the files changed since REF (committed,
+staged, unstaged and untracked) are mapped to tests:
+  - page-object files: only the methods / constants whose code changed,
+    compared on the AST (comments and formatting don't count); a change
+    to module-level code affects every symbol of the file
+  - test files: every test in them
+  - ignored files (docs, the other suite): nothing
+  - anything else (conftest.py, utils/, config.ini, ...): the full suite
+Tests missing from the map (new tests) always run.
+"""
+
+import ast
+import json
+import re
+import subprocess
+import sys
+import threading
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+_CONSTANT = re.compile(r"^_?[A-Z][A-Z0-9_]*$")
+_MODULE = "<module>"
+
+
+def page_symbols(source: str) -> dict[str, str]:
+    """
+    Symbol -> normalized AST of a page-object module:
+    "Class.method", "Class._CONSTANT", "Class.<class>" (bases, decorators,
+    other class-body code), top-level functions and "<module>" for the rest.
+    """
+    symbols: dict[str, str] = {}
+    module_rest = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            class_rest = [ast.dump(base) for base in node.bases] + [ast.dump(d) for d in node.decorator_list]
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    symbols[f"{node.name}.{item.name}"] = ast.dump(item)
+                elif isinstance(item, ast.Assign) and all(isinstance(t, ast.Name) for t in item.targets):
+                    for target in item.targets:
+                        symbols[f"{node.name}.{target.id}"] = ast.dump(item.value)
+                elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                    symbols[f"{node.name}.{item.target.id}"] = ast.dump(item)
+                elif not (isinstance(item, ast.Expr) and isinstance(item.value, ast.Constant)):
+                    class_rest.append(ast.dump(item))  # Docstrings are ignored
+            symbols[f"{node.name}.<class>"] = "\n".join(class_rest)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[node.name] = ast.dump(node)
+        elif not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)):
+            module_rest.append(ast.dump(node))
+    symbols[_MODULE] = "\n".join(module_rest)
+    return symbols
+
+
+def constants_read(source: str) -> dict[str, set[str]]:
+    """"Class.method" -> the "Class._CONSTANT" symbols the method reads via self/cls/Class."""
+    reads: dict[str, set[str]] = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                reads[f"{node.name}.{item.name}"] = {
+                    f"{node.name}.{sub.attr}" for sub in ast.walk(item)
+                    if isinstance(sub, ast.Attribute) and _CONSTANT.match(sub.attr)
+                    and isinstance(sub.value, ast.Name) and sub.value.id in ("self", "cls", node.name)
+                }
+    return reads
+
+
+def changed_symbols(old_source: str | None, new_source: str | None) -> set[str]:
+    """Symbols whose code differs between two versions of a page file ({"<module>"} = everything)."""
+    if old_source is None or new_source is None:
+        return {_MODULE}
+    try:
+        old, new = page_symbols(old_source), page_symbols(new_source)
+    except SyntaxError:
+        return {_MODULE}
+    changed = {name for name in old.keys() | new.keys() if old.get(name) != new.get(name)}
+    for name in list(changed):
+        if name.endswith(".<class>"):  # Bases or class-level code: the whole class
+            prefix = name[: -len("<class>")]
+            changed |= {other for other in old.keys() | new.keys() if other.startswith(prefix)}
+    return changed
+
+
+class ImpactMap:
+    """
+    Records page-object symbols per test and selects tests for a change set.
+
+    Paths are relative to the git work tree; `page_dirs`, `test_dirs` and
+    `ignored` (glob patterns) describe this suite's layout in those terms.
+    """
+
+    def __init__(self, map_file: str | Path, repo_root: Path, page_dirs: tuple[str, ...],
+                 test_dirs: tuple[str, ...], ignored: tuple[str, ...] = ()):
+        self.map_file = Path(map_file)
+        self.repo_root = repo_root
+        self.page_dirs = page_dirs
+        self.test_dirs = test_dirs
+        self.ignored = ignored
+        try:
+            self.tests: dict[str, list[str]] = json.loads(self.map_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.tests = {}
+
+        # Page files by absolute path (as in code objects) and their constant reads
+        self._page_files: dict[str, str] = {}
+        self._reads: dict[str, set[str]] = {}
+        for directory in page_dirs:
+            for path in sorted((repo_root / directory).glob("*.py")):
+                relative = path.relative_to(repo_root).as_posix()
+                self._page_files[str(path)] = relative
+                for method, constants in constants_read(path.read_text(encoding="utf-8")).items():
+                    self._reads[f"{relative}::{method}"] = {f"{relative}::{c}" for c in constants}
+        self._current: set[str] | None = None
+        self._recorded: dict[str, list[str]] = {}
+
+    # — recording —
+    def _profile(self, frame, event, arg):
+        if event == "call" and self._current is not None:
+            relative = self._page_files.get(frame.f_code.co_filename)
+            if relative:
+                qualname = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+                method = qualname.split(".<locals>", 1)[0]
+                self._current.add(f"{relative}::{method}")
+
+    def start(self) -> bool:
+        """Begin recording a test; False when another profiler is active (nothing recorded)."""
+        if sys.getprofile() is not None:
+            return False
+        self._current = set()
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)  # Threads started by the test (crawler, pools)
+        return True
+
+    def stop(self, nodeid: str) -> None:
+        sys.setprofile(None)
+        threading.setprofile(None)
+        symbols = set(self._current or ())
+        for method in list(symbols):
+            symbols |= self._reads.get(method, set())
+        self.tests[nodeid] = self._recorded[nodeid] = sorted(symbols)
+        self._current = None
+
+    def save(self, worker: str | None = None) -> None:
+        """
+        Write the map. An xdist worker writes only what it recorded, next to
+        the map (<map>.<worker>.json); the controller merges those files in.
+        """
+        if worker:
+            path = self.map_file.with_name(f"{self.map_file.stem}.{worker}.json")
+            path.write_text(json.dumps(self._recorded), encoding="utf-8")
+            return
+        for path in self.map_file.parent.glob(f"{self.map_file.stem}.gw*.json"):
+            self.tests.update(json.loads(path.read_text(encoding="utf-8")))
+            path.unlink()
+        self.map_file.parent.mkdir(parents=True, exist_ok=True)
+        self.map_file.write_text(json.dumps(self.tests, indent=1, sort_keys=True), encoding="utf-8")
+
+    # — selection —
+    def _git(self, *args: str) -> str:
+        return subprocess.run(["git", *args], cwd=self.repo_root, capture_output=True,
+                              text=True, check=True).stdout
+
+    def changed_files(self, base: str) -> list[str]:
+        diff = self._git("diff", "--name-only", base)
+        untracked = self._git("ls-files", "--others", "--exclude-standard")
+        return sorted(set((diff + untracked).split()))
+
+    def _old_source(self, base: str, path: str) -> str | None:
+        try:
+            return self._git("show", f"{base}:{path}")
+        except subprocess.CalledProcessError:
+            return None  # New file
+
+    def impact(self, base: str) -> tuple[set[str] | None, set[str], str]:
+        """
+        (changed symbols, changed test files, reason). Changed symbols is
+        None when the full suite must run; reason says why.
+        """
+        try:
+            files = self.changed_files(base)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            return None, set(), f"git diff against {base} failed ({exc})"
+
+        symbols: set[str] = set()
+        test_files: set[str] = set()
+        for path in files:
+            if any(fnmatch(path, pattern) for pattern in self.ignored):
+                continue
+            directory = path.rsplit("/", 1)[0] if "/" in path else ""
+            if directory in self.page_dirs and path.endswith(".py"):
+                current = self.repo_root / path
+                new_source = current.read_text(encoding="utf-8") if current.exists() else None
+                symbols |= {f"{path}::{s}" for s in changed_symbols(self._old_source(base, path), new_source)}
+            elif directory in self.test_dirs and Path(path).name.startswith("test_"):
+                test_files.add(path)
+            else:
+                return None, set(), f"{path} is shared infrastructure"
+        return symbols, test_files, f"{len(files)} changed file(s)"
+
+    def affects(self, nodeid_path: str, nodeid: str, symbols: set[str], test_files: set[str]) -> bool:
+        """Whether the test must run for the change set."""
+        if nodeid_path in test_files or nodeid not in self.tests:
+            return True
+        whole_files = {s.split("::", 1)[0] for s in symbols if s.endswith(f"::{_MODULE}")}
+        return any(s in symbols or s.split("::", 1)[0] in whole_files for s in self.tests[nodeid])
+
+
+class ImpactPlugin:
+    """pytest glue: record every test, deselect unaffected ones with --impact-base."""
+
+    def __init__(self, impact_map: ImpactMap, base: str | None, record: bool):
+        self.map = impact_map
+        self.base = base
+        self.record = record
+        self.summary = ""
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.base:
+            return
+        symbols, test_files, reason = self.map.impact(self.base)
+        if symbols is None:
+            self.summary = f"full suite: {reason}"
+            return
+        selected, deselected = [], []
+        for item in items:
+            path = (config.rootpath / item.nodeid.split("::", 1)[0]).relative_to(self.map.repo_root).as_posix()
+            (selected if self.map.affects(path, item.nodeid, symbols, test_files) else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = (f"{len(selected)} of {len(selected) + len(deselected)} test(s) selected "
+                        f"for {len(symbols)} changed page-object symbol(s), {reason} since {self.base}")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        recording = self.record and self.map.start()
+        try:
+            yield
+        finally:
+            if recording:
+                self.map.stop(item.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if self.record:
+            worker = getattr(session.config, "workerinput", {}).get("workerid")
+            self.map.save(worker)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary:
+            terminalreporter.section("impact selection")
+            terminalreporter.write_line(self.summary)
+
+
+def repo_root(start: Path) -> Path:
+    """The git work tree containing `start` (or `start` itself outside git)."""
+    try:
+        top = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=start,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        return Path(top)
+    except (OSError, subprocess.CalledProcessError):
+        return start
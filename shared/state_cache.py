@@ -0,0 +1,70 @@
+"""
+Disk cache of authenticated browser state, shared by both suites: the
+Selenium SessionStateCache (utils/session_cache.py) and the Playwright
+AuthStateCache (playwright_py/utils/auth_state.py) add how they are
+configured and how state is captured from / applied to their browser.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+# Same layout as Playwright's storage_state(), so one file can seed both backends
+EMPTY_STATE = {"cookies": [], "origins": []}
+
+
+class StateCache:
+    """
+    Cookies and localStorage per account (the email the state was logged in
+    with), one JSON file each. An entry only answers for the account that
+    captured it, and expires after `ttl_seconds` or when the earliest
+    session cookie expires, whichever comes first.
+    """
+
+    def __init__(self, directory: str | Path, ttl_seconds: float):
+        self._directory = Path(directory)
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _account_key(account: str) -> str:
+        return account.strip().lower()
+
+    def _path(self, account: str) -> Path:
+        digest = hashlib.sha1(self._account_key(account).encode("utf-8")).hexdigest()[:16]
+        return self._directory / f"{digest}.json"
+
+    def load(self, account: str) -> dict | None:
+        """
+        The cached state ({"cookies", "origins"}, usable as a Playwright
+        storage_state) for `account`, or None if missing, corrupt, expired or
+        captured for another account.
+        """
+        try:
+            data = json.loads(self._path(account).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("account") != self._account_key(account):
+            return None
+        if data.get("expires_at", 0) <= time.time():
+            self.invalidate(account)
+            return None
+        return {key: data.get(key, default) for key, default in EMPTY_STATE.items()}
+
+    def save(self, account: str, state: dict) -> None:
+        """Persist `state` as the login of `account`, stamping it with an expiry time."""
+        expires_at = time.time() + self._ttl
+        cookie_expiries = [c["expires"] for c in state.get("cookies", []) if c.get("expires", -1) > 0]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(account)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({**EMPTY_STATE, **state, "account": self._account_key(account),
+                                   "expires_at": expires_at}), encoding="utf-8")
+        tmp.replace(path)
+
+    def invalidate(self, account: str) -> None:
+        """Forget the cached state for `account` (e.g. after the server revoked it)."""
+        self._path(account).unlink(missing_ok=True)
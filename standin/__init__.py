@@ -0,0 +1,3 @@
+from standin.server import StandInServer, StoreState
+
+__all__ = ["StandInServer", "StoreState"]
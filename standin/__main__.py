@@ -0,0 +1,29 @@
+"""Run the GroceryMate stand-in: python -m standin --port 8765 --latency-ms 50"""
+
+import argparse
+
+from standin.server import StandInServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local GroceryMate stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every response")
+    parser.add_argument("--catalog-size", type=int, default=12, help="number of products (min. the 12 seeded)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port, latency_ms=args.latency_ms, verbose=args.verbose,
+                           catalog_size=args.catalog_size)
+    print(f"GroceryMate stand-in listening on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+import json
+import re
+import secrets
+import threading
+import time
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from utils.account_pool import load_accounts
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+_CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".js": "application/javascript",
+                  ".css": "text/css", ".svg": "image/svg+xml"}
+
+SEED_PRODUCTS = [
+    {"id": "1", "name": "Organic Bananas", "price": 2.49, "discountPrice": None},
+    {"id": "2", "name": "Red Apples", "price": 3.19, "discountPrice": 2.79},
+    {"id": "3", "name": "Whole Milk 1L", "price": 1.29, "discountPrice": None},
+    {"id": "4", "name": "Sourdough Bread", "price": 4.50, "discountPrice": None},
+    {"id": "5", "name": "Free-Range Eggs (10)", "price": 3.99, "discountPrice": 3.49},
+    {"id": "6", "name": "Cheddar Cheese", "price": 5.75, "discountPrice": None},
+    {"id": "7", "name": "Basmati Rice 1kg", "price": 2.99, "discountPrice": None},
+    {"id": "8", "name": "Extra Virgin Olive Oil", "price": 8.90, "discountPrice": 7.90},
+    {"id": "9", "name": "Dark Chocolate 85%", "price": 2.20, "discountPrice": None},
+    {"id": "10", "name": "Red Wine Merlot", "price": 11.50, "discountPrice": None},
+    {"id": "11", "name": "Ground Coffee 500g", "price": 6.49, "discountPrice": 5.99},
+    {"id": "12", "name": "Greek Yogurt", "price": 1.89, "discountPrice": None},
+]
+
+SEED_REVIEWS = [
+    ("1", "Anna", 5, "Sweet and perfectly ripe."),
+    ("1", "Ben", 4, "Good bananas, a bit green."),
+    ("1", "Chloe", 3, "Okay for the price."),
+    ("2", "Anna", 4, "Crunchy and fresh."),
+    ("3", "Ben", 5, "Tastes like farm milk."),
+    ("6", "Chloe", 2, "Too mild for my taste."),
+    ("6", "Dan", 4, "Great on toast."),
+    ("10", "Dan", 5, "Lovely with dinner."),
+]
+
+
+def filler_product(index: int) -> dict:
+    """Generated catalog entry used when the stand-in runs with more than the seed products."""
+    return {"id": str(index), "name": f"Pantry Item {index}", "price": round(1 + (index % 9) * 0.75, 2),
+            "discountPrice": None}
+
+
+def parse_quantity(value, default: int) -> int | None:
+    """
+    A cart quantity from a JSON body: a whole number or a string of digits
+    (form inputs send text); `default` when missing or zero, None when invalid.
+    """
+    if value is None or value == "" or value == 0:
+        return default
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str) and re.fullmatch(r"\s*-?\d+\s*", value):
+        return int(value)
+    return None
+
+
+def default_users() -> dict[str, dict]:
+    """Accounts accepted by the stand-in: every test account known to config.ini."""
+    return {a.email.lower(): {"password": a.password, "username": a.username} for a in load_accounts()}
+
+
+class StoreState:
+    """In-memory backend: users, sessions, carts, orders and reviews."""
+
+    def __init__(self, users: dict[str, dict], catalog_size: int = len(SEED_PRODUCTS)):
+        self.lock = threading.RLock()
+        self.users = users
+        self.catalog_size = catalog_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the seed catalog and forget every session, cart, order and review."""
+        with self.lock:
+            self.products = {p["id"]: dict(p) for p in SEED_PRODUCTS}
+            for index in range(len(SEED_PRODUCTS) + 1, self.catalog_size + 1):
+                self.products[str(index)] = filler_product(index)
+            self.sessions: dict[str, str] = {}
+            self.carts: dict[str, dict[str, int]] = {}
+            self.purchased: dict[str, set[str]] = {}
+            self.orders: list[dict] = []
+            self.reviews: dict[str, list[dict]] = {pid: [] for pid in self.products}
+            for pid, author, rating, text in SEED_REVIEWS:
+                self.add_review(pid, author, rating, text, email=None)
+
+    def add_review(self, product_id: str, author: str, rating: int, text: str, email: str | None) -> dict:
+        review = {
+            "id": secrets.token_hex(4),
+            "author": author,
+            "email": email,
+            "rating": rating,
+            "text": text,
+            "createdAt": datetime.now().strftime("%Y-%m-%d"),
+        }
+        self.reviews[product_id].append(review)
+        return review
+
+    def rating_summary(self, product_id: str) -> dict:
+        ratings = [r["rating"] for r in self.reviews[product_id]]
+        average = round(sum(ratings) / len(ratings), 2) if ratings else 0.0
+        return {"average": average, "reviewCount": len(ratings)}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes page, static and /api requests against the server's StoreState."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real site
+    server_version = "GroceryMateStandIn/1.0"
+
+    # — plumbing —
+    def log_message(self, format, *args):  # noqa: A002 - signature from BaseHTTPRequestHandler
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    @property
+    def state(self) -> StoreState:
+        return self.server.state
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None) -> None:
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store" if content_type.startswith("application/json") else "max-age=60")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload, headers: dict | None = None) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _current_email(self) -> str | None:
+        token = None
+        auth = self.headers.get("Authorization", "")
+        if auth.startswith("Bearer "):
+            token = auth[len("Bearer "):].strip()
+        if not token:
+            for part in (self.headers.get("Cookie") or "").split(";"):
+                name, _, value = part.strip().partition("=")
+                if name == "session":
+                    token = value
+        return self.state.sessions.get(token) if token else None
+
+    # — HTTP verbs —
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        path = urlsplit(self.path).path
+        if path.startswith("/api/"):
+            with self.state.lock:
+                self._handle_api(method, path[len("/api"):])
+        elif path == "/__standin__/reset" and method == "POST":
+            self.state.reset()
+            self._send_json(HTTPStatus.OK, {"reset": True})
+        elif path == "/favicon.ico":
+            self._serve_static("favicon.svg")
+        elif path.startswith("/static/"):
+            self._serve_static(path[len("/static/"):])
+        elif method == "GET":
+            self._serve_static("index.html")
+        else:
+            self._send_json(HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Method not allowed"})
+
+    def _serve_static(self, name: str) -> None:
+        file = (STATIC_DIR / name).resolve()
+        if STATIC_DIR not in file.parents or not file.is_file():
+            self._send(HTTPStatus.NOT_FOUND, b"Not found", "text/plain")
+            return
+        self._send(HTTPStatus.OK, file.read_bytes(), _CONTENT_TYPES.get(file.suffix, "application/octet-stream"))
+
+    # — API —
+    _ROUTES = [
+        ("POST", r"/auth/login", "_login"),
+        ("POST", r"/auth/logout", "_logout"),
+        ("GET", r"/auth/me", "_me"),
+        ("GET", r"/products", "_list_products"),
+        ("GET", r"/products/(?P<product_id>[^/]+)", "_get_product"),
+        ("POST", r"/products/(?P<product_id>[^/]+)/reviews", "_create_review"),
+        ("DELETE", r"/products/(?P<product_id>[^/]+)/reviews/me", "_delete_my_review"),
+        ("GET", r"/cart", "_get_cart"),
+        ("POST", r"/cart", "_add_to_cart"),
+        ("PUT", r"/cart/(?P<product_id>[^/]+)", "_set_cart_quantity"),
+        ("DELETE", r"/cart/(?P<product_id>[^/]+)", "_remove_from_cart"),
+        ("DELETE", r"/cart", "_empty_cart"),
+        ("POST", r"/orders", "_place_order"),
+    ]
+
+    def _handle_api(self, method: str, path: str) -> None:
+        for route_method, pattern, handler_name in self._ROUTES:
+            match = re.fullmatch(pattern, path.rstrip("/") or "/")
+            if match and route_method == method:
+                getattr(self, handler_name)(**match.groupdict())
+                return
+        self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def _require_user(self) -> str | None:
+        email = self._current_email()
+        if email is None:
+            self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "Not authenticated"})
+        return email
+
+    def _login(self):
+        body = self._read_json()
+        email = str(body.get("email", "")).strip().lower()
+        user = self.state.users.get(email)
+        if not user or user["password"] != body.get("password"):
+            self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "Invalid email or password"})
+            return
+        token = secrets.token_hex(16)
+        self.state.sessions[token] = email
+        self._send_json(
+            HTTPStatus.OK,
+            {"token": token, "username": user["username"], "email": email},
+            headers={"Set-Cookie": f"session={token}; Path=/; HttpOnly; SameSite=Lax"},
+        )
+
+    def _logout(self):
+        current = self._current_email()
+        for token, email in list(self.state.sessions.items()):
+            if email == current:
+                del self.state.sessions[token]
+        self._send_json(HTTPStatus.OK, {}, headers={"Set-Cookie": "session=; Path=/; Max-Age=0"})
+
+    def _me(self):
+        email = self._require_user()
+        if email:
+            self._send_json(HTTPStatus.OK, {"email": email, "username": self.state.users[email]["username"]})
+
+    def _list_products(self):
+        products = [{**p, **self.state.rating_summary(p["id"])} for p in self.state.products.values()]
+        self._send_json(HTTPStatus.OK, {"products": products})
+
+    def _get_product(self, product_id):
+        product = self.state.products.get(product_id)
+        if product is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Unknown product"})
+            return
+        email = self._current_email()
+        reviews = self.state.reviews[product_id]
+        self._send_json(HTTPStatus.OK, {
+            "product": {**product, **self.state.rating_summary(product_id)},
+            "reviews": [{k: v for k, v in r.items() if k != "email"} | {"mine": email is not None and r["email"] == email}
+                        for r in reviews],
+            "viewer": {
+                "loggedIn": email is not None,
+                "purchased": email is not None and product_id in self.state.purchased.get(email, set()),
+                "reviewed": email is not None and any(r["email"] == email for r in reviews),
+            },
+        })
+
+    def _create_review(self, product_id):
+        email = self._require_user()
+        if not email:
+            return
+        if product_id not in self.state.products:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Unknown product"})
+            return
+        body = self._read_json()
+        rating = body.get("rating")
+        if not isinstance(rating, int) or not 1 <= rating <= 5:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Please select a star rating"})
+            return
+        if product_id not in self.state.purchased.get(email, set()):
+            self._send_json(HTTPStatus.FORBIDDEN, {"error": "Only customers who bought this product can review it"})
+            return
+        if any(r["email"] == email for r in self.state.reviews[product_id]):
+            self._send_json(HTTPStatus.CONFLICT, {"error": "You have already reviewed this product"})
+            return
+        text = str(body.get("text", ""))[:500]
+        # Mirrors the live site's known issue: the comment is echoed back but not stored
+        review = self.state.add_review(product_id, self.state.users[email]["username"], rating, "", email)
+        self._send_json(HTTPStatus.CREATED, {
+            "review": {k: v for k, v in review.items() if k != "email"} | {"text": text, "mine": True},
+            **self.state.rating_summary(product_id),
+        })
+
+    def _delete_my_review(self, product_id):
+        email = self._require_user()
+        if not email:
+            return
+        reviews = self.state.reviews.get(product_id, [])
+        mine = [r for r in reviews if r["email"] == email]
+        if not mine:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "No review to delete"})
+            return
+        reviews.remove(mine[0])
+        self._send_json(HTTPStatus.OK, {"deleted": mine[0]["id"], **self.state.rating_summary(product_id)})
+
+    def _cart_payload(self, email: str) -> dict:
+        items = []
+        for pid, quantity in self.state.carts.get(email, {}).items():
+            product = self.state.products[pid]
+            unit = product["discountPrice"] or product["price"]
+            items.append({"productId": pid, "name": product["name"], "quantity": quantity, "unitPrice": unit})
+        subtotal = round(sum(i["unitPrice"] * i["quantity"] for i in items), 2)
+        shipment = 0.0 if subtotal >= 50 or not items else 4.99
+        return {"items": items, "subtotal": subtotal, "shipment": shipment, "total": round(subtotal + shipment, 2)}
+
+    def _get_cart(self):
+        email = self._require_user()
+        if email:
+            self._send_json(HTTPStatus.OK, self._cart_payload(email))
+
+    def _add_to_cart(self):
+        email = self._require_user()
+        if not email:
+            return
+        body = self._read_json()
+        product_id = str(body.get("productId", ""))
+        quantity = parse_quantity(body.get("quantity"), 1)
+        if product_id not in self.state.products or quantity is None or quantity < 1:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid product or quantity"})
+            return
+        cart = self.state.carts.setdefault(email, {})
+        cart[product_id] = cart.get(product_id, 0) + quantity
+        self._send_json(HTTPStatus.OK, self._cart_payload(email))
+
+    def _set_cart_quantity(self, product_id):
+        email = self._require_user()
+        if not email:
+            return
+        quantity = parse_quantity(self._read_json().get("quantity"), 0)
+        if quantity is None:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid quantity"})
+            return
+        cart = self.state.carts.setdefault(email, {})
+        if product_id not in cart:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not in cart"})
+            return
+        if quantity < 1:
+            del cart[product_id]
+        else:
+            cart[product_id] = quantity
+        self._send_json(HTTPStatus.OK, self._cart_payload(email))
+
+    def _remove_from_cart(self, product_id):
+        email = self._require_user()
+        if not email:
+            return
+        if self.state.carts.get(email, {}).pop(product_id, None) is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not in cart"})
+            return
+        self._send_json(HTTPStatus.OK, self._cart_payload(email))
+
+    def _empty_cart(self):
+        email = self._require_user()
+        if not email:
+            return
+        removed = len(self.state.carts.pop(email, {}))
+        self._send_json(HTTPStatus.OK, {**self._cart_payload(email), "removed": removed})
+
+    def _place_order(self):
+        email = self._require_user()
+        if not email:
+            return
+        body = self._read_json()
+        missing = [f for f in ("street", "city", "postalCode", "cardNumber", "nameOnCard", "expiration", "cvv")
+                   if not str(body.get(f, "")).strip()]
+        cart = self.state.carts.get(email, {})
+        if missing or not cart:
+            error = f"Missing fields: {', '.join(missing)}" if missing else "Your cart is empty"
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": error})
+            return
+        order = {"orderId": secrets.token_hex(6), **self._cart_payload(email), "placedAt": date.today().isoformat()}
+        self.state.orders.append({**order, "email": email})
+        self.state.purchased.setdefault(email, set()).update(cart)
+        self.state.carts[email] = {}
+        self._send_json(HTTPStatus.CREATED, order)
+
+
+class StandInServer:
+    """
+    Local GroceryMate stand-in serving /, /auth, /store, /product/<id> and
+    /checkout with the DOM contract the page objects rely on, plus the /api
+    endpoints listed in config.ini [api]. State lives in memory.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0,
+                 users: dict[str, dict] | None = None, verbose: bool = False,
+                 catalog_size: int = len(SEED_PRODUCTS)):
+        """
+        Args:
+            host, port: Listen address (port 0 picks a free port).
+            latency_ms: Artificial delay added to every response.
+            users: {email: {'password', 'username'}}; defaults to the test accounts.
+            verbose: Log each request to stderr.
+            catalog_size: Number of products; entries beyond the seed catalog
+                are generated "Pantry Item N" products (e.g. for big-cart benchmarks).
+        """
+        self._httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = StoreState(users if users is not None else default_users(), catalog_size)
+        self._httpd.latency_ms = latency_ms
+        self._httpd.verbose = verbose
+        self._thread: threading.Thread | None = None
+
+    @property
+    def state(self) -> StoreState:
+        return self._httpd.state
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve in a background daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,417 @@
+// GroceryMate stand-in client.
+// Renders /, /auth, /store, /product/<id> and /checkout with the markup the
+// page objects in pages/ and playwright_py/pages/ rely on.
+(function () {
+  "use strict";
+
+  var TOKEN_KEY = "token";
+  var USERNAME_KEY = "username";
+  var AGE_KEY = "ageVerified";
+  var REVIEW_MAX = 500;
+  var root = document.getElementById("root");
+
+  // --- helpers ---------------------------------------------------------
+  function el(tag, attrs) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) {
+      var value = attrs[key];
+      if (value === null || value === undefined || value === false) return;
+      if (key === "text") node.textContent = value;
+      else if (key.indexOf("on") === 0) node.addEventListener(key.slice(2), value);
+      else node.setAttribute(key, value === true ? "" : value);
+    });
+    for (var i = 2; i < arguments.length; i++) {
+      var child = arguments[i];
+      if (child === null || child === undefined) continue;
+      node.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+    }
+    return node;
+  }
+
+  function euro(value) {
+    return "€" + Number(value).toFixed(2);
+  }
+
+  function token() {
+    return window.localStorage.getItem(TOKEN_KEY);
+  }
+
+  function api(method, path, body) {
+    var headers = { "Content-Type": "application/json" };
+    if (token()) headers.Authorization = "Bearer " + token();
+    return fetch("/api" + path, {
+      method: method,
+      headers: headers,
+      credentials: "same-origin",
+      body: body === undefined ? undefined : JSON.stringify(body)
+    }).then(function (res) {
+      return res.json().catch(function () { return {}; }).then(function (data) {
+        return { ok: res.ok, status: res.status, data: data };
+      });
+    });
+  }
+
+  function toast(text, type) {
+    var node = el("div", { "class": "toast toast-" + (type || "info"), role: "status", text: text });
+    document.getElementById("toasts").appendChild(node);
+    setTimeout(function () { node.remove(); }, 3000);
+  }
+
+  function forgetSession() {
+    window.localStorage.removeItem(TOKEN_KEY);
+    window.localStorage.removeItem(USERNAME_KEY);
+  }
+
+  function redirectToLogin() {
+    forgetSession();
+    window.location.replace("/auth");
+  }
+
+  function render() {
+    while (root.firstChild) root.removeChild(root.firstChild);
+    for (var i = 0; i < arguments.length; i++) root.appendChild(arguments[i]);
+  }
+
+  // --- home ------------------------------------------------------------
+  function renderHome() {
+    render(
+      el("h1", { text: "Fresh groceries, delivered" }),
+      el("p", { text: "Welcome to GroceryMate." }),
+      el("a", { href: "/store", "class": "btn-shop-now", text: "Shop now" })
+    );
+  }
+
+  // --- auth ------------------------------------------------------------
+  function renderAuth() {
+    var error = el("p", { "class": "auth-error", hidden: true });
+    var email = el("input", { id: "email", type: "email", placeholder: "Email address", autocomplete: "username" });
+    var password = el("input", { id: "password", type: "password", placeholder: "Password", autocomplete: "current-password" });
+    var form = el("form", { "class": "auth-form", novalidate: true },
+      el("h2", { text: "Login" }),
+      el("label", { "for": "email", text: "Email" }), email,
+      el("label", { "for": "password", text: "Password" }), password,
+      el("button", { type: "submit", "class": "submit-btn", text: "Login" }),
+      error
+    );
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      api("POST", "/auth/login", { email: email.value, password: password.value }).then(function (res) {
+        if (!res.ok) {
+          error.textContent = res.data.error || "Invalid email or password";
+          error.hidden = false;
+          return;
+        }
+        window.localStorage.setItem(TOKEN_KEY, res.data.token);
+        window.localStorage.setItem(USERNAME_KEY, res.data.username);
+        window.location.href = "/";
+      });
+    });
+    render(form);
+  }
+
+  // --- store -----------------------------------------------------------
+  function ageFrom(dob) {
+    var match = /^(\d{2})-(\d{2})-(\d{4})$/.exec(dob.trim());
+    if (!match) return null;
+    var born = new Date(Number(match[3]), Number(match[2]) - 1, Number(match[1]));
+    var now = new Date();
+    var age = now.getFullYear() - born.getFullYear();
+    var beforeBirthday = now.getMonth() < born.getMonth() ||
+      (now.getMonth() === born.getMonth() && now.getDate() < born.getDate());
+    return beforeBirthday ? age - 1 : age;
+  }
+
+  function ageModal() {
+    var input = el("input", { type: "text", placeholder: "DD-MM-YYYY", "class": "dob-input" });
+    var modal = el("div", { "class": "modal", role: "dialog" },
+      el("div", { "class": "modal-content" },
+        el("h3", { text: "Age verification" }),
+        el("p", { text: "Please enter your date of birth to continue." }),
+        input,
+        el("button", {
+          type: "button", "class": "btn-confirm", text: "Confirm", onclick: function () {
+            var value = input.value;
+            if (!value.trim()) { toast("Please enter your birth date", "warning"); return; }
+            var age = ageFrom(value);
+            if (age === null) { toast("Please enter your birth date", "warning"); return; }
+            if (age < 18) { toast("You are underage", "error"); return; }
+            window.localStorage.setItem(AGE_KEY, "true");
+            modal.remove();
+            toast("You are of age", "success");
+          }
+        })
+      )
+    );
+    return modal;
+  }
+
+  function priceBlock(product) {
+    if (product.discountPrice) {
+      return el("p", { "class": "price-block" },
+        el("span", { "class": "discount-price", text: euro(product.discountPrice) }), " ",
+        el("span", { "class": "old-price", text: euro(product.price) }));
+    }
+    return el("p", { "class": "price", text: euro(product.price) });
+  }
+
+  function addToCartControls(productId) {
+    var qty = el("input", { type: "number", min: "1", value: "1", "class": "quantity", name: "quantity_" + productId });
+    var button = el("button", {
+      type: "button", "class": "btn-cart", text: "Add to cart", onclick: function () {
+        if (!token()) { window.location.href = "/auth"; return; }
+        api("POST", "/cart", { productId: productId, quantity: parseInt(qty.value, 10) || 1 }).then(function (res) {
+          if (res.status === 401) { redirectToLogin(); return; }
+          if (res.ok) toast("Product added to cart", "success");
+          else toast(res.data.error || "Could not add to cart", "error");
+        });
+      }
+    });
+    return el("div", { "class": "cart-controls" }, qty, button);
+  }
+
+  function productCard(product) {
+    return el("div", { "class": "product-card", "data-product-id": product.id },
+      el("a", { href: "/product/" + product.id, "class": "product-link" },
+        el("img", { src: "/static/product.svg", alt: product.name, width: "240", height: "180" }),
+        el("h5", { "class": "product-name", text: product.name })
+      ),
+      priceBlock(product),
+      addToCartControls(product.id)
+    );
+  }
+
+  function renderStore() {
+    var grid = el("div", { "class": "product-grid" });
+    render(el("h2", { text: "Shop" }), grid);
+    // The modal is in the DOM before DOMContentLoaded, like the live site.
+    if (window.localStorage.getItem(AGE_KEY) !== "true") document.body.appendChild(ageModal());
+    api("GET", "/products").then(function (res) {
+      (res.data.products || []).forEach(function (product) { grid.appendChild(productCard(product)); });
+    });
+  }
+
+  // --- product ---------------------------------------------------------
+  function averageStars(average) {
+    var stars = [];
+    for (var i = 1; i <= 5; i++) {
+      if (average >= i) {
+        stars.push(el("span", { "class": "star full", text: "★" }));
+      } else if (average > i - 1) {
+        var percent = Math.round((average - (i - 1)) * 100);
+        stars.push(el("span", { "class": "star partial" },
+          el("span", { "class": "filled", style: "width: " + percent + "%;", text: "★" }), "☆"));
+      } else {
+        stars.push(el("span", { "class": "star empty", text: "☆" }));
+      }
+    }
+    return el.apply(null, ["div", { "class": "custom-rating average-rating" }].concat(stars));
+  }
+
+  function reviewBlock(review, productId, refresh) {
+    var stars = [];
+    for (var i = 1; i <= 5; i++) {
+      stars.push(el("span", { "class": i <= review.rating ? "star-filled" : "star-empty", text: i <= review.rating ? "★" : "☆" }));
+    }
+    var header = el("div", { "class": "comment-header" },
+      el("strong", { "class": "author review-username", text: review.author }), " ",
+      el("span", { "class": "small", text: "(" + review.rating + ")" }), " ",
+      el("span", { "class": "review-date", text: review.createdAt })
+    );
+    if (review.mine) {
+      var menu = el("div", { "class": "review-menu", hidden: true },
+        el("button", {
+          type: "button", "class": "delete-review", text: "Delete", onclick: function () {
+            if (!window.confirm("Are you sure you want to delete your review?")) return;
+            api("DELETE", "/products/" + productId + "/reviews/me").then(function (res) {
+              if (res.ok) refresh();
+              else toast(res.data.error || "Could not delete review", "error");
+            });
+          }
+        })
+      );
+      header.appendChild(el("span", {
+        "class": "menu-icon", role: "button", "aria-label": "Review actions", text: "⋯",
+        onclick: function () { menu.hidden = !menu.hidden; }
+      }));
+      header.appendChild(menu);
+    }
+    return el("div", { "class": "review-block review-container comment", "data-review-id": review.id },
+      header,
+      el.apply(null, ["div", { "class": "custom-rating" }].concat(stars)),
+      el("div", { "class": "review-body text review-comment", text: review.text || "" })
+    );
+  }
+
+  function reviewForm(productId, onCreated) {
+    var rating = 0;
+    var stars = [];
+    var starRow = el("div", { "class": "interactive-rating" });
+    for (var i = 1; i <= 5; i++) {
+      (function (value) {
+        var star = el("span", {
+          "class": "star", "data-value": String(value), role: "button", text: "★",
+          onclick: function () {
+            rating = value;
+            stars.forEach(function (s, index) { s.classList.toggle("selected", index < value); });
+          }
+        });
+        stars.push(star);
+        starRow.appendChild(star);
+      })(i);
+    }
+    var counter = el("p", { "class": "char-count", text: "0/" + REVIEW_MAX });
+    var limitWarning = el("p", { "class": "error-message", hidden: true, text: "You cannot tell us more about this product" });
+    var formError = el("p", { "class": "review-error", hidden: true });
+    var textarea = el("textarea", {
+      "class": "new-review-form-control", maxlength: String(REVIEW_MAX), rows: "4",
+      placeholder: "Tell us more about this product", oninput: function () {
+        counter.textContent = textarea.value.length + "/" + REVIEW_MAX;
+        limitWarning.hidden = textarea.value.length < REVIEW_MAX;
+      }
+    });
+    // Like the live site, Send stays enabled at the character limit.
+    var send = el("button", {
+      type: "button", "class": "new-review-btn-send", text: "Send", onclick: function () {
+        if (!rating) {
+          formError.textContent = "Please select a star rating";
+          formError.hidden = false;
+          return;
+        }
+        api("POST", "/products/" + productId + "/reviews", { rating: rating, text: textarea.value }).then(function (res) {
+          if (res.ok) { onCreated(res.data); return; }
+          formError.textContent = res.data.error || "Could not send review";
+          formError.hidden = false;
+        });
+      }
+    });
+    return el("div", { "class": "new-review-form" }, starRow, textarea, counter, limitWarning, formError, send);
+  }
+
+  function renderProduct(productId) {
+    function load() {
+      api("GET", "/products/" + productId).then(function (res) {
+        if (res.status === 404) { render(el("h2", { text: "Product not found" })); return; }
+        var product = res.data.product;
+        var viewer = res.data.viewer;
+        var reviews = res.data.reviews;
+        var list = el("div", { "class": "review-list" });
+        var countText = el("p", { "class": "reviews", text: "(" + product.reviewCount + ")" });
+        var summary = el("div", { "class": "rating-summary" }, averageStars(product.average), countText);
+
+        var formArea;
+        if (!viewer.loggedIn) {
+          formArea = el("p", { "class": "review-hint", text: "Log in to leave a review." });
+        } else if (viewer.reviewed) {
+          formArea = el("p", { "class": "review-restriction", text: "You have already reviewed this product" });
+        } else if (!viewer.purchased) {
+          formArea = el("p", { "class": "review-hint", text: "Only customers who bought this product can review it." });
+        } else {
+          formArea = reviewForm(productId, function (created) {
+            // Show the new review straight away from the response, then lock the form.
+            list.insertBefore(reviewBlock(created.review, productId, load), list.firstChild);
+            summary.replaceChild(averageStars(created.average), summary.firstChild);
+            countText.textContent = "(" + created.reviewCount + ")";
+            formArea.replaceWith(el("p", { "class": "review-restriction", text: "You have already reviewed this product" }));
+          });
+        }
+
+        reviews.forEach(function (review) { list.appendChild(reviewBlock(review, productId, load)); });
+        render(
+          el("div", { "class": "product-detail" },
+            el("img", { src: "/static/product.svg", alt: product.name, width: "360", height: "270" }),
+            el("h2", { "class": "product-title", text: product.name }),
+            priceBlock(product),
+            summary,
+            addToCartControls(product.id)
+          ),
+          el("section", { "class": "review-section" }, el("h3", { text: "Reviews" }), formArea, list)
+        );
+      });
+    }
+    load();
+  }
+
+  // --- checkout --------------------------------------------------------
+  var CHECKOUT_FIELDS = [
+    ["street", "Street"], ["city", "City"], ["postalCode", "Postal code"], ["cardNumber", "Card number"],
+    ["nameOnCard", "Name on card"], ["expiration", "Expiration (MM/YYYY)"], ["cvv", "CVV"]
+  ];
+
+  function summaryRow(label, value) {
+    return el("div", { "class": "summary-row" }, el("h5", { text: label }), el("h5", { text: value }));
+  }
+
+  function renderCheckout() {
+    if (!token()) { redirectToLogin(); return; }
+    var form = el("form", { "class": "checkout-form", novalidate: true });
+    var inputs = {};
+    CHECKOUT_FIELDS.forEach(function (field) {
+      inputs[field[0]] = el("input", { id: field[0], name: field[0], type: "text" });
+      form.appendChild(el("label", { "for": field[0], text: field[1] }));
+      form.appendChild(inputs[field[0]]);
+    });
+    form.appendChild(el("button", { type: "submit", "class": "btn-buy", text: "Buy now" }));
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var body = {};
+      Object.keys(inputs).forEach(function (name) { body[name] = inputs[name].value; });
+      api("POST", "/orders", body).then(function (res) {
+        if (res.ok) { window.location.href = "/"; return; }
+        toast(res.data.error || "Order failed", "error");
+      });
+    });
+
+    var cartArea = el("div", { "class": "cart" });
+
+    function show(cart) {
+      while (cartArea.firstChild) cartArea.removeChild(cartArea.firstChild);
+      if (!cart.items.length) {
+        cartArea.appendChild(el("p", { "class": "cart-empty-text", text: "Your cart is empty" }));
+      }
+      cart.items.forEach(function (item) {
+        cartArea.appendChild(el("div", { "class": "cart-item", "data-product-id": item.productId },
+          el("span", { "class": "cart-item-name", text: item.name }),
+          el("button", { type: "button", "class": "minus", text: "−", onclick: function () { update(item, item.quantity - 1); } }),
+          el("span", { "class": "cart-qty", text: String(item.quantity) }),
+          el("button", { type: "button", "class": "plus", text: "+", onclick: function () { update(item, item.quantity + 1); } }),
+          el("span", { "class": "cart-line-total", text: euro(item.unitPrice * item.quantity) }),
+          el("a", {
+            href: "#", "class": "remove-icon", title: "Remove", text: "×", onclick: function (event) {
+              event.preventDefault();
+              api("DELETE", "/cart/" + item.productId).then(handle);
+            }
+          })
+        ));
+      });
+      cartArea.appendChild(el("div", { "class": "cart-summary" },
+        summaryRow("Subtotal:", euro(cart.subtotal)),
+        summaryRow("Shipment:", euro(cart.shipment)),
+        summaryRow("Total:", euro(cart.total))
+      ));
+    }
+
+    function handle(res) {
+      if (res.status === 401) { redirectToLogin(); return; }
+      if (res.ok) show(res.data);
+    }
+
+    function update(item, quantity) {
+      api("PUT", "/cart/" + item.productId, { quantity: quantity }).then(handle);
+    }
+
+    render(el("h2", { text: "Checkout" }), cartArea, form);
+    api("GET", "/cart").then(handle);
+  }
+
+  // --- router ----------------------------------------------------------
+  var path = window.location.pathname;
+  var authLink = document.querySelector(".auth-link");
+  if (token() && authLink) authLink.textContent = window.localStorage.getItem(USERNAME_KEY) || "Account";
+
+  var productMatch = /^\/product\/([^/]+)\/?$/.exec(path);
+  if (path === "/auth") renderAuth();
+  else if (path === "/store") renderStore();
+  else if (productMatch) renderProduct(decodeURIComponent(productMatch[1]));
+  else if (path === "/checkout") renderCheckout();
+  else renderHome();
+})();
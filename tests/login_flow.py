@@ -14,4 +14,5 @@ def test_login(driver, config):
     LoginPage(driver).login(
         email=config["email"],
         password=config["password"],
+        use_cache=False,
     )
@@ -3,6 +3,7 @@ from pages.login_page import LoginPage
 from pages.shop_page import ShopPage
 
 
+@pytest.mark.age_gate  # The real DOB modal: no pre-seeded age-gate state
 @pytest.mark.usefixtures("driver", "config")
 class TestAgeVerification:
 
@@ -12,7 +13,7 @@ class TestAgeVerification:
         """
         login = LoginPage(driver)
         login.load()
-        login.login(config["email"], config["password"])
+        login.login(config["email"], config["password"], use_cache=False)  # Cached sessions carry the age state
 
         shop = ShopPage(driver)
         shop.load()
@@ -26,7 +27,7 @@ class TestAgeVerification:
         """
         login = LoginPage(driver)
         login.load()
-        login.login(config["email"], config["password"])
+        login.login(config["email"], config["password"], use_cache=False)  # Cached sessions carry the age state
 
         shop = ShopPage(driver)
         shop.load()
@@ -40,7 +41,7 @@ class TestAgeVerification:
         """
         login = LoginPage(driver)
         login.load()
-        login.login(config["email"], config["password"])
+        login.login(config["email"], config["password"], use_cache=False)  # Cached sessions carry the age state
 
         shop = ShopPage(driver)
         shop.load()
@@ -0,0 +1,23 @@
+from pages.shop_page import ShopPage
+from utils.catalog_crawler import check_invariants, crawl_catalog
+from utils.settings import get_int, get_setting
+
+
+def test_catalog_invariants(driver, browser_pool, record_property):
+    """
+    Crawl every product on the store page concurrently ([crawl] workers
+    browsers at once), save the ratings/prices dataset to [crawl] output and
+    check catalog-wide invariants, e.g. displayed average == mean of the
+    visible reviews, on every product.
+    """
+    shop_page = ShopPage(driver)
+    shop_page.open_store()
+    products = shop_page.get_product_catalog()
+    assert products, "No product cards found on the store page"
+
+    data = crawl_catalog(browser_pool, products, workers=get_int("crawl", "workers", 4))
+    path = data.write(get_setting("crawl", "output", "test-results/catalog.csv"))
+    record_property("catalog_dataset", str(path))
+
+    violations = check_invariants(data)
+    assert not violations, f"{len(violations)} catalog invariant violation(s):\n  " + "\n  ".join(violations)
@@ -0,0 +1,31 @@
+from pages.shop_page import ShopPage
+from utils.settings import BASE_URL
+from utils.toast_recorder import ToastRecorder
+
+# Appends a <div> with class arguments[0] (none when null) and text arguments[1]
+_ADD_DIV_JS = """
+var div = document.createElement("div");
+if (arguments[0]) div.className = arguments[0];
+div.textContent = arguments[1];
+document.body.appendChild(div);
+"""
+
+
+def test_toast_recorder_logs_selector_and_xpath_toasts(driver):
+    """
+    Toasts are recorded whether they carry the toast markup (TOAST_SELECTOR)
+    or are only known to the page object by their text (ShopPage._TOAST);
+    other elements and toasts shown before the mark are not.
+    """
+    driver.get(BASE_URL)
+    recorder = ToastRecorder(driver)
+    recorder.record_xpath(ShopPage._TOAST[1])
+
+    driver.execute_script(_ADD_DIV_JS, "Toastify__toast", "Shown before the mark")
+    mark = recorder.mark()
+    driver.execute_script(_ADD_DIV_JS, "Toastify__toast Toastify__toast--success", "Review saved")
+    driver.execute_script(_ADD_DIV_JS, None, "You are of age")
+    driver.execute_script(_ADD_DIV_JS, None, "Not a toast")
+
+    texts = [toast["text"] for toast in recorder.since(mark)]
+    assert texts == ["Review saved", "You are of age"], f"Unexpected toast log: {texts}"
@@ -0,0 +1,127 @@
+import configparser
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.file_lock import FileLock
+from utils.settings import CONFIG_FILE, get_float, get_setting, load_config
+
+
+@dataclass(frozen=True)
+class Account:
+    """A GroceryMate login the suite may use."""
+
+    username: str
+    email: str
+    password: str
+
+    def as_config(self) -> dict[str, str]:
+        """Shape expected by tests: config['username'], config['email'], config['password']."""
+        return {"username": self.username, "email": self.email, "password": self.password}
+
+
+def load_accounts() -> list[Account]:
+    """
+    Collect test accounts: the [auth] account first, then every entry of
+    [accounts] (`<username> = <email> <password>`), then any entries in the
+    GROCERYMATE_ACCOUNTS env var (`username:email:password`, ';'-separated).
+    """
+    parser = load_config()
+    accounts = []
+    if parser.has_section("auth"):
+        auth = parser["auth"]
+        accounts.append(Account(auth.get("username", "User"), auth["email"], auth["password"]))
+    # Usernames are compared exactly (review authors), so keep the keys' case
+    accounts_parser = configparser.ConfigParser(interpolation=None)
+    accounts_parser.optionxform = str
+    accounts_parser.read(CONFIG_FILE)
+    if accounts_parser.has_section("accounts"):
+        for username, value in accounts_parser.items("accounts"):
+            if username in accounts_parser.defaults() or not value.strip():
+                continue
+            email, password = value.split(None, 1)
+            accounts.append(Account(username, email, password.strip()))
+    for entry in filter(None, os.getenv("GROCERYMATE_ACCOUNTS", "").split(";")):
+        username, email, password = entry.strip().split(":", 2)
+        accounts.append(Account(username, email, password))
+
+    unique = {}
+    for account in accounts:
+        unique.setdefault(account.email.lower(), account)
+    return list(unique.values())
+
+
+def worker_index() -> int:
+    """Index of the current pytest-xdist worker (gw0 -> 0), or 0 when running serially."""
+    match = re.search(r"(\d+)$", os.getenv("PYTEST_XDIST_WORKER", ""))
+    return int(match.group(1)) if match else 0
+
+
+class AccountLease:
+    """Exclusive hold on one account, backed by a file lock; release() gives it back."""
+
+    def __init__(self, account: Account, lock: FileLock):
+        self.account = account
+        self._lock = lock
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> Account:
+        return self.account
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class AccountLeaseManager:
+    """
+    Hands out accounts so that no two tests (in any worker process) use the
+    same account's cart and reviews at the same time.
+
+    Each xdist worker prefers "its own" account (worker index modulo pool size),
+    so with at least as many accounts as workers nobody ever waits. Each account
+    has a FileLock, which the OS releases when a worker dies.
+    """
+
+    def __init__(self, accounts: list[Account], lock_dir: str | Path, timeout: float = 300):
+        if not accounts:
+            raise ValueError("No test accounts configured ([auth] / [accounts] in config.ini)")
+        self._accounts = accounts
+        self._lock_dir = Path(lock_dir)
+        self._timeout = timeout
+
+    @classmethod
+    def from_settings(cls) -> "AccountLeaseManager":
+        return cls(
+            load_accounts(),
+            lock_dir=get_setting("accounts_pool", "lock_dir", ".account-locks"),
+            timeout=get_float("accounts_pool", "lease_timeout", 300),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self._accounts)
+
+    def lease(self, preferred: int | None = None) -> AccountLease:
+        """Block until an account is free and return a lease on it."""
+        preferred = worker_index() if preferred is None else preferred
+        start = preferred % len(self._accounts)
+        order = self._accounts[start:] + self._accounts[:start]
+
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self._timeout
+        while True:
+            for account in order:
+                lease = self._try_lock(account)
+                if lease:
+                    return lease
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No test account became free within {self._timeout:.0f}s")
+            time.sleep(0.2)
+
+    def _try_lock(self, account: Account) -> AccountLease | None:
+        lock = FileLock(self._lock_dir / f"{account.email.lower()}.lock")
+        return AccountLease(account, lock) if lock.acquire() else None
@@ -0,0 +1,126 @@
+import json
+import time
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+
+from pages.shop_page import ShopPage
+from utils.quiescence import wait_until_settled
+from utils.session_cache import SessionStateCache
+from utils.settings import BASE_URL, get_bool, get_float, get_setting
+
+# Runs before any page script of every document in the tab: writes the age
+# gate's localStorage items for their origin unless the page already has them
+_SEED_JS = """
+(function (origins) {
+    var origin = origins[location.origin];
+    if (!origin) return;
+    try {
+        origin.forEach(function (item) {
+            if (window.localStorage.getItem(item.name) === null) window.localStorage.setItem(item.name, item.value);
+        });
+    } catch (e) {}
+})(%s);
+"""
+
+
+def diff_state(before: dict, after: dict) -> dict:
+    """
+    Cookies and localStorage items that are new or changed in `after`
+    (storage_state layout: {"cookies": [...], "origins": [{"origin", "localStorage"}]}).
+    """
+    known = {(c["name"], c.get("domain"), c.get("path")): c["value"] for c in before.get("cookies", [])}
+    cookies = [c for c in after.get("cookies", [])
+               if known.get((c["name"], c.get("domain"), c.get("path"))) != c["value"]]
+    stored = {(o["origin"], i["name"]): i["value"] for o in before.get("origins", []) for i in o.get("localStorage", [])}
+    origins = []
+    for origin in after.get("origins", []):
+        items = [i for i in origin.get("localStorage", []) if stored.get((origin["origin"], i["name"])) != i["value"]]
+        if items:
+            origins.append({"origin": origin["origin"], "localStorage": items})
+    return {"cookies": cookies, "origins": origins}
+
+
+class AgeGateState:
+    """
+    Client state the age-verification modal leaves behind after a valid DOB
+    (cookies and localStorage, in storage_state layout), captured once and
+    cached on disk for `ttl_seconds` so new sessions skip the modal.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float):
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+
+    @classmethod
+    def from_settings(cls) -> "AgeGateState | None":
+        """Build from [age_gate] in config.ini, or None when pre-seeding is off."""
+        if not get_bool("age_gate", "preseed", True):
+            return None
+        return cls(
+            path=get_setting("age_gate", "state_file", ".auth-state/age-gate.json"),
+            ttl_seconds=get_float("age_gate", "ttl_hours", 24) * 3600,
+        )
+
+    def load(self) -> dict | None:
+        """The cached state for the current base URL, or None if missing or expired."""
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("base_url") != BASE_URL or data.get("expires_at", 0) <= time.time():
+            return None
+        return data["state"]
+
+    def save(self, state: dict) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"base_url": BASE_URL, "expires_at": time.time() + self._ttl, "state": state}),
+                       encoding="utf-8")
+        tmp.replace(self._path)
+
+    def get(self, capture) -> dict:
+        """The cached state, or `capture()` (-> state) saved for the next sessions."""
+        state = self.load()
+        if state is None:
+            state = capture()
+            self.save(state)
+        return state
+
+    # — Selenium adapters —
+    @staticmethod
+    def capture_selenium(driver, dob: str) -> dict:
+        """
+        Open /store, pass the modal with `dob` and return what it wrote.
+        Empty when the store shows no modal (nothing to seed).
+        """
+        shop_page = ShopPage(driver)
+        shop_page.open_store()
+        wait_until_settled(driver)  # The modal may mount after the first cards
+        if not shop_page.age_gate_shown():
+            return {"cookies": [], "origins": []}
+        before = SessionStateCache.capture_selenium(driver)
+        shop_page.handle_age_verification(dob)
+        try:
+            shop_page.wait_for_products()
+        except TimeoutException:
+            raise RuntimeError(f"The age gate did not let DOB {dob!r} into the store") from None
+        return diff_state(before, SessionStateCache.capture_selenium(driver))
+
+    @staticmethod
+    def apply_selenium(driver, state: dict) -> None:
+        """
+        Seed the state into the driver's current tab before its next
+        navigation: cookies via CDP, localStorage via a script that runs
+        ahead of the app on every new document.
+        """
+        for cookie in state.get("cookies", []):
+            params = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in cookie}
+            if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+                params["sameSite"] = cookie["sameSite"]
+            if cookie.get("expires", -1) > 0:
+                params["expires"] = cookie["expires"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
+        origins = {o["origin"]: o["localStorage"] for o in state.get("origins", []) if o.get("localStorage")}
+        if origins:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _SEED_JS % json.dumps(origins)})
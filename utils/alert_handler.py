@@ -1,16 +1,23 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoAlertPresentException
 
-def accept_alert(driver, timeout=5):
+
+def accept_alert(driver) -> str | None:
     """
-    Wait for a JavaScript alert to appear and accept it.
+    Accept the native JavaScript dialog open right now, if any, and return its text.
+
+    One round trip, no waiting: with the dialog policy installed (see
+    utils/dialog_policy.py) dialogs are answered inside the page and this
+    finds nothing; it covers drivers without the policy.
 
     Args:
         driver: Selenium WebDriver instance
-        timeout: Max wait time for the alert
+    Returns:
+        The dialog's message, or None when no dialog was open.
     """
     try:
-        WebDriverWait(driver, timeout).until(EC.alert_is_present())
-        driver.switch_to.alert.accept()
-    except Exception as e:
-        print("⚠️ Alert not accepted:", str(e))
+        alert = driver.switch_to.alert
+        text = alert.text
+        alert.accept()
+        return text
+    except NoAlertPresentException:
+        return None
@@ -0,0 +1,212 @@
+import functools
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from urllib.parse import urlsplit
+
+from utils.settings import BASE_URL, get_float, get_int, get_setting
+
+
+def make_http_adapter() -> HTTPAdapter:
+    """
+    Build the keep-alive connection pool shared by every API session in a run.
+    Sized by [api] pool_connections / pool_maxsize in config.ini.
+    """
+    return HTTPAdapter(
+        pool_connections=get_int("api", "pool_connections", 4),
+        pool_maxsize=get_int("api", "pool_maxsize", 10),
+        max_retries=get_int("api", "max_retries", 1),
+    )
+
+
+def endpoint_pattern(endpoint_key: str) -> str:
+    """
+    Regex matching request URLs of the [api] endpoint `endpoint_key`, e.g.
+    my_review -> /api/products/[^/?]+/reviews/me (for expect_response()).
+    """
+    path = get_setting("api", "path", "/api").rstrip("/") + get_setting("api", endpoint_key)
+    return re.sub(r"\\\{\w+\\\}", "[^/?]+", re.escape(path)) + r"/?(?:\?|$)"
+
+
+class ApiError(Exception):
+    """A backend call failed, or answered with something the client cannot read."""
+
+
+def _api_call(method):
+    """Report any failure of a GroceryMateApi operation as ApiError (the original chained)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except (requests.RequestException, ValueError, KeyError) as e:
+            raise ApiError(f"{method.__name__} failed: {e}") from e
+    return wrapper
+
+
+class GroceryMateApi:
+    """
+    HTTP shortcut to the GroceryMate backend for test data setup. Every
+    operation raises ApiError when the backend call fails or its answer is
+    not what the [api] assumptions expect; callers fall back to the UI.
+
+    Talks to the same endpoints the web app calls (configured in the [api]
+    section of config.ini) using the browser's own session: cookies and the
+    auth token are copied from the bound WebDriver before each operation, and
+    cookies set by the backend are written back into the browser.
+    """
+
+    def __init__(self, driver=None, adapter: HTTPAdapter | None = None):
+        """
+        Args:
+            driver: Selenium WebDriver whose login session should be reused.
+            adapter: Shared connection pool from make_http_adapter().
+        """
+        self._driver = driver
+        self._base_url = BASE_URL + get_setting("api", "path", "/api").rstrip("/")
+        self._timeout = get_float("api", "timeout", 10)
+        self._session = requests.Session()
+        self._backend_cookies = RequestsCookieJar()
+        adapter = adapter or make_http_adapter()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the session (the shared adapter's connections stay open)."""
+        self._session.close()
+
+    # — browser session sharing —
+    def sync_from_browser(self) -> None:
+        """Copy cookies and the bearer token from the bound browser into the HTTP session."""
+        if self._driver is None:
+            return
+        for cookie in self._driver.get_cookies():
+            self._session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/"),
+            )
+        token = self._driver.execute_script(
+            "return window.localStorage.getItem(arguments[0]);",
+            get_setting("api", "token_storage_key", "token"),
+        )
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+
+    def sync_to_browser(self) -> None:
+        """Write cookies set by the backend during API calls back into the browser via CDP."""
+        if self._driver is None:
+            return
+        host = urlsplit(self._base_url).hostname
+        for cookie in self._backend_cookies:
+            self._driver.execute_cdp_cmd("Network.setCookie", {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain or host,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+            })
+        self._backend_cookies.clear()
+
+    # — low-level request helper —
+    def _request(self, method: str, endpoint_key: str, **kwargs) -> requests.Response:
+        """Send a request to the endpoint named `endpoint_key` in [api]."""
+        path = get_setting("api", endpoint_key).format(**kwargs.pop("path_params", {}))
+        response = self._session.request(method, f"{self._base_url}{path}", timeout=self._timeout, **kwargs)
+        self._backend_cookies.update(response.cookies)
+        return response
+
+    @staticmethod
+    def _json(response: requests.Response) -> dict:
+        response.raise_for_status()
+        payload = response.json() if response.content else {}
+        if not isinstance(payload, dict):
+            raise ValueError(f"Expected a JSON object from {response.url}, got {type(payload).__name__}")
+        return payload
+
+    # — catalog —
+    @_api_call
+    def list_products(self) -> list[dict]:
+        """Return the catalog as a list of product dicts ('id', 'name', 'price', ...)."""
+        self.sync_from_browser()
+        return self._json(self._request("GET", "products")).get("products", [])
+
+    # — cart —
+    @_api_call
+    def get_cart(self) -> list[dict]:
+        """Return the cart items as a list of {'productId', 'quantity'} dicts."""
+        self.sync_from_browser()
+        return self._json(self._request("GET", "cart")).get("items", [])
+
+    @_api_call
+    def add_to_cart(self, product_id: str, quantity: int = 1) -> dict:
+        """Add `quantity` units of a product to the cart."""
+        self.sync_from_browser()
+        payload = {"productId": str(product_id), "quantity": quantity}
+        result = self._json(self._request("POST", "cart", json=payload))
+        self.sync_to_browser()
+        return result
+
+    @_api_call
+    def clear_cart(self) -> int:
+        """
+        Empty the cart and return how many items were removed.
+
+        Uses the bulk DELETE on the cart endpoint; backends without it
+        (404/405) get one DELETE per item instead.
+        """
+        items = self.get_cart()
+        if not items:
+            return 0
+        response = self._request("DELETE", "cart")
+        if response.status_code in (404, 405):
+            for item in items:
+                response = self._request("DELETE", "cart_item", path_params={"product_id": item["productId"]})
+                self._json(response)
+            removed = len(items)
+        else:
+            removed = self._json(response).get("removed", len(items))
+        self.sync_to_browser()
+        return removed
+
+    # — orders —
+    @_api_call
+    def place_order(
+        self,
+        first: str = "Test",
+        last: str = "User",
+        address: str = "123 Test St",
+        city: str = "Testville",
+        zip_code: str = "10001",
+    ) -> dict:
+        """Place an order for the current cart with the same data CheckoutPage.buy() types in."""
+        self.sync_from_browser()
+        payload = {
+            "street": address,
+            "city": city,
+            "postalCode": zip_code,
+            "cardNumber": "4111111111111111",
+            "nameOnCard": f"{first} {last}",
+            "expiration": "12/2029",
+            "cvv": "123",
+        }
+        result = self._json(self._request("POST", "orders", json=payload))
+        self.sync_to_browser()
+        return result
+
+    @_api_call
+    def purchase(self, product_id: str, quantity: int = 1) -> dict:
+        """Satisfy the 'must have purchased' precondition: add to cart and place an order."""
+        self.add_to_cart(product_id, quantity)
+        return self.place_order()
+
+    # — reviews —
+    @_api_call
+    def delete_my_review(self, product_id: str) -> bool:
+        """Delete the logged-in user's review of a product. Returns False if there was none."""
+        self.sync_from_browser()
+        response = self._request("DELETE", "my_review", path_params={"product_id": product_id})
+        if response.status_code == 404:
+            return False
+        self._json(response)
+        return True
@@ -0,0 +1,191 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+class BrowserPool:
+    """
+    Session-wide pool of pre-launched WebDriver instances.
+
+    Instead of starting and quitting Chrome for every test, drivers are
+    handed out with acquire(), wiped with reset() and returned with release().
+    A driver is recycled (quit and replaced in the background) once it has
+    served `max_reuse` tests, fails a health check, or cannot be reset.
+    """
+
+    def __init__(self, factory, size: int = 1, max_reuse: int = 20,
+                 health_check: bool = True, origins: tuple[str, ...] = ()):
+        """
+        Args:
+            factory: Zero-argument callable that launches a new WebDriver.
+            size: Number of warm browsers kept idle in the pool.
+            max_reuse: Tests served by one browser before it is recycled.
+            health_check: Probe each browser before handing it out.
+            origins: Origins whose storage is always wiped on reset.
+        """
+        self._factory = factory
+        self._size = max(1, size)
+        self._max_reuse = max(1, max_reuse)
+        self._health_check = health_check
+        self._origins = set(origins)
+
+        self._lock = threading.Lock()
+        self._idle: deque = deque()
+        self._leased: set = set()
+        self._uses: dict = {}
+        self._clean: set = set()
+        self._pending: list[Future] = []
+        self._launcher = ThreadPoolExecutor(max_workers=self._size, thread_name_prefix="browser-pool")
+
+    # — lifecycle —
+    def start(self) -> None:
+        """Launch `size` browsers in parallel so the first tests start warm."""
+        for _ in range(self._size):
+            self._launch_in_background()
+        for future in list(self._pending):
+            future.result()
+
+    def shutdown(self) -> None:
+        """Quit every browser owned by the pool, idle or leased."""
+        self._launcher.shutdown(wait=True)
+        with self._lock:
+            drivers = list(self._idle) + list(self._leased)
+            self._idle.clear()
+            self._leased.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    # — leasing —
+    def acquire(self):
+        """Return a clean, healthy driver, launching one if none is warm."""
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+                pending = self._pending[0] if self._pending else None
+
+            if driver is None and pending is not None:
+                pending.result()  # A recycled browser is already on its way
+                continue
+            if driver is None:
+                driver = self._factory()
+                self._uses[driver] = 0
+                self._clean.add(driver)
+            elif self._health_check and not self.is_healthy(driver):
+                self._discard(driver)
+                continue
+
+            with self._lock:
+                self._leased.add(driver)
+            return driver
+
+    def reset(self, driver) -> bool:
+        """
+        Wipe all per-test browser state so the driver can be reused:
+          - Close every tab and continue in a fresh one (drops sessionStorage)
+          - Delete cookies and the HTTP cache
+          - Clear localStorage, IndexedDB, Cache Storage and service workers
+            for every origin the test visited
+        Returns False (and marks the driver for recycling) if anything fails.
+        """
+        self._clean.discard(driver)
+        try:
+            origins = set(self._origins)
+            old_handles = driver.window_handles
+            for handle in old_handles:
+                driver.switch_to.window(handle)
+                origin = self._origin_of(driver.current_url)
+                if origin:
+                    origins.add(origin)
+
+            driver.switch_to.new_window("tab")
+            fresh_handle = driver.current_window_handle
+            for handle in old_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(fresh_handle)
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in origins:
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+            driver.delete_all_cookies()
+        except WebDriverException:
+            return False
+
+        self._clean.add(driver)
+        return True
+
+    def release(self, driver) -> None:
+        """Return a driver to the pool, recycling it when worn out or broken."""
+        with self._lock:
+            self._leased.discard(driver)
+        self._uses[driver] = self._uses.get(driver, 0) + 1
+
+        if driver not in self._clean and not self.reset(driver):
+            self._discard(driver)
+            return
+        if self._uses[driver] >= self._max_reuse:
+            self._discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) + len(self._pending) < self._size:
+                self._idle.append(driver)
+                return
+        self._quit(driver)  # Overflow browser launched while the pool was empty
+
+    # — health —
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """Cheap liveness probe: the session answers and still has a window."""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    # — internal helpers —
+    @staticmethod
+    def _origin_of(url: str) -> str | None:
+        parts = urlsplit(url or "")
+        if parts.scheme in ("http", "https") and parts.netloc:
+            return f"{parts.scheme}://{parts.netloc}"
+        return None
+
+    def _discard(self, driver) -> None:
+        """Quit a driver and start a replacement so the pool stays warm."""
+        self._clean.discard(driver)
+        self._uses.pop(driver, None)
+        self._quit(driver)
+        with self._lock:
+            refill = len(self._idle) + len(self._pending) < self._size
+        if refill:
+            self._launch_in_background()
+
+    def _launch_in_background(self) -> None:
+        future = self._launcher.submit(self._factory)
+
+        def _done(f: Future) -> None:
+            with self._lock:
+                self._pending.remove(f)
+                if f.exception() is None:
+                    driver = f.result()
+                    self._uses[driver] = 0
+                    self._clean.add(driver)
+                    self._idle.append(driver)
+
+        with self._lock:
+            self._pending.append(future)
+        future.add_done_callback(_done)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
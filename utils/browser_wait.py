@@ -0,0 +1,234 @@
+import time
+
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.settings import get_bool
+from utils.wait_metrics import InstrumentedWait
+
+# Resolves once the compiled condition arguments[0] holds (or, with
+# arguments[2], stops holding), re-checking on DOM mutations (coalesced into
+# the next animation frame) and every 100ms for what mutations don't show
+# (URL, CSS). Gives up after arguments[1] ms with status "pending"; answers
+# "unsupported" when the condition cannot be evaluated in the page.
+_WAIT_JS = """
+var spec = arguments[0], budgetMs = arguments[1], negate = arguments[2], done = arguments[arguments.length - 1];
+var observer = null, interval = null, deadline = null, scheduled = false, finished = false;
+
+function findAll(by, value) {
+  switch (by) {
+    case "css selector": return Array.from(document.querySelectorAll(value));
+    case "id": return Array.from(document.querySelectorAll("#" + CSS.escape(value)));
+    case "name": return Array.from(document.querySelectorAll("[name=\\"" + CSS.escape(value) + "\\"]"));
+    case "class name": return Array.from(document.querySelectorAll("." + CSS.escape(value)));
+    case "tag name": return Array.from(document.getElementsByTagName(value));
+    case "link text":
+    case "partial link text":
+      return Array.from(document.querySelectorAll("a")).filter(function (a) {
+        var text = (a.innerText || "").trim();
+        return by === "link text" ? text === value : text.indexOf(value) !== -1;
+      });
+    case "xpath":
+      var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < result.snapshotLength; i++) {
+        if (result.snapshotItem(i).nodeType === 1) nodes.push(result.snapshotItem(i));
+      }
+      return nodes;
+  }
+  throw new Error("Unsupported locator strategy: " + by);
+}
+
+// Close to Selenium's is_displayed(): rendered boxes, not hidden by CSS or zero opacity
+function visible(el) {
+  if (!el.getClientRects().length) return false;
+  if (el.checkVisibility) return el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true});
+  var style = getComputedStyle(el);
+  return style.visibility !== "hidden" && style.opacity !== "0";
+}
+
+function enabled(el) {
+  return !el.disabled && !(el.matches && el.matches(":disabled"));
+}
+
+function evaluate(spec) {
+  var els, el;
+  switch (spec.op) {
+    case "present": return findAll(spec.by, spec.value)[0] || false;
+    case "all_present": els = findAll(spec.by, spec.value); return els.length ? els : false;
+    case "visible": el = findAll(spec.by, spec.value)[0]; return el && visible(el) ? el : false;
+    case "all_visible": els = findAll(spec.by, spec.value); return els.length && els.every(visible) ? els : false;
+    case "invisible": el = findAll(spec.by, spec.value)[0]; return !el ? true : visible(el) ? false : el;
+    case "clickable": el = findAll(spec.by, spec.value)[0]; return el && visible(el) && enabled(el) ? el : false;
+    case "text":
+      el = findAll(spec.by, spec.value)[0];
+      return !!el && (el.innerText || el.textContent || "").indexOf(spec.text) !== -1;
+    case "url_is": return location.href === spec.url;
+    case "url_contains": return location.href.indexOf(spec.url) !== -1;
+    case "url_matches": return new RegExp(spec.pattern).test(location.href);
+    case "any_of":
+      for (var i = 0; i < spec.conditions.length; i++) {
+        var value = evaluate(spec.conditions[i]);
+        if (value) return value;
+      }
+      return false;
+    case "all_of":
+      var values = [];
+      for (var j = 0; j < spec.conditions.length; j++) {
+        var part = evaluate(spec.conditions[j]);
+        if (!part) return false;
+        values.push(part);
+      }
+      return values;
+  }
+  throw new Error("Unsupported condition: " + spec.op);
+}
+
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(deadline);
+  done(result);
+}
+
+function check() {
+  scheduled = false;
+  if (finished) return;
+  var value;
+  try {
+    value = evaluate(spec);
+  } catch (e) {
+    finish({status: "unsupported", message: String(e)});
+    return;
+  }
+  if (negate ? !value : value) finish({status: "ok", value: value});
+}
+
+function schedule() {
+  if (scheduled) return;
+  scheduled = true;
+  var called = false;
+  function once() { if (!called) { called = true; check(); } }
+  requestAnimationFrame(once);
+  setTimeout(once, 50);  // rAF is paused in hidden tabs
+}
+
+check();
+if (!finished) {
+  observer = new MutationObserver(schedule);
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  interval = setInterval(schedule, 100);
+  deadline = setTimeout(function () { finish({status: "pending"}); }, budgetMs);
+}
+"""
+
+# Longest single in-page wait; a longer timeout takes several round trips
+# (kept under chromedriver's default 30s script timeout)
+_SLICE_SECONDS = 10
+
+_LOCATOR_OPS = {
+    "presence_of_element_located": "present",
+    "presence_of_all_elements_located": "all_present",
+    "visibility_of_element_located": "visible",
+    "visibility_of_all_elements_located": "all_visible",
+    "invisibility_of_element_located": "invisible",
+    "element_to_be_clickable": "clickable",
+    "text_to_be_present_in_element": "text",
+}
+_URL_OPS = {"url_to_be": ("url_is", "url"), "url_contains": ("url_contains", "url"),
+            "url_matches": ("url_matches", "pattern")}
+
+
+def compile_condition(condition) -> dict | None:
+    """
+    The in-page form of an expected_conditions condition, or None when it
+    has no browser-side equivalent (lambdas, WebElement targets, conditions
+    not listed in _LOCATOR_OPS / _URL_OPS / any_of / all_of).
+    """
+    qualname = getattr(condition, "__qualname__", "")
+    if getattr(condition, "__module__", None) != EC.__name__ or ".<locals>." not in qualname:
+        return None
+    factory = qualname.split(".<locals>")[0]
+    cells = dict(zip(condition.__code__.co_freevars, (c.cell_contents for c in condition.__closure__ or ())))
+
+    if factory in ("any_of", "all_of"):
+        parts = [compile_condition(c) for c in cells["expected_conditions"]]
+        return None if not parts or None in parts else {"op": factory, "conditions": parts}
+    if factory in _LOCATOR_OPS:
+        locator = cells.get("locator", cells.get("mark"))
+        if not (isinstance(locator, tuple) and len(locator) == 2):
+            return None
+        spec = {"op": _LOCATOR_OPS[factory], "by": locator[0], "value": locator[1]}
+        if factory == "text_to_be_present_in_element":
+            spec["text"] = cells["text_"]
+        return spec
+    if factory in _URL_OPS:
+        op, key = _URL_OPS[factory]
+        return {"op": op, key: cells[key]}
+    return None
+
+
+class BrowserWait(InstrumentedWait):
+    """
+    Drop-in InstrumentedWait that evaluates common expected conditions
+    inside the browser: presence, visibility, invisibility, clickability,
+    text, URL checks and any_of/all_of of those resolve in one
+    execute_async_script call the moment the DOM satisfies them, instead of
+    one or more round trips per 0.5s poll. Anything else (lambdas,
+    WebElement targets, ...) is polled as before. [waits] browser_side in
+    config.ini turns the in-browser path off.
+    """
+
+    def __init__(self, driver, timeout: float, poll_frequency: float = 0.5, ignored_exceptions=None):
+        super().__init__(driver, timeout, poll_frequency, ignored_exceptions)
+        self._in_browser = get_bool("waits", "browser_side", True)
+
+    def _until(self, kind: str, method, message: str, count):
+        spec = compile_condition(method) if self._in_browser else None
+        if spec is None:
+            return super()._until(kind, method, message, count)
+
+        deadline = time.monotonic() + self._timeout
+        found, value = self._until_in_browser(spec, kind == "until_not", message, count, deadline)
+        if found:
+            return value
+        # The page could not evaluate it: poll for whatever is left of the timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(message)
+        timeout, self._timeout = self._timeout, remaining
+        try:
+            return super()._until(kind, method, message, count)
+        finally:
+            self._timeout = timeout
+
+    def _until_in_browser(self, spec: dict, negate: bool, message: str, count,
+                          deadline: float) -> tuple[bool, object]:
+        """
+        (True, value) once the condition holds (value as WebDriverWait would
+        return it); (False, None) when the page cannot evaluate it.
+        Raises:
+            TimeoutException: the condition did not hold by `deadline` (time.monotonic()).
+        """
+        while True:
+            budget = min(max(deadline - time.monotonic(), 0), _SLICE_SECONDS)
+            count()
+            try:
+                result = self._driver.execute_async_script(_WAIT_JS, spec, int(budget * 1000), negate)
+            except JavascriptException as exc:
+                if "unloaded" not in str(exc):
+                    return False, None
+                result = {"status": "pending"}  # Navigated mid-wait: check again on the new document
+            except TimeoutException:
+                result = {"status": "pending"}  # Script timeout below the slice
+            except WebDriverException:
+                return False, None
+
+            if result["status"] == "ok":
+                return True, result["value"]
+            if result["status"] == "unsupported":
+                return False, None
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
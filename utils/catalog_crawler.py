@@ -0,0 +1,139 @@
+import csv
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.product_page import ProductPage
+from utils.browser_pool import BrowserPool
+
+COLUMNS = ("product_id", "name", "price", "average_rating", "review_count",
+           "visible_reviews", "visible_average", "error")
+_NUMERIC = {"price": float, "average_rating": float, "review_count": int,
+            "visible_reviews": int, "visible_average": float}
+
+
+class CatalogDataset:
+    """
+    Crawl result stored column by column (one list per column, one entry per
+    product), so invariants run over whole columns at once and the data
+    round-trips through CSV or Parquet.
+    """
+
+    def __init__(self, columns: dict[str, list] | None = None):
+        self.columns: dict[str, list] = {name: list((columns or {}).get(name, [])) for name in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.columns["product_id"])
+
+    def append(self, row: dict) -> None:
+        for name in COLUMNS:
+            self.columns[name].append(row.get(name))
+
+    def rows(self) -> list[dict]:
+        return [dict(zip(COLUMNS, values)) for values in zip(*self.columns.values())]
+
+    # — persistence —
+    def write(self, path: str | Path) -> Path:
+        """Write to `path`: Parquet for .parquet (needs pyarrow), CSV otherwise."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            pq.write_table(pa.table(self.columns), path)
+            return path
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(COLUMNS)
+            writer.writerows(zip(*self.columns.values()))
+        return path
+
+    @classmethod
+    def read(cls, path: str | Path) -> "CatalogDataset":
+        path = Path(path)
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            return cls(pq.read_table(path).to_pydict())
+        with path.open(newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+        columns = {}
+        for name in COLUMNS:
+            cast = _NUMERIC.get(name)
+            columns[name] = [cast(row[name]) if cast and row[name] != "" else (row[name] or None)
+                             for row in rows]
+        return cls(columns)
+
+
+def check_invariants(data: CatalogDataset, tolerance: float = 0.11) -> list[str]:
+    """
+    Catalog-wide checks, one pass per column pair; returns the violations:
+      - every product page could be read
+      - price is positive, average rating within 0..5
+      - displayed average equals the mean of the visible reviews
+      - review count equals the number of visible reviews
+    """
+    c = data.columns
+    ids = c["product_id"]
+    violations = []
+    violations += [f"{pid}: crawl failed ({error})" for pid, error in zip(ids, c["error"]) if error]
+    violations += [f"{pid}: price {price!r} is not positive"
+                   for pid, price, error in zip(ids, c["price"], c["error"])
+                   if not error and not (price and price > 0)]
+    violations += [f"{pid}: average rating {avg} outside 0..5"
+                   for pid, avg in zip(ids, c["average_rating"]) if avg is not None and not 0 <= avg <= 5]
+    violations += [f"{pid}: displayed average {avg} != mean of visible reviews {mean}"
+                   for pid, avg, mean in zip(ids, c["average_rating"], c["visible_average"])
+                   if avg is not None and mean is not None and not math.isclose(avg, mean, abs_tol=tolerance)]
+    violations += [f"{pid}: review count {count} != {visible} visible review(s)"
+                   for pid, count, visible in zip(ids, c["review_count"], c["visible_reviews"])
+                   if count is not None and visible is not None and count != visible]
+    return violations
+
+
+def crawl_catalog(pool: BrowserPool, products: list[dict], workers: int = 4) -> CatalogDataset:
+    """
+    Visit every product page concurrently and collect its ratings.
+
+    `products` are ShopPage.get_product_catalog() entries. At most `workers`
+    browsers from `pool` are used at once; each worker keeps its browser for
+    all the products it takes off the shared queue. A page that cannot be
+    read is recorded with its error instead of stopping the crawl.
+    """
+    queue = list(enumerate(products))
+    queue.reverse()
+    lock = threading.Lock()
+    rows: list[dict | None] = [None] * len(products)
+
+    def work() -> None:
+        driver = pool.acquire()
+        try:
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    index, product = queue.pop()
+                row = {"product_id": product["id"], "name": product["name"], "price": product["price"]}
+                try:
+                    page = ProductPage(driver)
+                    page.load(product["id"])
+                    row.update(page.get_rating_summary())
+                except (WebDriverException, ValueError) as exc:
+                    message = str(exc).strip().splitlines()
+                    row["error"] = f"{type(exc).__name__}: {message[0] if message else ''}"
+                rows[index] = row  # Keep store order, whatever order pages finish in
+        finally:
+            pool.release(driver)
+
+    count = min(workers, len(products))
+    if count:
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="crawler") as executor:
+            for future in [executor.submit(work) for _ in range(count)]:
+                future.result()
+
+    data = CatalogDataset()
+    for row in rows:
+        data.append(row)
+    return data
@@ -0,0 +1,134 @@
+import json
+import time
+from pathlib import Path
+
+from pages.shop_page import ShopPage
+from utils.api_client import ApiError
+from utils.file_lock import FileLock
+from utils.settings import BASE_URL, get_float, get_setting
+
+
+class CatalogIndex:
+    """
+    Product id -> {"id", "name", "price", "discount_price", "url"}, in store
+    order. Built once from the backend's product list (no page load at all),
+    or from a single /store load when the API is unavailable, and shared by
+    every test and xdist worker through a JSON file that expires after
+    `ttl_seconds`.
+    """
+
+    def __init__(self, products: list[dict]):
+        self.products = {p["id"]: p for p in products}
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __getitem__(self, product_id: str) -> dict:
+        return self.products[product_id]
+
+    def __iter__(self):
+        return iter(self.products.values())
+
+    def first(self) -> dict:
+        """The first product of the store page (what tests used to pick off the first card)."""
+        if not self.products:
+            raise LookupError("The product catalog is empty")
+        return next(iter(self.products.values()))
+
+    @staticmethod
+    def entry(product_id, name: str, price: float | None, discount_price: float | None = None) -> dict:
+        product_id = str(product_id)
+        return {"id": product_id, "name": name, "price": price, "discount_price": discount_price,
+                "url": f"{BASE_URL}/product/{product_id}"}
+
+
+class CatalogIndexCache:
+    """
+    On-disk CatalogIndex with a TTL. The first process to find the file
+    missing or expired takes a FileLock next to it and rebuilds it; the
+    others wait for the lock to go and read the result. The OS releases the
+    lock of a process that dies mid-build.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float, lock_timeout: float = 120):
+        self._path = Path(path)
+        self._lock = FileLock(self._path.with_suffix(".lock"))
+        self._ttl = ttl_seconds
+        self._lock_timeout = lock_timeout
+
+    @classmethod
+    def from_settings(cls) -> "CatalogIndexCache":
+        """Build the cache from [catalog_index] in config.ini."""
+        return cls(
+            path=get_setting("catalog_index", "file", ".catalog-index.json"),
+            ttl_seconds=get_float("catalog_index", "ttl_minutes", 30) * 60,
+        )
+
+    def _load(self) -> CatalogIndex | None:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("base_url") != BASE_URL or data.get("expires_at", 0) <= time.time():
+            return None
+        return CatalogIndex(data["products"])
+
+    def _save(self, index: CatalogIndex) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"base_url": BASE_URL, "expires_at": time.time() + self._ttl,
+                                   "products": list(index)}), encoding="utf-8")
+        tmp.replace(self._path)
+
+    def get(self, build) -> CatalogIndex:
+        """Return the cached index, calling `build()` (-> CatalogIndex) under the lock when it is stale."""
+        deadline = time.monotonic() + self._lock_timeout
+        while True:
+            index = self._load()
+            if index is not None:
+                return index
+            if self._lock.acquire():
+                try:
+                    index = self._load()  # Another process may have finished just before we locked
+                    if index is None:
+                        index = build()
+                        self._save(index)
+                    return index
+                finally:
+                    self._lock.release()
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self._lock.path} still held after {self._lock_timeout:.0f}s")
+            time.sleep(0.2)
+
+    def invalidate(self) -> None:
+        self._path.unlink(missing_ok=True)
+
+
+def index_from_api(api) -> CatalogIndex:
+    """Build the index from GroceryMateApi.list_products() (one HTTP request)."""
+    return CatalogIndex([
+        CatalogIndex.entry(p.get("id", p.get("_id")), p.get("name", ""), p.get("price"), p.get("discountPrice"))
+        for p in api.list_products()
+    ])
+
+
+def index_from_store(driver) -> CatalogIndex:
+    """Build the index from one /store load (card prices are the discounted ones when shown)."""
+    shop_page = ShopPage(driver)
+    shop_page.open_store()
+    return CatalogIndex([CatalogIndex.entry(p["id"], p["name"], p["price"]) for p in shop_page.get_product_catalog()])
+
+
+def build_catalog_index(api, browser_pool) -> CatalogIndex:
+    """The API listing when it answers with products, otherwise one store page load in a pooled browser."""
+    try:
+        index = index_from_api(api)
+        if len(index):
+            return index
+    except ApiError:
+        pass
+    driver = browser_pool.acquire()
+    try:
+        return index_from_store(driver)
+    finally:
+        browser_pool.release(driver)
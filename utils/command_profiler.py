@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def _bucket_labels() -> list[str]:
+    labels = [f"<={edge}ms" for edge in LATENCY_BUCKETS_MS]
+    return labels + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+
+
+class CommandProfiler:
+    """
+    Counts WebDriver HTTP commands (findElement, getElementText, executeScript,
+    executeCdpCommand, ...) per test and records their latencies.
+
+    attach() wraps the driver's RemoteConnection.execute, the single choke
+    point every Selenium command goes through, so pooled drivers are
+    instrumented once and keep reporting into whichever test is current.
+    """
+
+    def __init__(self):
+        self.current_test = ""
+        self.counts: dict[str, Counter] = defaultdict(Counter)
+        self.latencies: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+
+    def attach(self, driver) -> None:
+        """Instrument `driver` (idempotent)."""
+        executor = driver.command_executor
+        if getattr(executor, "_profiled", False):
+            return
+        execute = executor.execute
+
+        def profiled_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                self._record(command, (time.perf_counter() - start) * 1000)
+
+        executor.execute = profiled_execute
+        executor._profiled = True
+
+    def _record(self, command: str, elapsed_ms: float) -> None:
+        test = self.current_test or "<outside tests>"  # e.g. pool warm-up and health checks
+        self.counts[test][command] += 1
+        self.latencies[test][command].append(elapsed_ms)
+
+    def total(self, test: str) -> int:
+        return sum(self.counts.get(test, Counter()).values())
+
+    @staticmethod
+    def histogram(latencies: list[float]) -> dict[str, int]:
+        """Bucket latencies (ms) into LATENCY_BUCKETS_MS."""
+        buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for value in latencies:
+            buckets[bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+        return dict(zip(_bucket_labels(), buckets))
+
+    def summarize(self, tests: list[str]) -> dict:
+        """Command counts, time spent and latency histograms over `tests`."""
+        counts = Counter()
+        latencies = defaultdict(list)
+        for test in tests:
+            counts.update(self.counts.get(test, Counter()))
+            for command, values in self.latencies.get(test, {}).items():
+                latencies[command].extend(values)
+
+        all_latencies = [v for values in latencies.values() for v in values]
+        return {
+            "commands": sum(counts.values()),
+            "total_ms": round(sum(all_latencies), 1),
+            "by_command": {
+                command: {
+                    "count": count,
+                    "total_ms": round(sum(latencies[command]), 1),
+                    "max_ms": round(max(latencies[command]), 1),
+                }
+                for command, count in counts.most_common()
+            },
+            "histogram": self.histogram(all_latencies),
+        }
+
+    def report(self) -> dict:
+        """Session summary plus one summary per test."""
+        tests = [t for t in self.counts if self.counts[t]]
+        return {
+            "session": self.summarize(tests),
+            "tests": {test: self.summarize([test]) for test in tests},
+        }
+
+    def write(self, directory: str | Path = "test-results") -> Path:
+        """Write the report as JSON (one file per xdist worker) and return its path."""
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        path = Path(directory) / (f"command-profile-{worker}.json" if worker else "command-profile.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+
+# Process-wide profiler; conftest.py attaches drivers, sets current_test and enforces budgets
+command_profiler = CommandProfiler()
@@ -0,0 +1,143 @@
+import json
+import re
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.settings import get_setting
+
+# In-page policy: alert / confirm / prompt are answered synchronously per the
+# policy the moment the page opens them (no native dialog, nothing to poll
+# for) and logged with their answer and the time they opened (epoch ms).
+# Installed on every new document via CDP, and into the current one.
+_POLICY_JS = """
+(function (policy) {
+  if (window.__dialogLog) return;
+  var log = {dialogs: []};
+  window.__dialogLog = log;
+  var dismiss = policy.dismissPattern ? new RegExp(policy.dismissPattern, "i") : null;
+  var accept = policy.acceptPattern ? new RegExp(policy.acceptPattern, "i") : null;
+
+  function answer(type, message, defaultValue) {
+    message = message === undefined ? "" : String(message);
+    var accepted = dismiss && dismiss.test(message) ? false
+                 : accept && accept.test(message) ? true
+                 : policy.default === "accept";
+    log.dialogs.push({type: type, message: message, accepted: accepted,
+                      time: performance.timeOrigin + performance.now()});
+    if (type === "confirm") return accepted;
+    if (type === "prompt") {
+      if (!accepted) return null;
+      return policy.promptText !== null ? policy.promptText : (defaultValue === undefined ? "" : String(defaultValue));
+    }
+  }
+
+  window.alert = function (message) { answer("alert", message); };
+  window.confirm = function (message) { return answer("confirm", message); };
+  window.prompt = function (message, defaultValue) { return answer("prompt", message, defaultValue); };
+})(%s);
+"""
+
+# Current time (epoch ms) as a mark
+_MARK_JS = "return performance.timeOrigin + performance.now();"
+
+# Dialogs logged at or after the mark arguments[0] (empty without the policy)
+_SINCE_JS = """
+var since = arguments[0];
+var log = window.__dialogLog;
+return log ? log.dialogs.filter(function (dialog) { return dialog.time >= since; }) : [];
+"""
+
+
+@dataclass(frozen=True)
+class DialogPolicy:
+    """
+    How JavaScript dialogs are answered: messages matching `dismiss_pattern`
+    are dismissed, then those matching `accept_pattern` accepted, anything
+    else gets `default` ("accept" or "dismiss"). Patterns are
+    case-insensitive regexes (kept to the syntax JavaScript and Python share).
+    Accepted prompts return `prompt_text`, or their default value when None.
+    """
+
+    default: str = "accept"
+    accept_pattern: str = ""
+    dismiss_pattern: str = ""
+    prompt_text: str | None = None
+
+    @classmethod
+    def from_settings(cls) -> "DialogPolicy":
+        """Build from [dialogs] in config.ini."""
+        default = get_setting("dialogs", "default", "accept").lower()
+        if default not in ("accept", "dismiss"):
+            raise ValueError(f"[dialogs] default must be accept or dismiss, not {default!r}")
+        return cls(
+            default=default,
+            accept_pattern=get_setting("dialogs", "accept_pattern", ""),
+            dismiss_pattern=get_setting("dialogs", "dismiss_pattern", ""),
+            prompt_text=get_setting("dialogs", "prompt_text", None),
+        )
+
+    def accepts(self, message: str) -> bool:
+        """Whether a dialog showing `message` is accepted."""
+        if self.dismiss_pattern and re.search(self.dismiss_pattern, message, re.IGNORECASE):
+            return False
+        if self.accept_pattern and re.search(self.accept_pattern, message, re.IGNORECASE):
+            return True
+        return self.default == "accept"
+
+    def as_js(self) -> str:
+        return json.dumps({"default": self.default, "acceptPattern": self.accept_pattern,
+                           "dismissPattern": self.dismiss_pattern, "promptText": self.prompt_text})
+
+
+def apply_prompt_behavior(options) -> None:
+    """
+    Set the session's unhandledPromptBehavior from [dialogs]: the safety net
+    for native dialogs the in-page policy never sees (e.g. beforeunload),
+    which chromedriver then answers on the next command instead of failing it.
+    """
+    options.unhandled_prompt_behavior = get_setting("dialogs", "unhandled_prompt_behavior", "accept")
+
+
+class DialogHandler:
+    """
+    Answers JavaScript dialogs by policy inside the page and records them:
+
+        mark = dialogs.mark()         # before the action
+        ...click...
+        dialogs.since(mark)           # [{"type", "message", "accepted", "time"}]
+
+    Marks are epoch milliseconds, like ToastRecorder's. The log lives in the
+    document, so dialogs of a document that has been navigated away from
+    are gone.
+    """
+
+    def __init__(self, driver, policy: DialogPolicy | None = None):
+        self._driver = driver
+        self.policy = policy or DialogPolicy.from_settings()
+
+    def install(self) -> None:
+        """Apply the policy to every future document of the current tab and to the current one."""
+        try:
+            self._driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                         {"source": _POLICY_JS % self.policy.as_js()})
+        except WebDriverException:
+            pass  # Not a Chromium driver: only the current document is covered
+        self._driver.execute_script(_POLICY_JS % self.policy.as_js())
+
+    def mark(self) -> float:
+        """The current time as a mark."""
+        return self._driver.execute_script(_MARK_JS)
+
+    def since(self, mark: float = 0) -> list[dict]:
+        """Dialogs ({"type", "message", "accepted", "time"}) opened at or after `mark`, oldest first."""
+        return self._driver.execute_script(_SINCE_JS, mark)
+
+
+def dialog_handler(driver) -> DialogHandler:
+    """The shared DialogHandler of `driver`."""
+    handler = getattr(driver, "_dialog_handler", None)
+    if handler is None:
+        handler = DialogHandler(driver)
+        driver._dialog_handler = handler
+    return handler
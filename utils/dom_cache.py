@@ -0,0 +1,110 @@
+import copy
+import functools
+import threading
+from collections import defaultdict
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.quiescence import dom_version
+from utils.wait_metrics import attribute_waits_to_caller
+
+# Waits of find() / find_all() belong to the page object method that asked
+attribute_waits_to_caller(__name__)
+
+
+class DomCacheStats:
+    """Process-wide hit/miss counts of every DomCache, per test."""
+
+    def __init__(self):
+        self.current_test = ""
+        self.tests: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+        self._lock = threading.Lock()
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self.tests[self.current_test or "<outside tests>"][outcome] += 1
+
+    def totals(self) -> dict[str, int]:
+        return {outcome: sum(t[outcome] for t in self.tests.values()) for outcome in ("hits", "misses")}
+
+
+# Filled by every DomCache; conftest.py attributes it to tests and reports it
+dom_cache_stats = DomCacheStats()
+
+
+class DomCache:
+    """
+    Located elements and computed results of one driver, valid while the DOM
+    is unchanged.
+
+    Every lookup first reads the page's DOM version (document + mutation
+    counter kept by the quiescence probe, one round trip); any navigation or
+    mutation since the entry was stored discards the whole cache. A stale
+    element met while computing an entry drops the cache and recomputes once.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._version: str | None = None
+        self._entries: dict = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        """Cached value for `key`, or compute() stored under the current DOM version."""
+        version = dom_version(self._driver)
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+        if key in self._entries:
+            self.hits += 1
+            dom_cache_stats.count("hits")
+            return self._entries[key]
+
+        self.misses += 1
+        dom_cache_stats.count("misses")
+        try:
+            value = compute()
+        except StaleElementReferenceException:
+            # A cached element went stale under us: start over on the current DOM
+            self._entries.clear()
+            self._version = dom_version(self._driver)
+            value = compute()
+        self._entries[key] = value
+        return value
+
+    def find(self, wait, locator):
+        """The element at `locator` (waiting for its presence on a miss)."""
+        return self.get(("element", locator), lambda: wait.until(EC.presence_of_element_located(locator)))
+
+    def find_all(self, wait, locator) -> list:
+        """All elements at `locator` (waiting for at least one on a miss)."""
+        return self.get(("elements", locator), lambda: wait.until(EC.presence_of_all_elements_located(locator)))
+
+    def invalidate(self) -> None:
+        """Forget everything, e.g. after an action whose DOM effect the probe cannot see."""
+        self._entries.clear()
+        self._version = None
+
+
+def cached_read(method):
+    """
+    Serve a page-object reader from the object's `_cache` (a DomCache),
+    keyed by method and arguments. Callers get a copy, so mutating a
+    returned list never changes the cached one.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+        return copy.copy(self._cache.get(key, lambda: method(self, *args, **kwargs)))
+    return wrapper
+
+
+def dom_cache(driver) -> DomCache:
+    """The shared DomCache of `driver`."""
+    cache = getattr(driver, "_dom_cache", None)
+    if cache is None:
+        cache = DomCache(driver)
+        driver._dom_cache = cache
+    return cache
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+from selenium.webdriver.chrome.options import Options
+
+WINDOW_SIZE = "1366,820"  # Same viewport as the Playwright suite
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """Named set of Chrome command-line switches."""
+
+    name: str
+    description: str
+    arguments: tuple[str, ...]
+
+
+_CI_ARGUMENTS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--no-first-run",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    f"--window-size={WINDOW_SIZE}",
+)
+
+PROFILES: dict[str, LaunchProfile] = {profile.name: profile for profile in (
+    LaunchProfile("headed", "visible window, maximized (the suite's historical default)",
+                  ("--start-maximized",)),
+    LaunchProfile("headless", "new headless mode, fixed window size",
+                  ("--headless=new", f"--window-size={WINDOW_SIZE}")),
+    LaunchProfile("ci", "new headless, no sandbox, no extensions or background services",
+                  _CI_ARGUMENTS),
+    LaunchProfile("fixed-window", "visible window with a fixed size instead of maximizing",
+                  (f"--window-size={WINDOW_SIZE}",)),
+)}
+
+
+def get_profile(name: str) -> LaunchProfile:
+    """The profile called `name`; raises ValueError for unknown names."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown launch profile '{name}' (known: {', '.join(PROFILES)})") from None
+
+
+def chrome_options(name: str) -> Options:
+    """ChromeOptions with the switches of launch profile `name`."""
+    options = Options()
+    for argument in get_profile(name).arguments:
+        options.add_argument(argument)
+    return options
@@ -0,0 +1,189 @@
+"""
+Longest-processing-time-first scheduling for pytest-xdist.
+
+Every run records how long each test took (setup + call + teardown) into a
+local history file. With -n N, the next run sorts the tests by their
+recorded duration, hands them to the workers longest first (each test goes
+to the worker with the least predicted work), and lets idle workers steal
+queued tests from busy ones when the predictions were off. The terminal
+summary compares the predicted and the actual makespan (wall-clock time
+from the first dispatched test to the last finished one).
+
+Loaded from conftest.py (pytest_plugins); configured by [scheduler] in
+config.ini or --scheduler.
+"""
+
+import json
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from xdist.scheduler import WorkStealingScheduling
+
+from utils.settings import get_float, get_setting
+
+
+class DurationHistory:
+    """Per-test durations of earlier runs (exponential moving average), kept in a JSON file."""
+
+    def __init__(self, path: str | Path, smoothing: float = 0.5, default: float = 10.0):
+        self.path = Path(path)
+        self.smoothing = smoothing
+        self.default = default
+        try:
+            self.durations: dict[str, float] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.durations = {}
+        self._observed: dict[str, float] = defaultdict(float)
+
+    def observe(self, nodeid: str, seconds: float) -> None:
+        """Add one phase (setup, call or teardown) of a test in this run."""
+        self._observed[nodeid] += seconds
+
+    def predict(self, nodeid: str) -> float:
+        """Expected duration; tests without history get the median of the known ones."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return statistics.median(self.durations.values()) if self.durations else self.default
+
+    def save(self) -> None:
+        """Fold this run's durations into the history."""
+        for nodeid, seconds in self._observed.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                seconds if previous is None else self.smoothing * seconds + (1 - self.smoothing) * previous, 3
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.durations, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def plan_longest_first(durations: list[float], workers: int) -> list[list[int]]:
+    """
+    LPT assignment: indices sorted by duration, longest first, each given to
+    the worker with the least predicted work so far. Returns one index list
+    per worker, in the order the worker should run them.
+    """
+    plan: list[list[int]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for index in sorted(range(len(durations)), key=lambda i: durations[i], reverse=True):
+        worker = loads.index(min(loads))
+        plan[worker].append(index)
+        loads[worker] += durations[index]
+    return plan
+
+
+def predicted_makespan(durations: list[float], plan: list[list[int]]) -> float:
+    return max((sum(durations[i] for i in indices) for indices in plan), default=0.0)
+
+
+def collection_order_makespan(durations: list[float], workers: int) -> float:
+    """Predicted makespan when tests are taken in collection order by the first free worker."""
+    loads = [0.0] * workers
+    for duration in durations:
+        loads[loads.index(min(loads))] += duration
+    return max(loads, default=0.0)
+
+
+class LongestFirstScheduling(WorkStealingScheduling):
+    """
+    xdist's work-stealing scheduler with an LPT initial distribution.
+
+    The first distribution sends every worker its LPT share at once, longest
+    test first. Once a worker runs low, the inherited work stealing moves the
+    tail of the longest remaining queue (its shortest tests) to it.
+    """
+
+    def __init__(self, config, log, history: DurationHistory):
+        super().__init__(config, log)
+        self.history = history
+        self.predicted = 0.0
+        self.collection_order = 0.0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.busy: dict[str, float] = defaultdict(float)
+
+    def schedule(self) -> None:
+        if self.collection is not None or not self.collection_is_completed:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+        durations = [self.history.predict(nodeid) for nodeid in self.collection]
+        nodes = self.nodes
+        plan = plan_longest_first(durations, len(nodes))
+        self.predicted = predicted_makespan(durations, plan)
+        self.collection_order = collection_order_makespan(durations, len(nodes))
+
+        self.started = time.monotonic()
+        for node, indices in zip(nodes, plan):
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+        self.check_schedule()  # Nodes with less than two tests get nothing more: stealing starts right away
+
+    def mark_test_complete(self, node, item_index: int, duration: float | None = None) -> None:
+        self.busy[node.gateway.id] += duration or 0.0
+        self.finished = time.monotonic()
+        super().mark_test_complete(node, item_index, duration)
+
+
+class LptSchedulerPlugin:
+    """Records durations into the history and installs LongestFirstScheduling under xdist."""
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+        self.scheduler: LongestFirstScheduling | None = None
+
+    @pytest.hookimpl(tryfirst=True, optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace the load / worksteal distribution with LPT when --scheduler lpt."""
+        if config.getoption("--scheduler") != "lpt" or config.getvalue("dist") not in ("load", "worksteal"):
+            return None
+        self.scheduler = LongestFirstScheduling(config, log, self.history)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        """Every phase of every test (on the xdist controller: the reports of all workers)."""
+        self.history.observe(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        if not hasattr(session.config, "workerinput"):
+            self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.started is None:
+            return
+        actual = (scheduler.finished or scheduler.started) - scheduler.started
+        terminalreporter.section("lpt scheduler")
+        terminalreporter.write_line(
+            f"predicted makespan {scheduler.predicted:.1f}s "
+            f"(collection order would take {scheduler.collection_order:.1f}s), actual {actual:.1f}s"
+        )
+        for worker, busy in sorted(scheduler.busy.items()):
+            terminalreporter.write_line(f"  {worker}: busy {busy:.1f}s")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scheduler",
+        choices=("lpt", "xdist"),
+        default=get_setting("scheduler", "mode", "lpt"),
+        help="with -n: lpt = longest recorded tests first with work stealing; "
+             "xdist = the plain --dist mode (default: [scheduler] mode)",
+    )
+
+
+def pytest_configure(config):
+    history = DurationHistory(
+        get_setting("scheduler", "history_file", ".pytest-durations.json"),
+        smoothing=get_float("scheduler", "smoothing", 0.5),
+    )
+    config.pluginmanager.register(LptSchedulerPlugin(history), "lpt-scheduler")
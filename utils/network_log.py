@@ -0,0 +1,185 @@
+import base64
+import json
+import re
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from utils.wait_metrics import record_wait
+
+
+def enable_performance_logging(options) -> None:
+    """Ask chromedriver to record DevTools Network/Page events (read with network_log())."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+class NetworkLog:
+    """
+    DevTools Network.* events of one Chrome instance, read from its
+    performance log.
+
+    chromedriver drains that log on every read, so all consumers of a driver
+    share one NetworkLog (see network_log()) and look at `events`, which
+    accumulates until clear().
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self.events: list[dict] = []
+        self.available = True  # False once the driver turned out to have no performance log
+
+    def poll(self) -> list[dict]:
+        """Fetch events logged since the last poll (one round trip) and return them."""
+        try:
+            raw = self._driver.get_log("performance")
+        except WebDriverException:
+            self.available = False
+            return []  # Performance logging not enabled for this driver
+        new = []
+        for entry in raw:
+            message = json.loads(entry["message"])["message"]
+            if message["method"].startswith("Network."):
+                new.append(message)
+        self.events.extend(new)
+        return new
+
+    def clear(self) -> None:
+        """Drop everything logged so far."""
+        self.poll()
+        self.events.clear()
+
+    def _urls_by_request(self) -> dict[str, str]:
+        return {e["params"]["requestId"]: e["params"]["request"]["url"]
+                for e in self.events if e["method"] == "Network.requestWillBeSent"}
+
+    def blocked_urls(self) -> list[str]:
+        """URLs of requests the browser refused to send (Network.setBlockedURLs, CSP, ...)."""
+        urls = self._urls_by_request()
+        return [urls.get(e["params"]["requestId"], "")
+                for e in self.events
+                if e["method"] == "Network.loadingFailed" and e["params"].get("blockedReason")]
+
+    def transfer_sizes(self) -> dict[str, int]:
+        """Bytes on the wire per URL for requests that finished loading."""
+        urls = self._urls_by_request()
+        return {urls[e["params"]["requestId"]]: int(e["params"].get("encodedDataLength", 0))
+                for e in self.events
+                if e["method"] == "Network.loadingFinished" and e["params"]["requestId"] in urls}
+
+    def mark(self) -> int:
+        """Position in `events` after everything logged so far; wait_for_response() looks from here."""
+        self.poll()
+        return len(self.events)
+
+    def find_response(self, method: str, url_pattern: str, since: int = 0) -> dict | None:
+        """
+        The first finished request at or after `since` whose method matches
+        and whose URL matches `url_pattern` (regex search), as {"request_id",
+        "method", "url", "status", "failed"}; None while none has finished.
+        """
+        pattern = re.compile(url_pattern)
+        sent, statuses = {}, {}
+        for event in self.events[since:]:
+            params = event["params"]
+            if event["method"] == "Network.requestWillBeSent":
+                request = params["request"]
+                if request["method"] == method and pattern.search(request["url"]):
+                    sent[params["requestId"]] = request["url"]
+            elif event["method"] == "Network.responseReceived" and params["requestId"] in sent:
+                statuses[params["requestId"]] = params["response"]["status"]
+            elif event["method"] in ("Network.loadingFinished", "Network.loadingFailed") and params["requestId"] in sent:
+                return {"request_id": params["requestId"], "method": method, "url": sent[params["requestId"]],
+                        "status": statuses.get(params["requestId"]), "failed": event["method"] == "Network.loadingFailed"}
+        return None
+
+    def request_sent(self, method: str, url_pattern: str, since: int = 0) -> bool:
+        """Whether a matching request was sent at or after `since` (finished or not)."""
+        pattern = re.compile(url_pattern)
+        return any(e["method"] == "Network.requestWillBeSent" and e["params"]["request"]["method"] == method
+                   and pattern.search(e["params"]["request"]["url"]) for e in self.events[since:])
+
+    def wait_for_response(self, method: str, url_pattern: str, since: int = 0, timeout: float = 15,
+                          depth: int = 1, send_timeout: float | None = None) -> dict | None:
+        """
+        Block until a matching request started at or after `since` has
+        finished, and return it with its parsed JSON "body" (text if not
+        JSON, None if unavailable). Returns None when the driver has no
+        performance log to watch. With `send_timeout`, gives up early when
+        no matching request has even been sent by then. The wait is
+        recorded in wait_metrics against the caller `depth` frames up.
+        Raises:
+            TimeoutException: no such response within `timeout` seconds
+                (or no such request within `send_timeout`).
+        """
+        start = time.monotonic()
+        polls = 0
+        while True:
+            self.poll()
+            polls += 1
+            if not self.available:
+                return None
+            response = self.find_response(method, url_pattern, since)
+            if response is not None:
+                break
+            elapsed = time.monotonic() - start
+            unsent = (send_timeout is not None and elapsed > send_timeout
+                      and not self.request_sent(method, url_pattern, since))
+            if unsent or elapsed > timeout:
+                record_wait("until", "wait_for_response", f"{method} {url_pattern}", timeout,
+                            elapsed, polls, "timeout", depth)
+                if unsent:
+                    raise TimeoutException(f"No {method} request matching {url_pattern!r} within {send_timeout:.0f}s")
+                raise TimeoutException(f"No {method} response matching {url_pattern!r} within {timeout:.0f}s")
+            time.sleep(0.05)
+        record_wait("until", "wait_for_response", f"{method} {url_pattern}", timeout,
+                    time.monotonic() - start, polls, "ok", depth)
+
+        response["body"] = None
+        if not response["failed"]:
+            try:
+                raw = self._driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": response["request_id"]})
+                body = base64.b64decode(raw["body"]).decode("utf-8") if raw.get("base64Encoded") else raw["body"]
+                response["body"] = json.loads(body) if body else None
+            except WebDriverException:
+                pass  # Body already evicted (or none, e.g. 204)
+            except ValueError:
+                response["body"] = body
+        return response
+
+
+@contextmanager
+def expect_response(driver, method: str, url_pattern: str, timeout: float = 15, send_timeout: float = 3):
+    """
+    Wait for the backend response an action triggers, like Playwright's
+    page.expect_response():
+
+        with expect_response(driver, "POST", r"/reviews$") as response:
+            send_button.click()
+        response["body"]  # parsed JSON payload
+
+    The yielded dict is filled in when the block exits. Best-effort: it
+    stays empty when the driver has no performance log (see
+    enable_performance_logging()), when no matching request is sent within
+    `send_timeout` seconds (e.g. the app calls another path) or no response
+    arrives within `timeout`; the miss is logged and the action goes on.
+    """
+    log = network_log(driver)
+    since = log.mark()
+    response: dict = {}
+    yield response
+    try:
+        # Recorded against the page object: expect_response <- contextlib __exit__ <- caller
+        response.update(log.wait_for_response(method, url_pattern, since, timeout, depth=3,
+                                              send_timeout=send_timeout) or {})
+    except TimeoutException as e:
+        print(f" Response wait skipped: {e.msg}")
+
+
+def network_log(driver) -> NetworkLog:
+    """The shared NetworkLog of `driver`."""
+    log = getattr(driver, "_network_log", None)
+    if log is None:
+        log = NetworkLog(driver)
+        driver._network_log = log
+    return log
@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from pathlib import Path
+
+from utils.quiescence import wait_until_settled
+from utils.settings import get_bool, get_setting, load_config
+
+# Reads Navigation Timing, Resource Timing, LCP and CLS of the current document.
+# LCP/CLS observers use `buffered: true`, so entries from before this call count.
+_METRICS_JS = """
+var done = arguments[arguments.length - 1];
+var nav = performance.getEntriesByType("navigation")[0];
+var resources = performance.getEntriesByType("resource");
+var lcp = null, cls = 0;
+
+function observe(type, onEntry) {
+  try {
+    new PerformanceObserver(function (list) { list.getEntries().forEach(onEntry); })
+      .observe({type: type, buffered: true});
+  } catch (e) { /* entry type not supported by this browser */ }
+}
+observe("largest-contentful-paint", function (entry) { lcp = entry.renderTime || entry.startTime; });
+observe("layout-shift", function (entry) { if (!entry.hadRecentInput) cls += entry.value; });
+
+setTimeout(function () {  // buffered entries are delivered asynchronously
+  var bytes = resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); },
+                               nav ? nav.transferSize || 0 : 0);
+  done({
+    url: location.href,
+    ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    lcp_ms: lcp,
+    cls: cls,
+    transfer_kb: bytes / 1024,
+    requests: resources.length,
+    slowest_resources: resources.slice().sort(function (a, b) { return b.duration - a.duration; })
+      .slice(0, 5).map(function (r) {
+        return {name: r.name, type: r.initiatorType, duration_ms: r.duration, transfer_bytes: r.transferSize};
+      })
+  });
+}, 50);
+"""
+
+METRIC_NAMES = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "lcp_ms", "cls", "transfer_kb", "requests")
+
+
+def collect_page_metrics(driver) -> dict:
+    """Page-load metrics of the document currently shown in `driver` (one round trip)."""
+    metrics = driver.execute_async_script(_METRICS_JS)
+    for name in METRIC_NAMES:
+        if isinstance(metrics.get(name), float):
+            metrics[name] = round(metrics[name], 4 if name == "cls" else 1)
+    return metrics
+
+
+def load_budgets() -> dict[str, dict[str, float]]:
+    """[perf_budgets] as {page: {metric: limit}}, from `<page>.<metric> = <limit>` entries."""
+    parser = load_config()
+    budgets: dict[str, dict[str, float]] = {}
+    if parser.has_section("perf_budgets"):
+        for key, value in parser.items("perf_budgets"):
+            if key in parser.defaults():
+                continue
+            page, _, metric = key.partition(".")
+            budgets.setdefault(page, {})[metric] = float(value)
+    return budgets
+
+
+def check_budgets(page: str, metrics: dict, budgets: dict[str, dict[str, float]]) -> list[str]:
+    """Human-readable violations of `page`'s budgets (empty when within budget)."""
+    violations = []
+    for metric, limit in budgets.get(page, {}).items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page}.{metric} = {value:g} exceeds budget {limit:g}")
+    return violations
+
+
+class PerfRecorder:
+    """
+    Collects page-load metrics captured by the page objects' navigation
+    methods, checks them against [perf_budgets] and appends every capture
+    to the run-history file ([perf] history_file).
+    """
+
+    def __init__(self):
+        self.current_test = ""
+        self.captures: list[dict] = []
+        self._budgets: dict[str, dict[str, float]] | None = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """Collection switch: [perf] collect in config.ini or GROCERYMATE_PERF_COLLECT=1."""
+        return get_bool("perf", "collect", False)
+
+    @property
+    def budgets(self) -> dict[str, dict[str, float]]:
+        if self._budgets is None:
+            self._budgets = load_budgets()
+        return self._budgets
+
+    def capture(self, driver, page: str, measure: bool | None = None) -> dict | None:
+        """
+        Measure the page just navigated to, if collection is on (or `measure`
+        forces it). Waits for the UI to settle first so LCP and CLS cover the
+        rendered content. Returns the capture, or None when skipped.
+        """
+        if not (self.enabled() if measure is None else measure):
+            return None
+
+        wait_until_settled(driver)
+        metrics = collect_page_metrics(driver)
+        entry = {
+            "test": self.current_test,
+            "page": page,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "build": os.getenv("BUILD_ID") or os.getenv("GITHUB_SHA") or "",
+            "metrics": metrics,
+            "violations": check_budgets(page, metrics, self.budgets),
+        }
+        self.captures.append(entry)
+        self._append_history(entry)
+        return entry
+
+    def captures_for(self, test: str) -> list[dict]:
+        return [c for c in self.captures if c["test"] == test]
+
+    @staticmethod
+    def _append_history(entry: dict) -> None:
+        path = Path(get_setting("perf", "history_file", "test-results/perf-history.jsonl"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry) + "\n")
+
+
+# Process-wide recorder; page objects capture into it, conftest.py attaches and enforces
+perf_recorder = PerfRecorder()
@@ -0,0 +1,154 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from utils.settings import get_float, get_int
+from utils.wait_metrics import record_wait
+
+# In-page probe: counts in-flight fetch/XHR requests and records DOM mutations.
+# Installed on every new document via CDP, or lazily into the current one.
+_PROBE_JS = """
+(function (fromInitScript) {
+  if (window.__uiQuiet) return;
+  var state = {pending: 0, requests: {}, nextId: 0, mutations: 0,
+               lastMutation: performance.now(), fromInitScript: fromInitScript};
+  window.__uiQuiet = state;
+
+  function track(label) {
+    var id = ++state.nextId;
+    state.pending++;
+    state.requests[id] = label;
+    return function () {
+      if (id in state.requests) { delete state.requests[id]; state.pending--; }
+    };
+  }
+
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+      var url = typeof input === "string" ? input : (input && input.url) || String(input);
+      var method = (init && init.method) || (input && input.method) || "GET";
+      var done = track(String(method).toUpperCase() + " " + url);
+      return originalFetch.apply(this, arguments).then(
+        function (response) { done(); return response; },
+        function (error) { done(); throw error; });
+    };
+  }
+
+  var originalOpen = XMLHttpRequest.prototype.open;
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__uiQuietLabel = String(method).toUpperCase() + " " + url;
+    return originalOpen.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function () {
+    this.addEventListener("loadend", track(this.__uiQuietLabel || "XHR"));
+    return originalSend.apply(this, arguments);
+  };
+
+  new MutationObserver(function (records) {
+    state.mutations += records.length;
+    state.lastMutation = performance.now();
+  }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+})(%s);
+"""
+
+# Resolves once: document loaded, no request in flight, no mutation for
+# `quietMs`, and two animation frames passed (pending React commits flushed).
+_SETTLE_JS = _PROBE_JS % "false" + """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var state = window.__uiQuiet, start = performance.now();
+var needsInitScript = !state.fromInitScript && !state.initScriptRequested;
+state.initScriptRequested = true;
+
+function nextFrame(callback) {
+  var called = false;
+  function once() { if (!called) { called = true; callback(); } }
+  requestAnimationFrame(once);
+  setTimeout(once, 100);  // rAF is paused in hidden tabs
+}
+
+function quiet() {
+  return document.readyState === "complete" && state.pending === 0 &&
+         performance.now() - state.lastMutation >= quietMs;
+}
+
+function finish(settled) {
+  var requests = [];
+  for (var id in state.requests) requests.push(state.requests[id]);
+  done({settled: settled, waitedMs: performance.now() - start, needsInitScript: needsInitScript,
+        pending: requests, msSinceMutation: performance.now() - state.lastMutation,
+        mutations: state.mutations, readyState: document.readyState});
+}
+
+function check() {
+  if (quiet()) {
+    nextFrame(function () { nextFrame(function () {
+      if (quiet()) finish(true); else setTimeout(check, 16);
+    }); });
+  } else if (performance.now() - start >= timeoutMs) {
+    finish(false);
+  } else {
+    setTimeout(check, Math.min(50, quietMs));
+  }
+}
+check();
+"""
+
+# Identifies the current DOM state: document (time origin) + mutation count
+_DOM_VERSION_JS = _PROBE_JS % "false" + """
+return performance.timeOrigin + ":" + window.__uiQuiet.mutations;
+"""
+
+
+class UiNotSettledError(TimeoutException):
+    """The page kept changing (or kept loading) past the timeout; the message says why."""
+
+
+def install_quiescence_probe(driver) -> None:
+    """Register the probe for every future document in the current tab (Chrome/CDP only)."""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _PROBE_JS % "true"})
+    except WebDriverException:
+        pass  # Not a Chromium driver: the probe is injected lazily instead
+
+
+def wait_until_settled(driver, quiet_ms: int | None = None, timeout: float | None = None) -> float:
+    """
+    Block until the UI has settled, in a single WebDriver round trip.
+
+    Settled means: document fully loaded, no fetch/XHR in flight, no DOM
+    mutation for `quiet_ms`, and two animation frames rendered. Defaults come
+    from [quiescence] in config.ini.
+
+    Returns:
+        Seconds spent waiting.
+    Raises:
+        UiNotSettledError: with pending requests and mutation activity if the
+        page is still busy after `timeout` seconds.
+    """
+    quiet_ms = get_int("quiescence", "quiet_ms", 300) if quiet_ms is None else quiet_ms
+    timeout = get_float("quiescence", "timeout", 10) if timeout is None else timeout
+    if timeout > 25:
+        driver.set_script_timeout(timeout + 5)
+
+    result = driver.execute_async_script(_SETTLE_JS, quiet_ms, timeout * 1000)
+    if result.get("needsInitScript"):
+        install_quiescence_probe(driver)
+    record_wait("until", "wait_until_settled", f"quiet_ms={quiet_ms}", timeout, result["waitedMs"] / 1000,
+                polls=1, outcome="ok" if result["settled"] else "timeout")
+    if not result["settled"]:
+        pending = ", ".join(result["pending"]) or "none"
+        raise UiNotSettledError(
+            f"UI did not settle within {timeout:.1f}s: "
+            f"{len(result['pending'])} request(s) in flight [{pending}], "
+            f"last DOM mutation {result['msSinceMutation']:.0f}ms ago "
+            f"({result['mutations']} mutations total), readyState={result['readyState']}"
+        )
+    return result["waitedMs"] / 1000
+
+
+def dom_version(driver) -> str:
+    """
+    Cheap DOM version of the current document (one round trip): changes on
+    every navigation and every DOM mutation the probe observes.
+    """
+    return driver.execute_script(_DOM_VERSION_JS)
@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+
+from utils.network_log import NetworkLog
+
+_MEDIA_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "bmp",
+                     "mp4", "webm", "ogg", "mp3", "wav",
+                     "woff", "woff2", "ttf", "otf", "eot")
+
+# Images, video/audio and web fonts. .ico is left alone: the session cache
+# navigates to /favicon.ico to reach the site's localStorage.
+MEDIA_PATTERNS = tuple(p for ext in _MEDIA_EXTENSIONS for p in (f"*.{ext}", f"*.{ext}?*"))
+
+# Analytics, tag managers, trackers and hosted fonts
+THIRD_PARTY_PATTERNS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*doubleclick.net/*",
+    "*facebook.net/*",
+    "*facebook.com/tr*",
+    "*hotjar.com/*",
+    "*clarity.ms/*",
+    "*segment.com/*",
+    "*segment.io/*",
+    "*fonts.googleapis.com/*",
+    "*fonts.gstatic.com/*",
+)
+
+# Named profiles: URL patterns (CDP Network.setBlockedURLs wildcards) to abort
+PROFILES: dict[str, tuple[str, ...]] = {
+    "full": (),
+    "no-media": MEDIA_PATTERNS,
+    "minimal": MEDIA_PATTERNS + THIRD_PARTY_PATTERNS,
+}
+
+
+def profile_patterns(profile: str) -> tuple[str, ...]:
+    """URL patterns blocked by `profile`; raises ValueError for unknown names."""
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown resource blocking profile '{profile}' (known: {', '.join(PROFILES)})") from None
+
+
+def apply_blocking(driver, profile: str) -> None:
+    """Block the profile's URLs in the driver's current tab (CDP; 'full' unblocks everything)."""
+    patterns = profile_patterns(profile)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+class ResourceSizes:
+    """
+    Estimated transfer size per URL, so blocked requests can be priced.
+
+    Sizes are learned from requests that did load (any test, any run) and
+    kept in a JSON file. Unknown URLs are reported as unsized, never probed:
+    the blocked hosts are exactly the ones the run should not contact.
+    """
+
+    def __init__(self, path: str | Path = "test-results/resource-sizes.json"):
+        self._path = Path(path)
+        try:
+            self._sizes: dict[str, int] = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._sizes = {}
+
+    def learn(self, sizes: dict[str, int]) -> None:
+        self._sizes.update({url: size for url, size in sizes.items() if size > 0})
+
+    def estimate(self, url: str) -> int | None:
+        """Learned size in bytes, or None when the URL never loaded in a run."""
+        return self._sizes.get(url)
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(json.dumps(self._sizes, indent=0, sort_keys=True), encoding="utf-8")
+
+
+class BlockingStats:
+    """Per-test count and estimated bytes of blocked requests."""
+
+    def __init__(self):
+        self.sizes = ResourceSizes()
+        self.tests: dict[str, dict] = {}
+
+    def collect(self, test: str, profile: str, log: NetworkLog) -> dict:
+        """Read the driver's network log after a test and price what was blocked."""
+        log.poll()
+        self.sizes.learn(log.transfer_sizes())
+        blocked = log.blocked_urls()
+        estimates = [self.sizes.estimate(url) for url in blocked]
+        result = {
+            "profile": profile,
+            "blocked_requests": len(blocked),
+            "blocked_bytes": sum(size for size in estimates if size),
+            "unsized_requests": sum(size is None for size in estimates),
+        }
+        self.tests[test] = result
+        return result
+
+    def totals(self) -> dict:
+        return {
+            "blocked_requests": sum(t["blocked_requests"] for t in self.tests.values()),
+            "blocked_bytes": sum(t["blocked_bytes"] for t in self.tests.values()),
+        }
+
+
+# Process-wide stats; conftest.py fills it per test and reports the savings
+blocking_stats = BlockingStats()
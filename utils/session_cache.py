@@ -0,0 +1,75 @@
+from urllib.parse import urlsplit
+
+from shared.state_cache import StateCache
+from utils.settings import get_bool, get_float, get_setting
+
+
+class SessionStateCache(StateCache):
+    """
+    Disk cache of authenticated browser state (cookies and localStorage), one
+    JSON file per account (shared/state_cache.py), plus the Selenium side:
+    configured from [session_cache], captured from and applied to a driver.
+    """
+
+    @classmethod
+    def from_settings(cls) -> "SessionStateCache | None":
+        """Build the cache from [session_cache] in config.ini, or None if disabled."""
+        if not get_bool("session_cache", "enabled", True):
+            return None
+        return cls(
+            directory=get_setting("session_cache", "directory", ".auth-state"),
+            ttl_seconds=get_float("session_cache", "ttl_minutes", 60) * 60,
+        )
+
+    # — Selenium adapters —
+    @staticmethod
+    def capture_selenium(driver) -> dict:
+        """Snapshot cookies and the current origin's localStorage from a live driver."""
+        cookies = [
+            {
+                "name": c["name"],
+                "value": c["value"],
+                "domain": c.get("domain", ""),
+                "path": c.get("path", "/"),
+                "expires": c.get("expiry", -1),
+                "httpOnly": c.get("httpOnly", False),
+                "secure": c.get("secure", False),
+                "sameSite": c.get("sameSite", "Lax"),
+            }
+            for c in driver.get_cookies()
+        ]
+        parts = urlsplit(driver.current_url)
+        local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        return {
+            "cookies": cookies,
+            "origins": [
+                {
+                    "origin": f"{parts.scheme}://{parts.netloc}",
+                    "localStorage": [{"name": k, "value": v} for k, v in local_storage.items()],
+                }
+            ],
+        }
+
+    @staticmethod
+    def apply_selenium(driver, state: dict) -> None:
+        """
+        Inject cached cookies (via CDP, no navigation needed) and localStorage
+        (via a lightweight same-origin document, before the app boots).
+        """
+        for cookie in state.get("cookies", []):
+            params = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly")
+                      if k in cookie}
+            if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+                params["sameSite"] = cookie["sameSite"]
+            if cookie.get("expires", -1) > 0:
+                params["expires"] = cookie["expires"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
+
+        for origin in state.get("origins", []):
+            if not origin.get("localStorage"):
+                continue
+            driver.get(f"{origin['origin']}/favicon.ico")
+            driver.execute_script(
+                "for (const item of arguments[0]) { window.localStorage.setItem(item.name, item.value); }",
+                origin["localStorage"],
+            )
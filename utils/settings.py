@@ -0,0 +1,55 @@
+import configparser
+import os
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+CONFIG_FILE = Path(__file__).resolve().parent.parent / "config.ini"
+
+
+@lru_cache(maxsize=1)
+def load_config() -> configparser.ConfigParser:
+    """Read config.ini from the repository root once per process."""
+    parser = configparser.ConfigParser()
+    parser.read(CONFIG_FILE)
+    return parser
+
+
+def get_setting(section: str, key: str, fallback: str | None = None) -> str | None:
+    """
+    Return a setting from config.ini, overridable by environment.
+
+    The environment variable name is GROCERYMATE_<SECTION>_<KEY> in upper case,
+    e.g. GROCERYMATE_BROWSER_POOL_SIZE for [browser] pool_size.
+    """
+    env_name = f"GROCERYMATE_{section}_{key}".upper()
+    if env_name in os.environ:
+        return os.environ[env_name]
+    return load_config().get(section, key, fallback=fallback)
+
+
+def get_int(section: str, key: str, fallback: int) -> int:
+    """Integer variant of get_setting."""
+    return int(get_setting(section, key, str(fallback)))
+
+
+def get_float(section: str, key: str, fallback: float) -> float:
+    """Float variant of get_setting."""
+    return float(get_setting(section, key, str(fallback)))
+
+
+def get_bool(section: str, key: str, fallback: bool) -> bool:
+    """Boolean variant of get_setting (accepts 1/0, true/false, yes/no, on/off)."""
+    raw = get_setting(section, key, None)
+    if raw is None:
+        return fallback
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Site under test; every page object builds its URLs from this
+BASE_URL = get_setting("app", "base_url", "https://grocerymate.masterschool.com").rstrip("/")
+
+
+def is_local_base_url() -> bool:
+    """True when BASE_URL points at this machine (e.g. the bundled stand-in)."""
+    return urlsplit(BASE_URL).hostname in ("127.0.0.1", "localhost", "::1")
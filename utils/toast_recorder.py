@@ -0,0 +1,169 @@
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.quiescence import wait_until_settled
+
+# Toast containers of the app (react-toastify) and of the stand-in
+TOAST_SELECTOR = ".Toastify__toast, .toast, [role='alert']"
+
+# In-page recorder: every toast that enters the DOM is logged once with its
+# type and the time it appeared (epoch ms); text rendered after insertion
+# updates the entry, and entries outlive the toast's removal. Toasts are
+# elements matching the CSS selector or one of the page objects' XPaths
+# (re-evaluated once per mutation batch; xpaths added later are merged in).
+# Installed on every new document via CDP, or lazily into the current one.
+_RECORDER_JS = """
+(function (fromInitScript, selector, xpaths) {
+  var log = window.__toastLog;
+  if (log) {
+    xpaths.forEach(function (xpath) {
+      if (log.xpaths.indexOf(xpath) === -1) log.xpaths.push(xpath);
+    });
+    log.scan();
+    return;
+  }
+  log = {toasts: [], fromInitScript: fromInitScript, xpaths: xpaths.slice()};
+  window.__toastLog = log;
+  var entries = new WeakMap();
+
+  function now() { return performance.timeOrigin + performance.now(); }
+
+  function typeOf(node) {
+    var match = /(?:^|\\s)(?:toast-|Toastify__toast--)([\\w-]+)/.exec(node.className || "");
+    return match ? match[1] : (node.getAttribute("role") || "");
+  }
+
+  function note(node) {
+    var text = (node.innerText || node.textContent || "").trim();
+    var entry = entries.get(node);
+    if (!entry) {
+      entry = {text: text, type: typeOf(node), time: now()};
+      entries.set(node, entry);
+      log.toasts.push(entry);
+    } else if (text) {
+      entry.text = text;
+    }
+  }
+
+  function inToast(node) {
+    var element = node.nodeType === 1 ? node : node.parentElement;
+    var toast = element && element.closest(selector);
+    if (toast) note(toast);
+    return toast;
+  }
+
+  function added(node) {
+    if (inToast(node) || node.nodeType !== 1) return;
+    node.querySelectorAll(selector).forEach(note);
+  }
+
+  // XPath matches inside a CSS-matched toast count as that toast
+  log.scan = function () {
+    if (!document.documentElement) return;
+    log.xpaths.forEach(function (xpath) {
+      var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        if (node.nodeType === 1) note(node.closest(selector) || node);
+      }
+    });
+  };
+
+  if (document.documentElement) added(document.documentElement);
+  log.scan();
+  new MutationObserver(function (records) {
+    records.forEach(function (record) {
+      inToast(record.target);
+      record.addedNodes.forEach(added);
+    });
+    log.scan();
+  }).observe(document, {subtree: true, childList: true, characterData: true});
+})(%s, %s, %s);
+"""
+
+# Current time (epoch ms) as a mark; installs the recorder first if needed
+_MARK_JS = _RECORDER_JS % ("false", "arguments[0]", "arguments[1]") + """
+var log = window.__toastLog;
+var needsInitScript = !log.fromInitScript && !log.initScriptRequested;
+log.initScriptRequested = true;
+return {mark: performance.timeOrigin + performance.now(), needsInitScript: needsInitScript};
+"""
+
+# Toasts logged at or after the mark arguments[2]
+_SINCE_JS = _RECORDER_JS % ("false", "arguments[0]", "arguments[1]") + """
+var since = arguments[2];
+return window.__toastLog.toasts.filter(function (toast) { return toast.time >= since; });
+"""
+
+
+class ToastRecorder:
+    """
+    Answers "which toasts appeared since action X" from an in-page log
+    instead of polling for a toast until a timeout:
+
+        mark = recorder.mark()        # before the action
+        ...click...
+        recorder.since(mark)          # once the UI has settled
+
+    Marks are epoch milliseconds, so a log recorded on the document the
+    action navigated to still counts (the recorder is registered for every
+    new document of the tab after the first mark). Besides TOAST_SELECTOR,
+    elements matching the XPaths page objects register (record_xpath) are
+    logged, so toasts the page object knows by their text are seen whatever
+    their markup.
+    """
+
+    def __init__(self, driver, selector: str = TOAST_SELECTOR):
+        self._driver = driver
+        self._selector = selector
+        self._xpaths: list[str] = []
+        self._installed = False
+
+    def record_xpath(self, xpath: str) -> None:
+        """Also log elements matching `xpath` as toasts."""
+        if xpath in self._xpaths:
+            return
+        self._xpaths.append(xpath)
+        if self._installed:
+            self.install()  # Merges the new XPath into the log of future documents
+
+    def install(self) -> None:
+        """Register the recorder for every future document in the current tab (Chrome/CDP only)."""
+        source = _RECORDER_JS % ("true", json.dumps(self._selector), json.dumps(self._xpaths))
+        try:
+            self._driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        except WebDriverException:
+            return  # Not a Chromium driver: only the current document is recorded
+        self._installed = True
+
+    def mark(self) -> float:
+        """Start recording (if not yet) and return the current time as a mark."""
+        result = self._driver.execute_script(_MARK_JS, self._selector, self._xpaths)
+        if result["needsInitScript"]:
+            self.install()
+        return result["mark"]
+
+    def since(self, mark: float, settle: bool = True) -> list[dict]:
+        """
+        Toasts ({"text", "type", "time"}) that appeared at or after `mark`,
+        oldest first. With `settle`, waits for the UI to settle first, so a
+        toast the action is still rendering is included.
+        """
+        if settle:
+            wait_until_settled(self._driver)
+        return self._driver.execute_script(_SINCE_JS, self._selector, self._xpaths, mark)
+
+    def shown_since(self, mark: float, expected_text: str, settle: bool = True) -> bool:
+        """Whether a toast containing `expected_text` (case-insensitive) appeared since `mark`."""
+        expected = expected_text.lower()
+        return any(expected in toast["text"].lower() for toast in self.since(mark, settle))
+
+
+def toast_recorder(driver) -> ToastRecorder:
+    """The shared ToastRecorder of `driver`."""
+    recorder = getattr(driver, "_toast_recorder", None)
+    if recorder is None:
+        recorder = ToastRecorder(driver)
+        driver._toast_recorder = recorder
+    return recorder
@@ -0,0 +1,199 @@
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+@dataclass
+class WaitRecord:
+    """One until/until_not call: where it came from, what it waited for and how it went."""
+
+    test: str
+    page: str
+    method: str
+    kind: str
+    condition: str
+    locator: str
+    timeout: float
+    elapsed: float
+    polls: int
+    outcome: str  # "ok", "timeout" or "error"
+
+
+def describe_condition(condition) -> tuple[str, str]:
+    """
+    Return (condition name, target) for an expected condition.
+
+    expected_conditions builds closures such as
+    presence_of_element_located.<locals>._predicate; the factory name is the
+    condition and the captured locator/url/text is the target.
+    """
+    qualname = getattr(condition, "__qualname__", type(condition).__name__)
+    if qualname.endswith("<lambda>") or ".<locals>." not in qualname:
+        name = qualname.rsplit(".", 1)[-1]  # Lambda or plain function
+    else:
+        name = qualname.split(".<locals>")[0]  # Factory that built the closure
+
+    cells = dict(zip(getattr(getattr(condition, "__code__", None), "co_freevars", ()),
+                     (c.cell_contents for c in (getattr(condition, "__closure__", None) or ()))))
+    if "expected_conditions" in cells:  # any_of / all_of / none_of
+        parts = [describe_condition(c) for c in cells["expected_conditions"]]
+        return f"{name}({', '.join(n for n, _ in parts)})", " | ".join(t for _, t in parts if t)
+    for key in ("locator", "mark", "element", "url", "title", "pattern", "text_"):
+        if key in cells:
+            target = cells[key]
+            if isinstance(target, WebElement):
+                return name, "<WebElement>"
+            if isinstance(target, tuple) and len(target) == 2:
+                return name, f"{target[0]}={target[1]}"
+            return name, str(target)
+    return name, ""
+
+
+class WaitMetrics:
+    """
+    Collects WaitRecords for the running test and the whole session, and
+    turns them into hottest-wait / timed-out-wait rankings.
+    """
+
+    def __init__(self):
+        self.current_test = ""
+        self.records: list[WaitRecord] = []
+
+    def record(self, record: WaitRecord) -> None:
+        self.records.append(record)
+
+    def records_for(self, test: str) -> list[WaitRecord]:
+        return [r for r in self.records if r.test == test]
+
+    @staticmethod
+    def summarize(records: list[WaitRecord], top: int = 10) -> dict:
+        """Totals plus waits grouped by call site, hottest (most total time) first."""
+        groups = defaultdict(list)
+        for r in records:
+            groups[(r.page, r.method, r.kind, r.condition, r.locator)].append(r)
+
+        hottest = []
+        for (page, method, kind, condition, locator), items in groups.items():
+            total = sum(r.elapsed for r in items)
+            hottest.append({
+                "page": page,
+                "method": method,
+                "kind": kind,
+                "condition": condition,
+                "locator": locator,
+                "calls": len(items),
+                "total_s": round(total, 3),
+                "mean_s": round(total / len(items), 3),
+                "max_s": round(max(r.elapsed for r in items), 3),
+                "polls": sum(r.polls for r in items),
+                "timeouts": sum(r.outcome == "timeout" for r in items),
+            })
+        hottest.sort(key=lambda g: g["total_s"], reverse=True)
+
+        return {
+            "waits": len(records),
+            "total_wait_s": round(sum(r.elapsed for r in records), 3),
+            "hottest": hottest[:top],
+            "timed_out": [asdict(r) for r in records if r.outcome == "timeout"],
+        }
+
+    def report(self, top: int = 10) -> dict:
+        """Session report: overall ranking plus one summary per test."""
+        tests = {}
+        for test in dict.fromkeys(r.test for r in self.records):
+            tests[test] = self.summarize(self.records_for(test), top)
+        return {"session": self.summarize(self.records, top), "tests": tests}
+
+    def write(self, directory: str | Path = "test-results") -> Path:
+        """Write the report as JSON (one file per xdist worker) and return its path."""
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        path = Path(directory) / (f"wait-metrics-{worker}.json" if worker else "wait-metrics.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+
+# Process-wide collector; conftest.py sets current_test and writes the report
+wait_metrics = WaitMetrics()
+
+
+# Modules whose waits are made on behalf of their caller (see attribute_waits_to_caller)
+_delegating_modules: set[str] = set()
+
+
+def attribute_waits_to_caller(module_name: str) -> None:
+    """Record waits made inside `module_name` against the code calling into it (e.g. DomCache lookups)."""
+    _delegating_modules.add(module_name)
+
+
+def _call_site(depth: int) -> tuple[str, str]:
+    """
+    (page object class, method) of the frame `depth` levels above the
+    caller, past any frames of modules registered with attribute_waits_to_caller.
+    """
+    frame = sys._getframe(depth + 1)
+    while frame.f_back is not None and frame.f_globals.get("__name__") in _delegating_modules:
+        frame = frame.f_back
+    owner = frame.f_locals.get("self")
+    page = type(owner).__name__ if owner is not None else frame.f_globals.get("__name__", "")
+    return page, frame.f_code.co_name
+
+
+def record_wait(kind: str, condition: str, locator: str, timeout: float, elapsed: float,
+                polls: int, outcome: str, depth: int = 1) -> None:
+    """Record a wait that does not go through InstrumentedWait (e.g. wait_until_settled)."""
+    page, method = _call_site(depth + 1)
+    wait_metrics.record(WaitRecord(wait_metrics.current_test, page, method, kind, condition,
+                                   locator, timeout, round(elapsed, 4), polls, outcome))
+
+
+class InstrumentedWait(WebDriverWait):
+    """
+    Drop-in WebDriverWait that records every until/until_not call in
+    wait_metrics: calling page object and method, condition, locator,
+    elapsed time, poll count and outcome.
+    """
+
+    def until(self, method, message: str = ""):
+        return self._timed("until", method, message)
+
+    def until_not(self, method, message: str = ""):
+        return self._timed("until_not", method, message)
+
+    def _timed(self, kind: str, method, message: str):
+        polls = 0
+
+        def count() -> None:
+            nonlocal polls
+            polls += 1
+
+        condition, locator = describe_condition(method)
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            result = self._until(kind, method, message, count)
+            outcome = "ok"
+            return result
+        except TimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            record_wait(kind, condition, locator, self._timeout, time.perf_counter() - start,
+                        polls, outcome, depth=2)
+
+    def _until(self, kind: str, method, message: str, count):
+        """Run the wait (WebDriverWait polling), calling count() once per evaluation of `method`."""
+
+        def counted(driver):
+            count()
+            return method(driver)
+
+        return getattr(super(), kind)(counted, message)